@@ -0,0 +1,83 @@
+# Per-instruction cost of the code generator.
+# Compiles the test programs to TAC once and then times gen_code on every
+# instruction, overall and per opcode. Point --src at an older checkout to
+# compare two versions of codegen.py.
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+PROGRAMS = os.path.join(ROOT, "tests", "**", "*.c")
+
+
+def load_programs(pattern):
+    from ccpy import CompileOptions, compile_source
+
+    programs = []
+    for path in sorted(glob.glob(pattern, recursive=True)):
+        with open(path, "r") as f:
+            text = f.read()
+        try:
+            result = compile_source(text, CompileOptions(codegen=False))
+        except Exception:
+            continue
+        if result.success:
+            programs.append(list(result.three_address_code.code_fields()))
+    return programs
+
+
+def run(programs, per_opcode):
+    from codegen import CodeGenerator
+
+    # gen_code rewrites the instruction lists, so every run gets fresh ones
+    programs = [
+        [(opcode, list(fields)) for opcode, fields in code] for code in programs
+    ]
+    clock = time.perf_counter
+    start = clock()
+    for code in programs:
+        codegen = CodeGenerator()
+        for opcode, fields in code:
+            if per_opcode is None:
+                codegen.gen_code(fields, opcode)
+            else:
+                before = clock()
+                codegen.gen_code(fields, opcode)
+                per_opcode.setdefault(opcode, []).append(clock() - before)
+    return clock() - start
+
+
+def main():
+    aparser = argparse.ArgumentParser()
+    aparser.add_argument(
+        "--src", help="Source directory to benchmark", default=os.path.join(ROOT, "src")
+    )
+    aparser.add_argument("-n", "--runs", type=int, help="Timed runs", default=5)
+    aparser.add_argument(
+        "programs", nargs="?", help="Glob of C programs", default=PROGRAMS
+    )
+    args = aparser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.src))
+    from three_address_code import Opcode
+
+    programs = load_programs(args.programs)
+    count = sum(len(code) for code in programs)
+    run(programs, None)
+    best = min(run(programs, None) for _ in range(args.runs))
+    print(f"{len(programs)} programs, {count} instructions")
+    print(f"codegen: {best * 1000:.1f} ms, {best / count * 1e6:.2f} us/instruction")
+
+    per_opcode = {}
+    run(programs, per_opcode)
+    print(f"{'opcode':<22}{'count':>7}{'us/instr':>10}")
+    for opcode, samples in sorted(per_opcode.items(), key=lambda t: -sum(t[1])):
+        mean = sum(samples) / len(samples)
+        print(f"{Opcode(opcode).name:<22}{len(samples):>7}{mean * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
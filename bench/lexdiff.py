@@ -0,0 +1,206 @@
+# Differential test of the fast lexer against the PLY lexer.
+# Lexes the test programs, inputs around the corner cases of the token rules
+# and --fuzz random inputs with both engines, and fails on the first input
+# where their tokens, errors or line counts differ. Point --src at another
+# checkout to test its lexer.py and fastlexer.py. --against compares both
+# engines with the PLY lexer of an older checkout instead, to check that a
+# change to the token rules keeps the tokens the same. Finally lexer.py is run
+# as a script with both engines on all the inputs, to check that they write
+# the same TSV and JSON Lines.
+
+import argparse
+import glob
+import importlib.util
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+PROGRAMS = os.path.join(ROOT, "test*", "**", "*.c")
+
+CASES = [
+    "",
+    "int main(){ return 0; }",
+    # macros match before identifiers, also as the start of a longer word
+    "NULL NULLx INT_MIN INT_MAXy UINT_MAX SHRT_MIN SHRT_MAX FLT_MIN FLT_MAX",
+    "CHAR_MIN CHAR_MAX MY_NULL _NULL bool true false TRUE FALSE sizeof",
+    # numbers
+    "0 00 07 08 09 0x 0x1F 0XaBg 1. .5 1.5 1.e5 1.5e 1.5e+ 1e-3 12.34.5 1..2",
+    "123abc 1e5f 0.0 .e5 ..5 3.14159E+10 0777 0x0",
+    # operators, longest first
+    "a<<=b>>=c<<d>>e<=f>=g==h!=i&&j||k&=l|=m^=n+=o-=p*=q/=r%=s",
+    "a+++b---c->d++=e--=f->g... ~!?:;,.[]{}()",
+    # comments
+    "a // line comment\nb /* block\ncomment */ c /**/ d /*/ e */ f",
+    "a /* unterminated\ncomment",
+    "a //",
+    "a /",
+    # characters
+    "'a' '\\n' '\\t' '\\0' '\\b' '\\\\' '\\'' '\\\"' '\\?' '\"'",
+    "'ab' '' '\\x' 'a\n'",
+    "x = 'a;\ny = 1;",
+    "x = '\\\ny = 1;",
+    "'",
+    # strings
+    '"abc" "a\\"b" "a\\\\" "\\n\\t\\0" "" "\'"',
+    '"bad \\q escape" x "ok"',
+    '"spans\nlines" y',
+    '"unmatched',
+    '"ends in backslash\\',
+    '"unmatched with an escaped\\\nnewline\n x',
+    # whitespace and illegal characters
+    "a\tb  c\n\n\nd\r\ne\x0cf\vg",
+    "@ # $ ` \\ é λ x",
+    "\n\n\n",
+]
+
+# pieces of the random inputs, every whitespace and every character that
+# starts a token
+FRAGMENTS = (
+    "int float char x y1 _z NULL INT_MAX true 0 07 0x1f 12 1.5 .5 1e3 1. e "
+    "<<= >> < = == + ++ - -> & && | / * ! != ^ % ( ) { } [ ] ; , . "
+    "'a' '\\n' ' // /* */ \\ @ "
+    '"s" "a\\"b" "\\q" "'
+).split() + [" ", " ", "\t", "\n", "\n", "\r"]
+
+
+def load_lexer(src):
+    # the Lexer of another checkout, under a name of its own
+    path = os.path.join(src, "lexer.py")
+    spec = importlib.util.spec_from_file_location("baseline_lexer", path)
+    module = importlib.util.module_from_spec(spec)
+    # ply looks the module of the rules up in sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module.Lexer
+
+
+def value(value):
+    # identifiers were once dicts of their lexeme and line
+    if isinstance(value, dict) and "lexeme" in value:
+        return repr((value["lexeme"], value["additional"]["line"]))
+    if hasattr(value, "lexeme"):
+        return repr((value.lexeme, value.line))
+    return repr(value)
+
+
+def lex(engine, text):
+    # the tokens and errors in the order they are produced
+    events = []
+    lexer = engine(lambda msg, row, col: events.append(("error", msg, row, col)))
+    lexer.build()
+    lexer.lexer.input(text)
+    lexer.lexer.lineno = 1
+    while True:
+        tok = lexer.lexer.token()
+        if not tok:
+            break
+        events.append((tok.type, value(tok.value), tok.lineno, tok.lexpos))
+    # older lexers do not flag their errors, their flag is None
+    events.append(("lines", lexer.lexer.lineno, getattr(lexer, "error", None)))
+    return events
+
+
+def comparable(expected, found):
+    # the events without the error flags of the lines events unless both
+    # lexers flag their errors
+    if expected[-1][2] is None or found[-1][2] is None:
+        return expected[:-1] + [expected[-1][:2]], found[:-1] + [found[-1][:2]]
+    return expected, found
+
+
+def script_output(src, engine, output_format, path):
+    # the output and errors of lexer.py run as a script, where the Lexer of
+    # the ply engine is __main__.Lexer and the one of the fast engine is
+    # lexer.Lexer
+    result = subprocess.run(
+        [sys.executable, "-Wignore", os.path.join(src, "lexer.py")]
+        + ["--lexer", engine, "-f", output_format, path],
+        capture_output=True,
+        text=True,
+    )
+    output = result.stdout.splitlines() + result.stderr.splitlines()
+    return output + [f"exit status {result.returncode}"]
+
+
+def first_difference(expected, found):
+    for i, (a, b) in enumerate(zip(expected, found)):
+        if a != b:
+            return i, a, b
+    i = min(len(expected), len(found))
+    return i, expected[i : i + 1], found[i : i + 1]
+
+
+def main():
+    aparser = argparse.ArgumentParser()
+    aparser.add_argument(
+        "--src", help="Source directory to test", default=os.path.join(ROOT, "src")
+    )
+    aparser.add_argument(
+        "--against", help="Source directory of the lexer to compare with", default=None
+    )
+    aparser.add_argument(
+        "--fuzz", type=int, help="Number of random inputs", default=2000
+    )
+    aparser.add_argument(
+        "--seed", type=int, help="Seed of the random inputs", default=0
+    )
+    aparser.add_argument(
+        "programs", nargs="?", help="Glob of C programs", default=PROGRAMS
+    )
+    args = aparser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.src))
+    from lexer import Lexer
+    from fastlexer import FastLexer
+
+    if args.against is None:
+        reference, engines = ("ply", Lexer), [("fast", FastLexer)]
+    else:
+        reference = ("baseline", load_lexer(os.path.abspath(args.against)))
+        engines = [("ply", Lexer), ("fast", FastLexer)]
+
+    inputs = []
+    for path in sorted(glob.glob(args.programs, recursive=True)):
+        with open(path, "r") as f:
+            inputs.append((path, f.read()))
+    inputs += [(f"case {i}", text) for i, text in enumerate(CASES)]
+    rng = random.Random(args.seed)
+    for i in range(args.fuzz):
+        pieces = rng.choices(FRAGMENTS, k=rng.randint(1, 40))
+        inputs.append((f"fuzz {i}", "".join(pieces)))
+
+    tokens = 0
+    for name, text in inputs:
+        expected = lex(reference[1], text)
+        for engine, lexer in engines:
+            a, b = comparable(expected, lex(lexer, text))
+            if a != b:
+                i, a, b = first_difference(a, b)
+                print(f"{name}: event {i} differs")
+                print(f"  input: {text[:200]!r}")
+                print(f"  {reference[0] + ':':<9} {a}")
+                print(f"  {engine + ':':<9} {b}")
+                sys.exit(1)
+        tokens += len(expected)
+
+    src = os.path.abspath(args.src)
+    with tempfile.NamedTemporaryFile("w", suffix=".c") as f:
+        f.write("\n".join(text for _, text in inputs))
+        f.flush()
+        for output_format in ["tsv", "jsonl"]:
+            expected = script_output(src, "ply", output_format, f.name)
+            found = script_output(src, "fast", output_format, f.name)
+            if expected != found:
+                i, a, b = first_difference(expected, found)
+                print(f"lexer.py -f {output_format}: line {i} differs")
+                print(f"  {'ply:':<9} {a}")
+                print(f"  {'fast:':<9} {b}")
+                sys.exit(1)
+    print(f"{len(inputs)} inputs, {tokens} tokens and errors, no differences")
+
+
+if __name__ == "__main__":
+    main()
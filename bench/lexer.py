@@ -0,0 +1,98 @@
+# Lexing cost of the test programs and of large comments and literals.
+# Times the token loop of the lexer over the test programs and over inputs
+# with a --size MB block comment, string literal, or unterminated comment or
+# string. Point --src at an older checkout to compare two versions of
+# lexer.py, --lexer fast times the scanner of fastlexer.py instead.
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+PROGRAMS = os.path.join(ROOT, "tests", "**", "*.c")
+
+
+def large_inputs(size):
+    # the body of each case is about size bytes
+    line = "the quick brown fox jumps over the lazy dog * / \\t"
+    text = (line + "\n") * (size // (len(line) + 1))
+    literal = (line.replace("\\t", "\\\\") + '\\" ') * (size // (len(line) + 3))
+    return [
+        ("block comment", f"int a;\n/*{text}*/\nint b;\n"),
+        ("string literal", f'char *s = "{literal}";\n'),
+        ("unterminated comment", f"int a;\n/*{text}"),
+        ("unterminated string", f'char *s = "{literal}\n'),
+        ("line comments", f"// {text}".replace("\n", "\n// ")),
+    ]
+
+
+def lex(lexer, text):
+    lexer.input(text)
+    lexer.lineno = 1
+    count = 0
+    token = lexer.token
+    while token():
+        count += 1
+    return count
+
+
+def timed(lexer, texts, runs):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        for text in texts:
+            lex(lexer, text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    aparser = argparse.ArgumentParser()
+    aparser.add_argument(
+        "--src", help="Source directory to benchmark", default=os.path.join(ROOT, "src")
+    )
+    aparser.add_argument("-n", "--runs", type=int, help="Timed runs", default=5)
+    aparser.add_argument(
+        "-s", "--size", type=float, help="MB in the large cases", default=4
+    )
+    aparser.add_argument(
+        "--lexer", choices=["ply", "fast"], help="Lexer engine", default="ply"
+    )
+    aparser.add_argument(
+        "programs", nargs="?", help="Glob of C programs", default=PROGRAMS
+    )
+    args = aparser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.src))
+    if args.lexer == "fast":
+        from fastlexer import FastLexer as Lexer
+    else:
+        from lexer import Lexer
+
+    # the lexer reports errors through error_func, the unterminated cases
+    # report one each
+    lexer = Lexer(lambda msg, row, col: None)
+    lexer.build()
+
+    texts = []
+    for path in sorted(glob.glob(args.programs, recursive=True)):
+        with open(path, "r") as f:
+            texts.append(f.read())
+    size = sum(len(text) for text in texts)
+    tokens = sum(lex(lexer.lexer, text) for text in texts)
+    best = timed(lexer.lexer, texts, args.runs)
+    print(f"{len(texts)} programs, {size / 1000:.0f} kB, {tokens} tokens")
+    print(f"programs: {best * 1000:.1f} ms, {best / tokens * 1e6:.2f} us/token")
+
+    print(f"{'case':<24}{'MB':>6}{'ms':>10}{'MB/s':>8}")
+    for name, text in large_inputs(int(args.size * 1e6)):
+        best = timed(lexer.lexer, [text], args.runs)
+        mb = len(text) / 1e6
+        print(f"{name:<24}{mb:>6.1f}{best * 1000:>10.1f}{mb / best:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Startup benchmark for the compiler, based on python -X importtime.
+# Fails if one of the optional heavy dependencies is imported before any
+# C code is read.
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# only needed for the .dot and pretty lexer outputs, or not at all
+HEAVY_MODULES = ["pygraphviz", "pandas", "numpy", "tabulate", "pydot"]
+
+TARGETS = {
+    "lexer": [os.path.join(SRC, "lexer.py"), "-h"],
+    "parser": [os.path.join(SRC, "parser.py"), "-h"],
+    "ccpy": ["-c", f"import sys; sys.path.insert(0, {SRC!r}); import ccpy"],
+}
+
+
+def import_times(cmd):
+    # argparse exits on -h right after the module level imports are done,
+    # so the import log of the scripts covers exactly the startup path
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime"] + cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    times = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return times
+
+
+def wall_clock(cmd, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + cmd, stdout=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)[len(samples) // 2]
+
+
+def main():
+    aparser = argparse.ArgumentParser()
+    aparser.add_argument(
+        "-n", "--runs", type=int, help="Wall clock samples per target", default=5
+    )
+    args = aparser.parse_args()
+
+    failed = False
+    for target, cmd in TARGETS.items():
+        times = import_times(cmd)
+        # top level imports are the ones without indentation
+        total = sum(cum for name, _, cum in times if not name.startswith(" "))
+        heavy = sorted(
+            {
+                name.strip().split(".")[0]
+                for name, _, _ in times
+                if name.strip().split(".")[0] in HEAVY_MODULES
+            }
+        )
+        print(f"{target}: imports {total / 1000:.1f} ms", end=", ")
+        print(f"wall clock {wall_clock(cmd, args.runs) * 1000:.1f} ms (median)")
+        top_level = [t for t in times if not t[0].startswith(" ")]
+        for name, _, cum in sorted(top_level, key=lambda t: -t[2])[:5]:
+            print(f"    {cum / 1000:8.1f} ms  {name}")
+        if heavy:
+            failed = True
+            print(f"    heavy modules on the startup path: {', '.join(heavy)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
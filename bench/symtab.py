@@ -0,0 +1,96 @@
+# Symbol lookup cost in deeply nested blocks.
+# Times the lookup of globals and outer variables from the innermost of
+# --depth nested scopes, and compiling a program whose main nests as many
+# blocks, every block declaring a variable and reading the globals and the
+# variables of the enclosing blocks. Point --src at an older checkout to
+# compare two versions of symboltable.py.
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def nested_program(depth, globals_count):
+    lines = [f"int g{i};" for i in range(globals_count)]
+    lines.append("int main(){")
+    lines.append("    int v0 = 0;")
+    for level in range(1, depth + 1):
+        reads = " + ".join(
+            [f"v{level - 1}", f"v{level // 2}", f"g{level % globals_count}"]
+        )
+        lines.append("    " * level + "{")
+        lines.append("    " * (level + 1) + f"int v{level} = {reads};")
+    for level in reversed(range(1, depth + 1)):
+        lines.append("    " * level + "}")
+    lines.append("    return v0;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def time_lookups(depth, globals_count, runs):
+    from symboltable import SymbolTable
+    from three_address_code import three_address_code
+
+    symtab = SymbolTable()
+    tac = three_address_code()
+    for i in range(globals_count):
+        symtab.insert_symbol(f"g{i}", 0)
+    symtab.insert_symbol("main", 0)
+    for level in range(depth + 1):
+        symtab.push_scope(tac)
+        symtab.insert_symbol(f"v{level}", 0)
+
+    names = [f"g{i}" for i in range(globals_count)]
+    names += [f"v{level}" for level in range(depth + 1)]
+    clock = time.perf_counter
+    best = None
+    for _ in range(runs):
+        start = clock()
+        for name in names:
+            symtab.return_sym_tab_entry(name)
+        elapsed = clock() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(names)
+
+
+def main():
+    aparser = argparse.ArgumentParser()
+    aparser.add_argument(
+        "--src", help="Source directory to benchmark", default=os.path.join(ROOT, "src")
+    )
+    aparser.add_argument("-n", "--runs", type=int, help="Timed runs", default=5)
+    aparser.add_argument(
+        "-d", "--depth", type=int, help="Nesting depth of the blocks", default=150
+    )
+    aparser.add_argument(
+        "-g", "--globals", type=int, help="Number of globals", default=50
+    )
+    args = aparser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.src))
+    from ccpy import CompileOptions, compile_source
+
+    text = nested_program(args.depth, args.globals)
+    options = CompileOptions(codegen=False)
+    result = compile_source(text, options)
+    if not result.success:
+        print("\n".join(result.diagnostics))
+        sys.exit(1)
+
+    samples = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        compile_source(text, options)
+        samples.append(time.perf_counter() - start)
+    best = min(samples)
+    lookup = time_lookups(args.depth, args.globals, args.runs)
+    print(f"depth {args.depth}, {args.globals} globals")
+    print(f"lookup: {lookup * 1e6:.2f} us")
+    print(f"compile: {best * 1000:.1f} ms, {best / args.depth * 1e6:.1f} us/block")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+# In-process compiler API over the lexer, parser and code generator.
+# A Compiler keeps its lexer and LALR tables built, so many sources can be
+# compiled in one process without rebuilding them.
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer import Lexer, error_func
+from fastlexer import FastLexer
+from parser import Parser
+from codegen import generate_assembly
+from prelude import prelude
+
+ansi_escape = re.compile(r"\033\[[0-9;]*m")
+
+# the lexer engines, both produce the same tokens
+LEXERS = {"ply": Lexer, "fast": FastLexer}
+
+
+class CompileOptions:
+    def __init__(self, ast=False, codegen=True, optimize=1):
+        # ast: record the AST graph so that it can be written as a .dot file
+        # codegen: generate x86 assembly from the three address code
+        # optimize: 0 keeps every value in its stack slot, 1 allocates registers
+        self.ast = ast
+        self.codegen = codegen
+        self.optimize = optimize
+
+
+class CompilationResult:
+    def __init__(self, parser, diagnostics):
+        self.success = not (parser.error or parser.symtab.error)
+        self.symtab = parser.symtab
+        self.three_address_code = parser.three_address_code
+        self.ast = parser.graph if parser.graph.record else None
+        self.diagnostics = diagnostics
+        self.assembly = []
+
+    @property
+    def frames(self):
+        # (function, frame size with a slot per temporary, frame size with
+        # shared slots) of every function
+        return list(self.three_address_code.temps.frames)
+
+    @property
+    def tac(self):
+        # the TAC text is only rendered when asked for
+        if not self.success:
+            return []
+        return list(self.three_address_code.code_lines())
+
+    def write_tac(self, path):
+        with open(path, "w") as f:
+            for line in self.tac:
+                f.write(line + "\n")
+
+    def write_assembly(self, path):
+        with open(path, "w") as f:
+            for line in self.assembly:
+                f.write(line + "\n")
+
+    def write_symtab(self, path):
+        # CSV, or JSON Lines when the path ends in .jsonl
+        with open(path, "w", newline="") as f:
+            if path.endswith(".jsonl"):
+                self.symtab.write_jsonl(f)
+            else:
+                self.symtab.write_csv(f)
+
+    def write_ast(self, path):
+        self.ast.write(path)
+
+    def frame_lines(self):
+        yield f"{'function':<24}{'frame':>8}{'shared':>8}"
+        for function, before, after in self.frames:
+            yield f"{function:<24}{before:>8}{after:>8}"
+
+
+class Compiler:
+    def __init__(self, prototypes=(), lexer="ply"):
+        # prototypes: files of library functions to declare besides the
+        # builtins, see prelude.py
+        # lexer: the name of the lexer engine in LEXERS
+        self.lexer = LEXERS[lexer](error_func)
+        self.lexer.build()
+        self.parser = Parser(ast=False, builtins=prelude(prototypes))
+        self.parser.build()
+
+    def compile(self, text, options=None):
+        if options is None:
+            options = CompileOptions()
+
+        lexer = self.lexer.lexer
+        self.lexer.reset()
+        lexer.input(text)
+        lexer.lineno = 1
+        self.parser.reset(ast=options.ast)
+
+        # the compiler stages report their diagnostics with print
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            self.parser.parse(text, lexer)
+        diagnostics = [
+            ansi_escape.sub("", line) for line in output.getvalue().splitlines()
+        ]
+
+        result = CompilationResult(self.parser, diagnostics)
+        if result.success:
+            tac = self.parser.three_address_code
+            tac.finalize_code()
+            if options.codegen:
+                result.assembly = generate_assembly(tac.code_fields(), options.optimize)
+        return result
+
+
+default_compiler = None
+
+
+def compile_source(text, options=None):
+    """
+    Compiles the C source in text and returns a CompilationResult with the
+    three address code, assembly, symbol table and diagnostics. The lexer and
+    parser tables are built on the first call and reused afterwards.
+    """
+    global default_compiler
+    if default_compiler is None:
+        default_compiler = Compiler()
+    return default_compiler.compile(text, options)
+
+
+def input_base(pattern):
+    # the directory whose layout the outputs of a pattern mirror, a directory
+    # itself or the part of a pattern before its first wildcard
+    if os.path.isdir(pattern):
+        return pattern
+    parts = []
+    for part in os.path.dirname(pattern).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or os.curdir
+
+
+def expand_inputs(patterns):
+    """
+    Accepts files, directories and glob patterns, ** matches recursively.
+    Returns a (path, name) pair per file. The outputs of a file are named
+    after its path relative to the directory or to the pattern up to its
+    first wildcard, e.g. basic/1 for tests/final/basic/1.c of tests/final.
+    Raises ValueError if two files would write the same outputs.
+    """
+    files = {}
+    names = {}
+    for pattern in patterns:
+        base = input_base(pattern)
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "**", "*.c")
+        for path in sorted(glob.glob(pattern, recursive=True)) or [pattern]:
+            if path in files:
+                continue
+            name = os.path.splitext(os.path.relpath(path, base))[0]
+            if name in names:
+                raise ValueError(f"{names[name]} and {path} both write {name}")
+            files[path] = name
+            names[name] = path
+    return list(files.items())
+
+
+def output_path(directory, name, ext):
+    # the output file of a compiled file, in the subdirectories of its name
+    path = os.path.join(directory, name + ext)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def init_worker(prototypes=(), lexer="ply"):
+    # every worker builds its lexer and parser tables and its prelude once
+    global default_compiler
+    default_compiler = Compiler(prototypes, lexer)
+
+
+def compile_file(
+    path,
+    name,
+    out_dir,
+    dot_dir,
+    ast=False,
+    tac=False,
+    optimize=1,
+    frames=False,
+    symtab=None,
+):
+    start = time.perf_counter()
+    try:
+        with open(path, "r") as f:
+            text = f.read()
+        result = compile_source(text, CompileOptions(ast=ast, optimize=optimize))
+    except Exception as e:
+        message = f"{type(e).__name__}: {e}"
+        return path, "crash", message, [], time.perf_counter() - start
+
+    if not result.success:
+        errors = [line for line in result.diagnostics if line.strip()]
+        message = errors[0].strip() if errors else ""
+        return path, "error", message, [], time.perf_counter() - start
+
+    if symtab:
+        result.write_symtab(
+            output_path(os.path.join(out_dir, "symtab"), name, "." + symtab)
+        )
+    if tac:
+        result.write_tac(output_path(os.path.join(out_dir, "tac"), name, ".txt"))
+    result.write_assembly(output_path(os.path.join(out_dir, "assembly"), name, ".s"))
+    if ast:
+        result.write_ast(output_path(dot_dir, name, ".dot"))
+    report = list(result.frame_lines()) if frames else []
+    return path, "ok", "", report, time.perf_counter() - start
+
+
+def make_dirs(args):
+    sub_dirs = ["assembly"] + (["tac"] if args.tac else [])
+    sub_dirs += ["symtab"] if args.symtab else []
+    for sub_dir in sub_dirs:
+        os.makedirs(os.path.join(args.out, sub_dir), exist_ok=True)
+    if args.ast:
+        os.makedirs(args.dot, exist_ok=True)
+
+
+def compile_one(args):
+    global default_compiler
+    default_compiler = Compiler(args.prototypes, args.lexer)
+    make_dirs(args)
+    with open(args.infile, "r") as f:
+        text = f.read()
+    result = compile_source(text, CompileOptions(ast=args.ast, optimize=args.optimize))
+    for line in result.diagnostics:
+        print(line)
+    if not result.success:
+        print("Error found. Aborting compilation of " + args.infile + "....")
+        return 1
+
+    fname = os.path.splitext(os.path.basename(args.infile))[0]
+    if args.symtab:
+        result.write_symtab(os.path.join(args.out, "symtab", fname + "." + args.symtab))
+    if args.tac:
+        result.write_tac(os.path.join(args.out, "tac", fname + ".txt"))
+    result.write_assembly(os.path.join(args.out, "assembly", fname + ".s"))
+    if args.ast:
+        result.write_ast(os.path.join(args.dot, fname + ".dot"))
+    if args.frames:
+        for line in result.frame_lines():
+            print(line)
+    return 0
+
+
+def batch(args, files):
+    make_dirs(args)
+
+    start = time.perf_counter()
+    failed = 0
+    with ProcessPoolExecutor(
+        args.jobs, initializer=init_worker, initargs=(args.prototypes, args.lexer)
+    ) as pool:
+        jobs = [
+            pool.submit(
+                compile_file,
+                path,
+                name,
+                args.out,
+                args.dot,
+                args.ast,
+                args.tac,
+                args.optimize,
+                args.frames,
+                args.symtab,
+            )
+            for path, name in files
+        ]
+        for job in jobs:
+            path, status, message, report, seconds = job.result()
+            if status != "ok":
+                failed += 1
+            print(f"{status:<6}{seconds:7.3f}s  {path}  {message}".rstrip())
+            for line in report:
+                print("      " + line)
+
+    print(
+        f"{len(files) - failed} of {len(files)} files compiled "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    outputs = argparse.ArgumentParser(add_help=False)
+    outputs.add_argument(
+        "-o", "--out", help="Directory for symtab, assembly and tac", default="out"
+    )
+    outputs.add_argument(
+        "--tac", action="store_true", help="Also write the TAC", default=False
+    )
+    outputs.add_argument(
+        "--ast", action="store_true", help="Also write the AST graph", default=False
+    )
+    outputs.add_argument("--dot", help="Directory for the AST graphs", default="dot")
+    outputs.add_argument(
+        "--symtab",
+        choices=["csv", "jsonl"],
+        help="Also write the symbol table as CSV or JSON Lines",
+        default=None,
+    )
+    outputs.add_argument(
+        "--frames",
+        action="store_true",
+        help="Print the frame size of every function",
+        default=False,
+    )
+    outputs.add_argument(
+        "--prototypes",
+        action="append",
+        metavar="FILE",
+        help="Declare the library functions of a prototype file, can be repeated",
+        default=[],
+    )
+    outputs.add_argument(
+        "--lexer",
+        choices=list(LEXERS),
+        help="Lexer engine, fast scans without PLY's master regex",
+        default="ply",
+    )
+    outputs.add_argument(
+        "-O",
+        dest="optimize",
+        type=int,
+        choices=[0, 1],
+        help="0 keeps every value in its stack slot, 1 allocates registers",
+        default=1,
+    )
+
+    aparser = argparse.ArgumentParser(prog="ccpy")
+    commands = aparser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile", parents=[outputs], help="Compile a single file in-process"
+    )
+    compile_parser.add_argument("infile", help="Input File")
+
+    batch_parser = commands.add_parser(
+        "batch",
+        parents=[outputs],
+        help="Compile many files over a pool of worker processes",
+    )
+    batch_parser.add_argument(
+        "-j", "--jobs", type=int, help="Number of worker processes", default=None
+    )
+    batch_parser.add_argument(
+        "inputs", nargs="+", help="Input files, directories or glob patterns"
+    )
+    args = aparser.parse_args()
+    try:
+        prelude(args.prototypes)
+    except (OSError, ValueError) as e:
+        aparser.error(str(e))
+
+    if args.command == "compile":
+        sys.exit(compile_one(args))
+    elif args.command == "batch":
+        try:
+            files = expand_inputs(args.inputs)
+        except ValueError as e:
+            aparser.error(str(e))
+        sys.exit(batch(args, files))
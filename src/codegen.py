@@ -1,4 +1,7 @@
-import copy, sys
+import argparse, sys
+from three_address_code import Opcode, parse_tac_line
+from three_address_code import FrameSlot, FrameAddress, Indirect, Immediate
+from regalloc import RegisterAllocator, Window
 
 math_func_list = [
     "scanf",
@@ -40,6 +43,8 @@ class CodeGenerator:
         self.label_list = {}
         self.label_num = 1
 
+        self.dispatch = self.build_dispatch()
+
         self.final_code = []
         append_list = [".data", ".text", ".globl main", ".type main, @function", "\n"]
         for i in range(len(append_list)):
@@ -53,6 +58,8 @@ class CodeGenerator:
         if s2 != "":
             if isinstance(s2, int):
                 s2 = self.register_mapping[s2]
+        # the typed operands are rendered as assembly text here
+        s2, s3 = str(s2), str(s3)
         len_chk = len(s2)
         if len_chk > 0:
             temp_code = temp_code + " " + s2
@@ -139,16 +146,12 @@ class CodeGenerator:
             return False
 
         reg2_idx = None
-        check_list = ["%", "("]
-        if source1[0] == check_list[0] and len(source1) > 4:
-            pos = source1[4:]
+        if type(source1) is FrameAddress:
             emit_instruction = "leal"
-            offset = int(pos)
             if reg1_idx is not None:
-                self.emit_code(emit_instruction, f"{offset}(%ebp)", reg1_idx)
-        elif source1[0] == check_list[1]:
-            pos = source1[1:-1]
-            self.move_variable(pos, reg1_idx)
+                self.emit_code(emit_instruction, FrameSlot(source1.offset), reg1_idx)
+        elif type(source1) is Indirect:
+            self.move_variable(source1.pointer, reg1_idx)
             emit_instruction = "movzbl"
             emit_instruction_2 = "movl"
             if reg1_idx is not None and one_byte is not None:
@@ -179,9 +182,9 @@ class CodeGenerator:
             if reg2_idx is None:
                 return False
 
-            if source2[0] == "(":
+            if type(source2) is Indirect:
                 emit_instruction = "movzbl"
-                self.move_variable(source2[1:-1], reg2_idx)
+                self.move_variable(source2.pointer, reg2_idx)
                 emit_instruction_2 = "movl"
                 reg_mpd = self.register_mapping[reg2_idx]
                 if one_byte is not None and reg2_idx is not None:
@@ -199,6 +202,14 @@ class CodeGenerator:
 
         return True
 
+    def free_operand(self, operand):
+        # frees the register an operand was loaded into, the operand itself or
+        # the pointer of an indirect operand
+        if type(operand) is Indirect:
+            self.free_register(operand.pointer)
+        else:
+            self.free_register(operand)
+
     def create_label(self, line):
         if int(line) in self.label_list:
             return self.label_list[int(line)]
@@ -208,77 +219,35 @@ class CodeGenerator:
         return label
 
     def dereference(self, destination, one_byte=None, reg=None):
-        check_char = ["(", "%"]
-        destination_length = len(destination)
-        if destination[0] == check_char[0]:
+        if type(destination) is Indirect:
             emit_instruction = "movl"
-            destination = destination[1:-1]
             register = self.request_register(reg)
-            self.emit_code(emit_instruction, destination, register)
-            register = self.register_mapping[register]
-            string_ret = "(" + str(register) + ")"
-            return string_ret
-        elif destination[0] == check_char[1] and destination_length > 4:
-            first = destination[0:4]
-            second = destination[4:]
-            new_destination = f"{int(second)}({first})"
+            self.emit_code(emit_instruction, destination.pointer, register)
+            return Indirect(self.register_mapping[register])
+        elif type(destination) is FrameAddress:
             emit_instruction = "leal"
             register = self.request_register(reg)
-            self.emit_code(emit_instruction, new_destination, register)
-            register = self.register_mapping[register]
-            return str(register)
+            self.emit_code(emit_instruction, FrameSlot(destination.offset), register)
+            return self.register_mapping[register]
         else:
             return destination
 
     def float_dereference(self, instruction, rege1=None, rege2=None, rege3=None):
-        flag1 = 0
-        flag2 = flag1
-        reg1 = instruction[1]
-        flag3 = flag2
-        if instruction[1][0] == "(":
-            emit_instruction = "movl"
-            ins_rng = instruction[1][1:-1]
-            reg1 = self.request_register(rege1)
-            self.emit_code(emit_instruction, ins_rng, reg1)
-            reg1 = self.register_mapping[reg1]
-            if flag1 != 1:
-                flag1 = 1
-            reg1 = "(" + str(reg1) + ")"
-
-        instruc_len = len(instruction)
-        reg2 = None
-        if instruc_len > 2:
-            reg2 = instruction[2]
-        if instruc_len > 2 and instruction[2][0] == "(":
-            emit_instruction = "movl"
-            ins_rng = instruction[2][1:-1]
-            reg2 = self.request_register(rege2)
-            self.emit_code(emit_instruction, ins_rng, reg2)
-            reg2 = self.register_mapping[reg2]
-            if flag2 != 1:
-                flag2 = 1
-            reg2 = "(" + str(reg2) + ")"
-
-        reg3 = None
-        if instruc_len > 3:
-            reg3 = instruction[3]
-        if instruc_len > 3 and instruction[3][0] == "(":
-            emit_instruction = "movl"
-            ins_rng = instruction[3][1:-1]
-            reg3 = self.request_register(rege3)
-            self.emit_code(emit_instruction, ins_rng, reg3)
-            reg3 = self.register_mapping[reg3]
-            if flag3 != 1:
-                flag3 = 1
-            reg3 = "(" + str(reg3) + ")"
-        if flag1 == 1:
-            self.free_register(reg1[1:-1])
-        if flag2 == 1:
-            self.free_register(reg2[1:-1])
-        if flag3 == 1:
-            self.free_register(reg3[1:-1])
-
-        return reg1, reg2, reg3
+        # the pointers of the indirect operands are loaded into registers,
+        # which are free again once the operands are returned
+        operands = list(instruction[1:4]) + [None] * (4 - len(instruction))
+        loaded = []
+        for i, register in enumerate((rege1, rege2, rege3)):
+            if type(operands[i]) is Indirect:
+                register = self.request_register(register)
+                self.emit_code("movl", operands[i].pointer, register)
+                register = self.register_mapping[register]
+                loaded.append(register)
+                operands[i] = Indirect(register)
+        for register in loaded:
+            self.free_register(register)
+
+        return tuple(operands)
 
     def op_addition(self, instruction):
         """
@@ -296,12 +265,7 @@ class CodeGenerator:
             self.emit_code(emit_instruction2, "%dl", instruction[1])
             self.free_register(instruction[2])
             self.free_register(instruction[3])
-            char_ins0 = instruction[1][0]
-            char_ins1 = instruction[1][1]
-            if char_ins0 == "%":
-                self.free_register(instruction[1])
-            elif char_ins0 == "(" and char_ins1 == "%":
-                self.free_register(instruction[1][1:-1])
+            self.free_operand(instruction[1])
 
         elif type_chk[1] == instruction[0][2:]:
             emit_instruction1 = "flds"
@@ -321,20 +285,7 @@ class CodeGenerator:
             self.emit_code(emit_instruction2, instruction[3], instruction[1])
             self.free_register(instruction[2])
             self.free_register(instruction[3])
-            if (
-                instruction[1] is not None
-                and instruction[1][0] is not None
-                and instruction[1][0] == "("
-                and instruction[1][1] is not None
-                and instruction[1][1] == "%"
-            ):
-                self.free_register(instruction[1][1:-1])
-            elif (
-                instruction[1] is not None
-                and instruction[1][0] is not None
-                and instruction[1][0] == "%"
-            ):
-                self.free_register(instruction[1])
+            self.free_operand(instruction[1])
 
     def op_subtraction(self, instruction):
         """
@@ -352,12 +303,7 @@ class CodeGenerator:
             self.emit_code(emit_instruction2, "%dl", instruction[1])
             self.free_register(instruction[2])
             self.free_register(instruction[3])
-            char_ins0 = instruction[1][0]
-            char_ins1 = instruction[1][1]
-            if char_ins0 == "%":
-                self.free_register(instruction[1])
-            elif char_ins0 == "(" and char_ins1 == "%":
-                self.free_register(instruction[1][1:-1])
+            self.free_operand(instruction[1])
 
         elif type_chk[1] == instruction[0][2:]:
             emit_instruction1 = "flds"
@@ -376,14 +322,8 @@ class CodeGenerator:
             self.emit_code(emit_instruction2, instruction[2], instruction[1])
             self.free_register(instruction[2])
             self.free_register(instruction[3])
-            if (
-                instruction[1] is not None
-                and instruction[1][0] is not None
-                and instruction[1][0] == "("
-            ):
-                self.free_register(instruction[1])
-                instruction_sliced = instruction[1][1:-1]
-                instruction[1] = instruction_sliced
+            if type(instruction[1]) is Indirect:
+                instruction[1] = instruction[1].pointer
 
     def op_eq(self, instruction):
         """
@@ -393,16 +333,11 @@ class CodeGenerator:
         check = instruction[0][2:]
         type_chk = ["char", "float"]
         if type_chk[0] == instruction[0][2:]:
-            if instruction[2] and instruction[2][0] == "$":
+            if type(instruction[2]) is Immediate:
                 emit_instruction1 = "movb"
                 instruction[1] = self.dereference(instruction[1])
                 self.emit_code(emit_instruction1, instruction[2], instruction[1])
-                char_ins0 = instruction[1][0]
-                char_ins1 = instruction[1][1]
-                if char_ins0 == "%":
-                    self.free_register(instruction[1])
-                elif char_ins0 == "(" and char_ins1 == "%":
-                    self.free_register(instruction[1][1:-1])
+                self.free_operand(instruction[1])
             else:
                 req_reg = "%eax"
                 deref_reg = ["%edx", "%ecx"]
@@ -416,19 +351,9 @@ class CodeGenerator:
                 self.emit_code(emit_instruction1, instruction[2], req_reg)
                 self.emit_code(emit_instruction2, "%al", instruction[1])
                 self.free_register(req_reg)
-                char_ins0 = instruction[1][0]
-                char_ins1 = instruction[1][1]
-                if char_ins0 == "%":
-                    self.free_register(instruction[1])
-                elif char_ins0 == "(" and char_ins1 == "%":
-                    self.free_register(instruction[1][1:-1])
+                self.free_operand(instruction[1])
 
-                char_ins0 = instruction[2][0]
-                char_ins1 = instruction[2][1]
-                if char_ins0 == "%":
-                    self.free_register(instruction[2])
-                elif char_ins0 == "(" and char_ins1 == "%":
-                    self.free_register(instruction[2][1:-1])
+                self.free_operand(instruction[2])
 
         elif type_chk[1] == instruction[0][2:]:
             emit_instruction1 = "flds"
@@ -444,14 +369,8 @@ class CodeGenerator:
             instruction[1] = self.dereference(instruction[1])
             self.emit_code(emit_instruction2, instruction[2], instruction[1])
             self.free_register(instruction[2])
-            if (
-                instruction[1] is not None
-                and instruction[1][0] is not None
-                and instruction[1][0] == "("
-            ):
-                self.free_register(instruction[1])
-                instruction_sliced = instruction[1][1:-1]
-                instruction[1] = instruction_sliced
+            if type(instruction[1]) is Indirect:
+                instruction[1] = instruction[1].pointer
 
     def op_multiplication(self, instruction):
 
@@ -784,11 +703,9 @@ class CodeGenerator:
                 emit_instruction1 = "movl"
                 self.emit_code(emit_instruction1, instruction[1], register)
                 self.free_register(register, True)
-                if instruction[1][0]:
-                    if instruction[1][0] == "(":
-                        instruction_sliced = instruction[1][1:-1]
-                        instruction[1] = instruction_sliced
-                        self.free_register(instruction[1])
+                if type(instruction[1]) is Indirect:
+                    instruction[1] = instruction[1].pointer
+                    self.free_register(instruction[1])
         else:
             requested_register = self.request_register()
             register = self.register_mapping[requested_register]
@@ -798,12 +715,10 @@ class CodeGenerator:
             number_of_variables = int(instruction[2])
             num_div = int(number_of_variables / 4)
             num_mod = int(number_of_variables % 4)
-            instruction_sliced = instruction[1][1:-1]
-            instruction_temp = copy.deepcopy(instruction[1])
             reg1 = None
-            if instruction[1][0] == "(":
+            if type(instruction[1]) is Indirect:
                 reg1 = self.request_register()
-                self.emit_code("movl", instruction_sliced, reg1)
+                self.emit_code("movl", instruction[1].pointer, reg1)
                 val = 0
                 reg1 = self.register_mapping[reg1]
                 for i in range(num_div):
@@ -848,8 +763,7 @@ class CodeGenerator:
 
                 self.free_register(reg1)
             else:
-                instruction_part = instruction_temp.split("(")[0]
-                val = int(instruction_part)
+                val = instruction[1].offset
                 for i in range(num_div):
                     address = val + i * 4
                     addr_reg = "(%ebp)"
@@ -903,38 +817,25 @@ class CodeGenerator:
     def op_param(self, instruction):
         if len(instruction) == 2:
             instruction[1] = self.dereference(instruction[1])
-            instruction_length1 = len(instruction[1])
-            if instruction[1][0] == "%" and instruction_length1 > 4:
-                offset = int(instruction[1][4:])
-                reg1 = self.request_register()
-                emit_inst = ["leal", "push"]
-                self.emit_code(emit_inst[0], f"{offset}(%ebp)", reg1)
-                self.emit_code(emit_inst[1], reg1)
-                self.free_register(reg1)
-            elif instruction[1][0] != "(":
+            if type(instruction[1]) is not Indirect:
                 reg = self.request_register()
                 emit_inst = ["movl", "push"]
                 self.emit_code(emit_inst[0], instruction[1], reg)
                 self.emit_code(emit_inst[1], reg)
                 self.free_register(reg)
             else:
-                self.final_code.append("push " + instruction[1])
-            if instruction[1][0] == "%":
-                self.free_register(instruction[1])
-            elif instruction[1][0] == "(" and instruction[1][1] == "%":
-                self.free_register(instruction[1][1:-1])
+                self.final_code.append(f"push {instruction[1]}")
+            self.free_operand(instruction[1])
         else:
-            instruction_length1 = len(instruction[1])
-            if instruction[1][0] == "%" and instruction_length1 > 4:
-                offset = int(instruction[1][4:])
+            if type(instruction[1]) is FrameAddress:
                 reg1 = self.request_register()
                 emit_inst = ["leal", "push"]
-                self.emit_code(emit_inst[0], f"{offset}(%ebp)", reg1)
+                self.emit_code(emit_inst[0], FrameSlot(instruction[1].offset), reg1)
                 self.emit_code(emit_inst[1], reg1)
                 self.free_register(reg1)
                 return
 
-            if "(" not in instruction[1]:
+            if type(instruction[1]) not in (FrameSlot, Indirect):
                 reg = self.request_register()
                 emit_inst = ["movl", "push"]
                 self.emit_code(emit_inst[0], instruction[1], reg)
@@ -942,12 +843,12 @@ class CodeGenerator:
                 self.free_register(reg)
                 return
 
-            elif instruction[1].count("(") > 1:
-                if instruction[2] != "$4":
+            elif type(instruction[1]) is Indirect:
+                if instruction[2] != Immediate(4):
                     reg = self.request_register()
                     reg = self.register_mapping[reg]
-                    self.emit_code("movl", instruction[1][1:-1], reg)
-                    number_of_variables = int(instruction[2][1:])
+                    self.emit_code("movl", instruction[1].pointer, reg)
+                    number_of_variables = int(instruction[2].value)
                     num = number_of_variables // 4
                     self.emit_code("addl", f"${(num-1)*4}", reg)
                     emit_inst = ["push", "subl"]
@@ -956,15 +857,13 @@ class CodeGenerator:
                         self.emit_code(emit_inst[1], "$4", reg)
                 else:
                     instruction[1] = self.dereference(instruction[1])
-                    self.final_code.append("push " + instruction[1])
-                    instruction[1] = instruction[1][1:-1]
-                    self.free_register(instruction[1])
+                    self.final_code.append(f"push {instruction[1]}")
+                    self.free_operand(instruction[1])
 
             else:
-                number_of_variables = int(instruction[2][1:])
+                number_of_variables = int(instruction[2].value)
                 num_div = int(number_of_variables / 4)
-                instruction_temp = copy.deepcopy(instruction[1])
-                val = int(instruction_temp.split("(")[0])
+                val = instruction[1].offset
                 temp_code_list = []
 
                 # for i in range(num_div):
@@ -1082,8 +981,8 @@ class CodeGenerator:
         reg = self.request_register()
         source = instruction[3]
         emit_inst = ["movl", "cmp", "jne"]
-        if source[0] == "(":
-            self.move_variable(source[1:-1], reg)
+        if type(source) is Indirect:
+            self.move_variable(source.pointer, reg)
             self.emit_code(emit_inst[0], f"({self.register_mapping[reg]})", reg)
         else:
             self.move_variable(source, reg)
@@ -1335,10 +1234,7 @@ class CodeGenerator:
         if instruction[0][0] == op_ass[1]:
             self.op_shift_right(instruction)
 
-        if instruction[1][0] == op_ass[4]:
-            self.free_register(instruction[1])
-        elif instruction[1][0] == "(" and instruction[1][1] == op_ass[4]:
-            self.free_register(instruction[1][1:-1])
+        self.free_operand(instruction[1])
 
     def op_load_float(self, instruction):
         """
@@ -1366,7 +1262,7 @@ class CodeGenerator:
         emit_inst = ["flds", "subl", "leal", "fstpl"]
         reg1, reg2, reg3 = self.float_dereference(instruction)
         self.emit_code(emit_inst[0], reg1)
-        self.emit_code(emit_inst[1], "$4", "%esp")
+        self.emit_code(emit_inst[1], "$8", "%esp")
         self.emit_code(emit_inst[2], "-8(%esp)", "%esp")
         self.emit_code(emit_inst[3], "(%esp)")
         # reg1, reg2, reg3 = self.float_dereference(instruction)
@@ -1383,7 +1279,7 @@ class CodeGenerator:
         emit_inst = ["fildl", "subl", "leal", "fstpl"]
         reg1, reg2, reg3 = self.float_dereference(instruction)
         self.emit_code(emit_inst[0], reg1)
-        self.emit_code(emit_inst[1], "$4", "%esp")
+        self.emit_code(emit_inst[1], "$8", "%esp")
         self.emit_code(emit_inst[2], "-8(%esp)", "%esp")
         self.emit_code(emit_inst[3], "(%esp)")
         # reg1, reg2, reg3 = self.float_dereference(instruction)
@@ -1422,10 +1318,7 @@ class CodeGenerator:
         self.emit_code(emit_inst[1], "%al", "%eax")
         self.emit_code(emit_inst[2], "%eax")
         self.free_register(reg1)
-        if instruction[1][0] == "%":
-            self.free_register(instruction[1])
-        elif instruction[1][0] == "(" and instruction[1][1] == "%":
-            self.free_register(instruction[1][1:-1])
+        self.free_operand(instruction[1])
 
     def op_push_char(self, instruction):
         reg1 = self.request_register("%eax")
@@ -1435,11 +1328,7 @@ class CodeGenerator:
         self.emit_code(emit_inst[1], "$1", "%esp")
         self.emit_code(emit_inst[2], "%al", "0(%esp)")
         self.free_register(reg1)
-        if instruction[1][0] == "%":
-            self.free_register(instruction[1])
-        elif instruction[1][0] == "(" and instruction[1][1] == "%":
-
-            self.free_register(instruction[1][1:-1])
+        self.free_operand(instruction[1])
 
     def op_cast(self, instruction):
         # type[0] is destination, types[1] is source, instruction[1] is destination, instruction[2] is source
@@ -1504,16 +1393,8 @@ class CodeGenerator:
             self.emit_code(mov_inst[0], reg, instruction[1])
             self.free_register(reg)
 
-        if instruction[1][0] == "%":
-            self.free_register(instruction[1])
-        elif instruction[1][0] == "(" and instruction[1][1] == "%":
-
-            self.free_register(instruction[1][1:-1])
-        if instruction[2][0] == "%":
-            self.free_register(instruction[2])
-        elif instruction[2][0] == "(" and instruction[2][1] == "%":
-
-            self.free_register(instruction[2][1:-1])
+        self.free_operand(instruction[1])
+        self.free_operand(instruction[2])
 
     def op_ampersand(self, instruction):
         """
@@ -1526,143 +1407,101 @@ class CodeGenerator:
         self.emit_code(emit_inst[0], instruction[2], reg)
         self.emit_code(emit_inst[1], reg, instruction[1])
         self.free_register(reg)
-        if instruction[2][0] == "(":
-            instruction[2] = instruction[2][1:-1]
+        if type(instruction[2]) is Indirect:
+            instruction[2] = instruction[2].pointer
             self.free_register(instruction[2])
 
-    def gen_code(self, instruction):
-        if instruction != []:
-            if len(self.register_stack) != 6:
-                for reg in self.register_list:
-                    self.free_register(reg)
-
-            if (instruction[0] is not None) and instruction[0][0:2] in [
-                "*=",
-                "/=",
-                "%=",
-                "+=",
-                "-=",
-                "&=",
-                "^=",
-                "|=",
-            ]:
-                self.op_assignment(instruction)
-            elif len(instruction[0]) > 2 and (
-                instruction[0][0:3] == "<<=" or instruction[0][0:3] == ">>="
-            ):
-                self.op_assignment(instruction)
-            elif instruction[0][0] in ["+", "-"] or instruction[0][0:2] in ["<<", ">>"]:
-                ins = instruction[0][0]
-                ins2 = instruction[0][0:2]
-                if ins == "+":
-                    self.op_addition(instruction)
-                elif ins == "-":
-                    self.op_subtraction(instruction)
-                elif ins2 == "<<":
-                    self.op_shift_left(instruction)
-                elif ins2 == ">>":
-                    self.op_shift_right(instruction)
-            elif instruction[0][0:2] in ["<=", ">=", "==", "!="] or instruction[0][
-                0
-            ] in ["<", ">"]:
-                self.op_comparator(instruction)
-            elif (
-                instruction[0][0] == "="
-                or instruction[0][0:6] == "UNARY+"
-                or instruction[0][0:6] == "UNARY*"
-            ):
-                unary_ops = ["UNARY+", "UNARY*"]
-                if (
-                    instruction[0][0:6] == unary_ops[0]
-                    or instruction[0][0:6] == unary_ops[1]
-                ):
-                    instruction[0] = "=" + instruction[0][6:]
-                self.op_eq(instruction)
-            elif (instruction[0] is not None) and instruction[0][0] in [
-                "*",
-                "|",
-                "^",
-                "&",
-            ]:
-                ins = instruction[0][0]
-                if ins == "*":
-                    self.op_multiplication(instruction)
-                elif ins == "|":
-                    self.op_inclusive_or(instruction)
-                elif ins == "^":
-                    self.op_exclusive_or(instruction)
-                elif ins == "&":
-                    self.op_and(instruction)
-            elif (
-                (len(instruction) == 1)
-                and (instruction[0][-1] == ":")
-                and (instruction[0][0] != ".")
-                and ("." not in instruction[0])
-            ):
-                self.op_function_start(instruction)
-            elif instruction[0] == "param":
-                self.op_param(instruction)
-            elif instruction[0] == "callq" or instruction[0] == "callq_char":
-                self.op_function_call(instruction)
-            elif instruction[0] == "callq_struct":
-                self.op_function_call_struct(instruction)
-            elif instruction[0] == "retq" or instruction[0] == "retq_struct":
-                self.op_return(instruction)
-                self.final_code.append("")
-            elif instruction[0][0] == "/":
-                self.op_division(instruction)
-            elif instruction[0][0] == "%":
-                self.op_modulo(instruction)
-            elif instruction[0][0:6] in ["UNARY-", "UNARY~", "UNARY!", "UNARY&"]:
-                if instruction[0][0:6] == "UNARY~":
-                    self.op_not(instruction)
-                elif instruction[0][0:6] == "UNARY-":
-                    self.op_negation(instruction)
-                elif instruction[0][0:6] == "UNARY&":
-                    self.op_ampersand(instruction)
-                elif instruction[0][0:6] == "UNARY!":
-                    self.op_logical_not(instruction)
-            elif instruction[0][0:4] == "ifnz" and instruction[1][0:4] == "goto":
-                self.op_if_not_zero_goto(instruction)
-            elif instruction[0][0:4] == "goto":
-                self.op_goto(instruction)
-            elif instruction[0] == "load_float":
-                self.op_load_float(instruction)
-            elif instruction[0] == "printf_push_float":
-                self.op_printf_push_float(instruction)
-            elif instruction[0] == "push_char":
-                self.op_push_char(instruction)
-            elif instruction[0] == "math_func_push_float":
-                self.op_math_func_push_float(instruction)
-            elif instruction[0] == "math_func_push_int":
-                self.op_math_func_push_int(instruction)
-            elif instruction[0] == "pow_func_push_int":
-                self.op_pow_func_push_int(instruction)
-            elif instruction[0] == "pow_func_push_float":
-                self.op_pow_func_push_float(instruction)
-            elif instruction[0] == "printf_push_char":
-                self.op_printf_push_char(instruction)
-            elif instruction[0] == "cast":
-                self.op_cast(instruction)
-            else:
-                self.final_code.append(" ".join(instruction))
-
-        else:
+    def op_deref_assignment(self, instruction):
+        # UNARY+ and UNARY* are plain assignments once the prefix is dropped
+        instruction[0] = "=" + instruction[0][6:]
+        self.op_eq(instruction)
+
+    def op_function_end(self, instruction):
+        self.op_return(instruction)
+        self.final_code.append("")
+
+    def op_raw(self, instruction):
+        self.final_code.append(" ".join(instruction))
+
+    def build_dispatch(self):
+        dispatch = {
+            Opcode.ADD: self.op_addition,
+            Opcode.SUB: self.op_subtraction,
+            Opcode.LEFT: self.op_shift_left,
+            Opcode.RIGHT: self.op_shift_right,
+            Opcode.ASSIGN: self.op_eq,
+            Opcode.UNARY_PLUS: self.op_deref_assignment,
+            Opcode.UNARY_STAR: self.op_deref_assignment,
+            Opcode.MUL: self.op_multiplication,
+            Opcode.OR: self.op_inclusive_or,
+            Opcode.XOR: self.op_exclusive_or,
+            Opcode.AND: self.op_and,
+            Opcode.LABEL: self.op_function_start,
+            Opcode.PARAM: self.op_param,
+            Opcode.CALL: self.op_function_call,
+            Opcode.CALL_CHAR: self.op_function_call,
+            Opcode.CALL_STRUCT: self.op_function_call_struct,
+            Opcode.RETURN: self.op_function_end,
+            Opcode.RETURN_STRUCT: self.op_function_end,
+            Opcode.DIV: self.op_division,
+            Opcode.MOD: self.op_modulo,
+            Opcode.UNARY_TILDE: self.op_not,
+            Opcode.UNARY_MINUS: self.op_negation,
+            Opcode.UNARY_AMPERSAND: self.op_ampersand,
+            Opcode.UNARY_NOT: self.op_logical_not,
+            Opcode.IFNZ_GOTO: self.op_if_not_zero_goto,
+            Opcode.GOTO: self.op_goto,
+            Opcode.LOAD_FLOAT: self.op_load_float,
+            Opcode.PRINTF_PUSH_FLOAT: self.op_printf_push_float,
+            Opcode.PUSH_CHAR: self.op_push_char,
+            Opcode.MATH_FUNC_PUSH_FLOAT: self.op_math_func_push_float,
+            Opcode.MATH_FUNC_PUSH_INT: self.op_math_func_push_int,
+            Opcode.POW_FUNC_PUSH_INT: self.op_pow_func_push_int,
+            Opcode.POW_FUNC_PUSH_FLOAT: self.op_pow_func_push_float,
+            Opcode.PRINTF_PUSH_CHAR: self.op_printf_push_char,
+            Opcode.CAST: self.op_cast,
+        }
+        for opcode in range(Opcode.MUL_ASSIGN, Opcode.RIGHT_ASSIGN + 1):
+            dispatch[opcode] = self.op_assignment
+        for opcode in range(Opcode.LE, Opcode.GT + 1):
+            dispatch[opcode] = self.op_comparator
+        # everything else (data section, labels, ...) is copied verbatim
+        return [dispatch.get(opcode, self.op_raw) for opcode in Opcode]
+
+    def release_registers(self):
+        # every instruction starts with all registers free, registers that
+        # were in use go back on top of the stack in register_list order
+        if len(self.register_stack) == len(self.register_list):
             return
+        free = set(self.register_stack)
+        for reg in self.register_list:
+            register_index = self.reverse_mapping[reg]
+            if register_index not in free:
+                self.register_stack.append(register_index)
+
+    def gen_code(self, instruction, opcode):
+        if instruction != []:
+            self.release_registers()
+            self.dispatch[opcode](instruction)
 
 
-if __name__ == "__main__":
-    file = open(sys.argv[1], "r")
-    fname = sys.argv[1].split("/")[-1].split(".")[0]
-    code = file.readlines()
+def generate_assembly(code, optimize=1):
+    # code holds (opcode, fields) pairs, see three_address_code.code_fields
+    # optimize=0 leaves every value in its stack slot between instructions
     codegen = CodeGenerator()
-    for lineno, instr in enumerate(code):
+    windows = []
+    for lineno, (opcode, instr) in enumerate(code):
         string_label = "label " + str(lineno + 1) + ":"
         codegen.final_code.append(string_label)
-        instr = instr.split()[1:]
-        codegen.gen_code(instr)
+        start = len(codegen.final_code)
+        fields = list(instr)
+        codegen.gen_code(instr, opcode)
+        windows.append(Window(opcode, fields, start, len(codegen.final_code)))
         codegen.final_code.append("")
 
+    if optimize:
+        RegisterAllocator(codegen.final_code, codegen.register_list).allocate(windows)
+
     for_print = []
     for line in codegen.final_code:
         if len(line) >= 5:
@@ -1673,8 +1512,27 @@ if __name__ == "__main__":
                 for_print.append(line)
         else:
             for_print.append(line)
-    codegen.final_code = for_print
+    return for_print
+
+
+if __name__ == "__main__":
+    aparser = argparse.ArgumentParser()
+    aparser.add_argument(
+        "-O",
+        dest="optimize",
+        type=int,
+        choices=[0, 1],
+        help="0 keeps every value in its stack slot, 1 allocates registers",
+        default=1,
+    )
+    aparser.add_argument("infile", help="Input File")
+    args = aparser.parse_args()
+
+    file = open(args.infile, "r")
+    fname = args.infile.split("/")[-1].split(".")[0]
+    code = [parse_tac_line(instr) for instr in file.readlines()]
+    final_code = generate_assembly(code, args.optimize)
     # print("Output Assembly is at out/assembly/" + fname + ".s")
     with open("out/assembly/" + fname + ".s", "w") as sys.stdout:
-        for line in codegen.final_code:
+        for line in final_code:
             print(line)
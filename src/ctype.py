@@ -0,0 +1,225 @@
+# Interned type descriptors.
+# The parser carries types as lists of words, e.g. ["int", "unsigned"],
+# ["char *"] or ["int", "arr", "[3]", "[4]"], where the first word holds the
+# base type and one " *" per level of indirection. ctype returns the same
+# CType for equal lists, so the facts the rules keep asking about a type are
+# derived once and two types are the same exactly when their descriptors are.
+
+datatype_size = dict()
+datatype_size["void"] = 0
+datatype_size["bool"] = 1
+datatype_size["char"] = 1
+datatype_size["short"] = 2
+datatype_size["ptr"] = 4
+datatype_size["int"] = 4
+datatype_size["float"] = 4
+datatype_size["unsigned int"] = 4
+datatype_size["int unsigned"] = 4
+datatype_size["str"] = 4  # char pointer
+
+# scalar types in the order type_size looks for them
+SCALARS = ["float", "short", "int", "char", "bool", "void"]
+
+
+def is_dimension(word):
+    return word == "arr" or word[:1] == "[" or word[-1:] == "]"
+
+
+class CType:
+    __slots__ = (
+        "words",
+        "base",
+        "is_pointer",
+        "is_unsigned",
+        "is_array",
+        "dims",
+        "struct",
+        "size",
+        "name",
+        "cast_name",
+        "_plain",
+        "_element",
+    )
+
+    def __init__(self, words):
+        self.words = words
+        self.base = words[0] if words else ""
+        self.is_pointer = self.base[-1:] == "*"
+        self.is_unsigned = "unsigned" in words
+        self.is_array = "arr" in words
+
+        # the bounds of the trailing [N] words, an empty last bound is 0
+        dims = []
+        for word in reversed(words[1:]):
+            if word[:1] != "[":
+                break
+            bound = word[1:-1]
+            if not dims and not bound:
+                dims.append(0)
+            else:
+                try:
+                    dims.append(int(bound))
+                except ValueError:
+                    dims.append(bound)
+        self.dims = tuple(reversed(dims))
+
+        # size of a single value, structs are sized by the symbol table
+        split = " ".join(words).split(" ")
+        self.struct = None
+        self.size = None
+        if "*" in split:
+            self.size = datatype_size["ptr"]
+        elif "struct" in split:
+            self.struct = split[1]
+        else:
+            for scalar in SCALARS:
+                if scalar in split:
+                    self.size = datatype_size[scalar]
+                    break
+
+        # the spellings of the type in the cast instructions of the TAC
+        self.name = " ".join(words).replace(" ", "_")
+        plain = [word for word in words if not is_dimension(word)]
+        self.cast_name = " ".join(plain).replace(" ", "_")
+        self._plain = None
+        self._element = None
+
+    @property
+    def plain(self):
+        # the type without its array words, which is what a cast converts to
+        if self._plain is None:
+            self._plain = ctype([word for word in self.words if not is_dimension(word)])
+        return self._plain
+
+    @property
+    def element(self):
+        # what a pointer points to, which for arrays is the type of their
+        # elements, None for other types
+        if self._element is None and self.is_pointer:
+            base = self.base[:-2] if self.base.endswith(" *") else self.base[:-1]
+            self._element = ctype((base,) + self.words[1:])
+        return self._element
+
+    def __repr__(self):
+        return f"CType({list(self.words)})"
+
+
+# the interned types and the worked out conversions belong to one compilation,
+# Parser.reset forgets them with clear_caches
+interned = {}
+
+
+def ctype(words):
+    """
+    Returns the interned CType of a list of type words. Each distinct type
+    is only analysed once.
+    """
+    key = tuple(words)
+    found = interned.get(key)
+    if found is None:
+        found = interned[key] = CType(key)
+    return found
+
+
+# ranks of the arithmetic types, the usual arithmetic conversions convert both
+# operands to the higher ranked of their types
+RANKS = ["bool", "char", "short", "int", "float"]
+INTEGERS = ["bool", "char", "short", "int"]
+SHIFTABLE = ["char", "short", "int"]
+
+# the binary operators as (operand types, result, when the result is
+# unsigned). The result is either the common type of the operands ("common"),
+# int ("int"), int with an untyped operator ("bitwise"), or int after both
+# operands are converted to their common type ("compare"). The unsigned rule
+# gets whether the operands are unsigned and the rank of the common type.
+#
+# The unsigned rules keep the signedness quirks of the original rules so the
+# TAC stays the same:
+# - * / % and the bitwise operators are unsigned when either operand is.
+# - + and - are only unsigned when either operand is and the common type is
+#   at most a short (rank <= 2), an unsigned int sum is signed.
+# - << and >> only follow the left operand.
+# - The relational operators are unsigned when the left operand is, an
+#   unsigned right operand only counts up to a short (rank <= 2).
+# - == and != are unsigned when the left operand is, an unsigned right
+#   operand counts from char to float (0 < rank < 5), not for bool.
+# - ? is unsigned when the left branch is, an unsigned right branch counts
+#   from char to int (0 < rank < 4).
+BINARY_OPERATORS = {
+    "*": (RANKS, "common", lambda lhs, rhs, rank: lhs or rhs),
+    "/": (RANKS, "common", lambda lhs, rhs, rank: lhs or rhs),
+    "%": (INTEGERS, "int", lambda lhs, rhs, rank: lhs or rhs),
+    "+": (RANKS, "common", lambda lhs, rhs, rank: (lhs or rhs) and rank <= 2),
+    "-": (RANKS, "common", lambda lhs, rhs, rank: (lhs or rhs) and rank <= 2),
+    "<<": (SHIFTABLE, "int", lambda lhs, rhs, rank: lhs),
+    ">>": (SHIFTABLE, "int", lambda lhs, rhs, rank: lhs),
+    "<": (RANKS, "compare", lambda lhs, rhs, rank: lhs or (rhs and rank <= 2)),
+    ">": (RANKS, "compare", lambda lhs, rhs, rank: lhs or (rhs and rank <= 2)),
+    "<=": (RANKS, "compare", lambda lhs, rhs, rank: lhs or (rhs and rank <= 2)),
+    ">=": (RANKS, "compare", lambda lhs, rhs, rank: lhs or (rhs and rank <= 2)),
+    "==": (RANKS, "compare", lambda lhs, rhs, rank: lhs or (rhs and 0 < rank < 5)),
+    "!=": (RANKS, "compare", lambda lhs, rhs, rank: lhs or (rhs and 0 < rank < 5)),
+    "&": (INTEGERS, "bitwise", lambda lhs, rhs, rank: lhs or rhs),
+    "^": (INTEGERS, "bitwise", lambda lhs, rhs, rank: lhs or rhs),
+    "|": (INTEGERS, "bitwise", lambda lhs, rhs, rank: lhs or rhs),
+    "?": (RANKS, "common", lambda lhs, rhs, rank: lhs or (rhs and 0 < rank < 4)),
+}
+
+
+class Conversion:
+    # type: the type of the result
+    # label: the operator of the TAC instruction
+    # lhs, rhs: the type each operand is cast to, None if it is kept
+    __slots__ = ("type", "label", "lhs", "rhs")
+
+    def __init__(self, op, lhs, rhs):
+        operands, result, unsigned = BINARY_OPERATORS[op]
+        rank = max(RANKS.index(lhs.base), RANKS.index(rhs.base))
+        is_unsigned = unsigned(lhs.is_unsigned, rhs.is_unsigned, rank)
+        common = [RANKS[rank]] + (["unsigned"] if is_unsigned else [])
+
+        target = common
+        if result == "common":
+            self.type = tuple(common)
+        elif result == "compare":
+            self.type = ("int",)
+        else:
+            target = ["int"] + (["unsigned"] if is_unsigned else [])
+            self.type = tuple(target)
+        if result == "bitwise":
+            self.label = op
+        else:
+            self.label = "_".join([op] + target)
+
+        # an operand is cast when its type lacks a word of the target type
+        self.lhs = None if all(w in lhs.words for w in target) else tuple(target)
+        self.rhs = None if all(w in rhs.words for w in target) else tuple(target)
+
+
+conversions = {}
+
+
+def binary_conversion(op, lhs, rhs):
+    """
+    Returns the Conversion of the operands of the binary operator op with
+    the CTypes lhs and rhs, or None if the operator does not take operands of
+    these types. Each combination is only worked out once.
+    """
+    key = (op, lhs, rhs)
+    found = conversions.get(key, False)
+    if found is False:
+        operands = BINARY_OPERATORS[op][0]
+        if lhs.base in operands and rhs.base in operands:
+            found = Conversion(op, lhs, rhs)
+        else:
+            found = None
+        conversions[key] = found
+    return found
+
+
+def clear_caches():
+    """
+    Forgets the types and conversions of the previous compilation.
+    """
+    interned.clear()
+    conversions.clear()
@@ -0,0 +1,179 @@
+# A single pass scanner with the token rules of lexer.Lexer.
+# PLY tries every rule of the Lexer at each position through one alternation
+# of all the rule regexes. FastLexer looks at the first character instead and
+# only tries the rules that can start with it, in the order PLY tries them:
+# macros before identifiers, floats before integers and the longest operator
+# first. The regexes, the keywords, the operators and the handlers that build
+# the token values are the ones of the Lexer, so both produce the same tokens
+# and report the same errors.
+
+import re
+import string
+
+from lexer import Lexer
+
+
+def rule_regex(rule):
+    # PLY takes the regex of a rule from @TOKEN or the docstring and compiles
+    # it in verbose mode
+    return re.compile(getattr(rule, "regex", rule.__doc__), re.VERBOSE)
+
+
+# the rules of the Lexer matching a fixed word, like t_null matching NULL,
+# by the first character of the word and in definition order
+macros = {}
+for rule in vars(Lexer).values():
+    if callable(rule) and getattr(rule, "__name__", "").startswith("t_"):
+        word = rule.__doc__
+        if word and re.fullmatch(r"[A-Z_]+", word):
+            macros.setdefault(word[0], []).append((word, rule))
+
+# the operators of the string rules, longest first
+operators = {}
+for name in Lexer.tokens:
+    regex = getattr(Lexer, "t_" + name, None)
+    if isinstance(regex, str):
+        operators[re.sub(r"\\(.)", r"\1", regex)] = name
+operator_lengths = sorted({len(op) for op in operators}, reverse=True)
+
+identifier_start = set(string.ascii_letters + "_")
+digits = set(string.digits)
+
+
+class Token:
+    # the attributes of a PLY LexToken without a dict per token, yacc sets
+    # lexer on the token it reports a syntax error at
+    __slots__ = ("type", "value", "lineno", "lexpos", "lexer")
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self):
+        return f"Token({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+class FastLexer(Lexer):
+    identifier_pattern = rule_regex(Lexer.t_IDENTIFIER)
+    char_pattern = rule_regex(Lexer.t_CHAR_CONSTANT)
+    unmatched_char_pattern = rule_regex(Lexer.t_UNMATCHED_SINGLE_QUOTE)
+    float_pattern = rule_regex(Lexer.t_FLOAT_CONSTANT)
+    integer_pattern = rule_regex(Lexer.t_INTEGER_CONSTANT)
+
+    def build(self, **kwargs):
+        # the scanner stands in for the ply lexer object as well
+        self.lexer = self
+        self.lexdata = ""
+        self.lexpos = 0
+        self.lineno = 1
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def new_token(self, type, value, pos):
+        return Token(type, value, self.lineno, pos)
+
+    def token(self):
+        data = self.lexdata
+        length = len(data)
+        while self.lexpos < length:
+            pos = self.lexpos
+            c = data[pos]
+            if c == " " or c == "\t":
+                self.lexpos = pos + 1
+                continue
+
+            if c in identifier_start:
+                tok = self.word(data, pos)
+            elif c == "\n":
+                end = pos + 1
+                while end < length and data[end] == "\n":
+                    end += 1
+                self.lineno += end - pos
+                self.lexpos = end
+                continue
+            elif c in digits or (c == "." and data[pos + 1 : pos + 2] in digits):
+                tok = self.number(data, pos)
+            elif c == '"':
+                tok = self.new_token("STRING_CONSTANT", c, pos)
+                tok.lexer = self
+                self.lexpos = pos + 1
+                tok = self.t_STRING_CONSTANT(tok)
+            elif c == "'":
+                tok = self.char(data, pos)
+            elif c == "/" and data[pos + 1 : pos + 2] in ("/", "*"):
+                if data[pos + 1] == "/":
+                    end = data.find("\n", pos)
+                    self.lexpos = length if end == -1 else end
+                else:
+                    tok = self.new_token("COMMENT", "/*", pos)
+                    tok.lexer = self
+                    self.lexpos = pos + 2
+                    self.t_COMMENT(tok)
+                continue
+            else:
+                tok = self.operator(data, pos)
+
+            if tok is not None:
+                return tok
+        return None
+
+    def word(self, data, pos):
+        for word, rule in macros.get(data[pos], ()):
+            if data.startswith(word, pos):
+                self.lexpos = pos + len(word)
+                return rule(self, self.new_token(rule.__name__[2:], word, pos))
+        end = self.identifier_pattern.match(data, pos).end()
+        self.lexpos = end
+        return self.t_IDENTIFIER(self.new_token("IDENTIFIER", data[pos:end], pos))
+
+    def number(self, data, pos):
+        m = self.float_pattern.match(data, pos)
+        if m:
+            self.lexpos = m.end()
+            return self.t_FLOAT_CONSTANT(
+                self.new_token("FLOAT_CONSTANT", m.group(), pos)
+            )
+        if data[pos] == ".":
+            return self.operator(data, pos)
+        m = self.integer_pattern.match(data, pos)
+        self.lexpos = m.end()
+        return self.t_INTEGER_CONSTANT(
+            self.new_token("INTEGER_CONSTANT", m.group(), pos)
+        )
+
+    def char(self, data, pos):
+        m = self.char_pattern.match(data, pos)
+        if m:
+            self.lexpos = m.end()
+            return self.t_CHAR_CONSTANT(self.new_token("CHAR_CONSTANT", m.group(), pos))
+        m = self.unmatched_char_pattern.match(data, pos)
+        if m:
+            self.lexpos = m.end()
+            self.t_UNMATCHED_SINGLE_QUOTE(self.new_token("error", m.group(), pos))
+            return None
+        return self.illegal(data, pos)
+
+    def operator(self, data, pos):
+        for n in operator_lengths:
+            type = operators.get(data[pos : pos + n])
+            if type is not None:
+                self.lexpos = pos + n
+                return self.new_token(type, data[pos : pos + n], pos)
+        c = data[pos]
+        if c in self.literals:
+            self.lexpos = pos + 1
+            return self.new_token(c, c, pos)
+        return self.illegal(data, pos)
+
+    def illegal(self, data, pos):
+        # like PLY the error handler is called at the character and skips it
+        self.lexpos = pos
+        self.t_error(self.new_token("error", data[pos:], pos))
+        return None
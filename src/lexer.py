@@ -2,9 +2,28 @@
 # added object oriented classes
 
 import ply.lex as lex
-from tabulate import tabulate
 import sys, os
 import argparse
+import csv, json
+from functools import partial
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class Identifier:
+    # the value of an IDENTIFIER token, the lexeme comes from the string table
+    # of the lexer so all occurrences of a name share one string
+    __slots__ = ("lexeme", "line")
+
+    def __init__(self, lexeme, line):
+        self.lexeme = lexeme
+        self.line = line
+
+    def __str__(self):
+        return self.lexeme
+
+    def __repr__(self):
+        return f"Identifier({self.lexeme!r}, {self.line})"
 
 
 class Lexer:
@@ -12,17 +31,23 @@ class Lexer:
     # Add docstrings if necessary
     def __init__(self, error_func):
         self.error_func = error_func
+        self.reset()
         ## NOT ADDED : self.last_token
 
+    def reset(self):
+        # called before every compilation, which gets its own string table
+        self.error = False
+        self.names = {}
+
     def build(self, **kwargs):
         self.lexer = lex.lex(object=self, **kwargs)
 
     def _error(self, msg, token):
         # helper function to show an extra error message
         row = token.lineno
-        line_start = self.lexer.lexdata.rfind("\n", 0, token.lexpos)
-        col = token.lexpos - line_start
+        col = find_position(self.lexer, token.lexpos)[1]
 
+        self.error = True
         self.error_func(msg, row, col)
         self.lexer.skip(1)
 
@@ -127,10 +152,19 @@ class Lexer:
 
     # Regex defined inside functions are added first in the master regex
 
+    # the regex only matches the start of a block comment, its end is found
+    # with str.find so that long comments are scanned in linear time
     def t_COMMENT(self, t):
-        # https://stackoverflow.com/a/16165598
-        r"(//.*|/\*(\*(?!/)|[^*])*\*/)"
-        t.lexer.lineno += t.value.count("\n")
+        r"//.*|/\*"
+        if t.value == "/*":
+            data = t.lexer.lexdata
+            end = data.find("*/", t.lexpos + 2)
+            if end == -1:
+                t.lexer.lexpos = len(data)
+                self._error("Block comment does not end", t)
+                return
+            t.lexer.lineno += data.count("\n", t.lexpos, end)
+            t.lexer.lexpos = end + 2
 
     def t_null(self, t):
         r"NULL"
@@ -198,8 +232,7 @@ class Lexer:
             t.type = "INTEGER_CONSTANT"
             t.value = 0
         if t.type == "IDENTIFIER":
-            contents = {"line": t.lineno}
-            t.value = {"lexeme": t.value, "additional": contents}
+            t.value = Identifier(self.names.setdefault(t.value, t.value), t.lineno)
         return t
 
     # Define a rule so we can track line numbers
@@ -278,10 +311,43 @@ class Lexer:
     # [^\'\\\n] - excludes single quote, backslash and newline
     # \\[\\\?\'\"btn] - handle escape characters listed in specs
 
-    STRING_CONSTANT = r"\"([^\"\\\n]|(\\[\\\?\'\"btn0]))*\""
+    # a string literal is scanned with str.find from its opening quote to
+    # the first quote that is not escaped, it may not span lines
+    escapes = "\\?'\"btn0"
 
-    @lex.TOKEN(STRING_CONSTANT)
     def t_STRING_CONSTANT(self, t):
+        r'"'
+        data = t.lexer.lexdata
+        pos = t.lexpos + 1
+        valid = True
+        quote = data.find('"', pos)
+        while quote != -1:
+            backslash = data.find("\\", pos, quote)
+            if backslash == -1:
+                break
+            valid = valid and data[backslash + 1] in self.escapes
+            pos = backslash + 2
+            if pos > quote:
+                quote = data.find('"', pos)
+
+        if quote == -1:
+            # the literal runs to the end of the input unless a backslash
+            # escapes a newline or the end, which makes its quote illegal (the
+            # escaped character is "" at the end, which is also in "\n")
+            backslash = data.find("\\", pos)
+            while backslash != -1 and data[backslash + 1 : backslash + 2] not in "\n":
+                backslash = data.find("\\", backslash + 2)
+            if backslash == -1:
+                t.lexer.lexpos = len(data)
+                self._error('Unmatched " encountered', t)
+                return
+        if quote == -1 or not valid or data.find("\n", t.lexpos, quote) != -1:
+            # lexing goes on after the opening quote
+            t.lexer.lexpos = t.lexpos
+            self._error("Illegal token found", t)
+            return
+        t.value = data[t.lexpos : quote + 1]
+        t.lexer.lexpos = quote + 1
         return t
 
     # Regular Expressions for Arithmetic Assignment
@@ -318,13 +384,6 @@ class Lexer:
 
     t_ignore = " \t"
 
-    unending_block_comment = r"/\*(.|\n)*$"
-
-    @lex.TOKEN(unending_block_comment)
-    def t_UNENDING_BLOCK_COMMENT(self, t):
-        msg = "Block comment does not end"
-        self._error(msg, t)
-
     unmatched_single_quote = r"(\'(\\.|[^\\\'])+$)"
 
     @lex.TOKEN(unmatched_single_quote)
@@ -332,13 +391,6 @@ class Lexer:
         msg = "Unmatched ' encountered"
         self._error(msg, t)
 
-    unmatched_double_quote = r'(\"(\\.|[^\\"])*$)'
-
-    @lex.TOKEN(unmatched_double_quote)
-    def t_UNMATCHED_DOUBLE_QUOTE(self, t):
-        msg = 'Unmatched " encountered'
-        self._error(msg, t)
-
     # Error function
     def t_error(self, t):
         msg = "Illegal token found"
@@ -348,48 +400,82 @@ class Lexer:
 ####################################################3
 
 
-errorPresent = False
+def error_func(msg, row, col, file=None):
+    print(f"Error found in line number {row}, column {col}:", file=file)
+    print(msg, file=file)
+
+
+def line_starts(lexer):
+    """
+    Returns the offsets where the lines of the input of a ply lexer start,
+    followed by the end of the input. The index is built once per input.
+    """
+    data = lexer.lexdata
+    if getattr(lexer, "line_data", None) is not data:
+        lexer.line_index = [0]
+        lexer.line_index += accumulate(len(line) + 1 for line in data.split("\n"))
+        lexer.line_data = data
+    return lexer.line_index
 
 
-def error_func(msg, row, col):
-    global errorPresent
-    print(f"Error found in line number {row}, column {col}:")
-    print(msg)
-    errorPresent = True
+def find_position(lexer, lexpos):
+    # line and column of an offset in the input, both counted from 1
+    starts = line_starts(lexer)
+    line = bisect_right(starts, lexpos)
+    return line, lexpos - starts[line - 1] + 1
 
 
-# Defining an object of the lexer
-lexer = Lexer(error_func)
+def line_text(lexer, line):
+    starts = line_starts(lexer)
+    return lexer.lexdata[starts[line - 1] : starts[line] - 1]
 
-lexer.build()
 
 # To retrieve column number
-def find_column(input, token):
-    line_start = input.rfind("\n", 0, token.lexpos)
-    return token.lexpos - line_start
+def find_column(lexer, token):
+    return find_position(lexer, token.lexpos)[1]
 
 
-def main_lexer(lexer, input_file):
-    global errorPresent
-    lexer.input(input_file)
-    list_of_tokens = []
+TOKEN_COLUMNS = ["Token", "Lexeme", "Line#", "Column#"]
+
+
+def token_rows(lexer):
+    # type, value, line and column of the tokens, as the lexer produces them
     while True:
         tok = lexer.token()
-        # if errorPresent:
-        #     print(f'Errors found. Aborting scanning of {sys.argv[1]}....')
-        #     sys.exit(1) # does this find only 1 error (how to solve multiple err case)
         if not tok:
-            break
-        else:
-            col_val = find_column(input_file, tok)
-            column_num = str(col_val)
-            line_num = str(tok.lineno)
-            list_of_tokens.append([tok.type, tok.value, line_num, column_num])
+            return
+        yield tok.type, tok.value, tok.lineno, find_column(lexer, tok)
 
-    final_list = tabulate(
-        list_of_tokens, headers=["Token", "Lexeme", "Line#", "Column#"]
-    )
-    print(final_list)
+
+def write_tsv(lexer, f):
+    # identifiers are written as their lexeme
+    writer = csv.writer(f, dialect="excel-tab", lineterminator="\n")
+    writer.writerow(TOKEN_COLUMNS)
+    writer.writerows(token_rows(lexer))
+
+
+def write_jsonl(lexer, f):
+    # identifiers are written as their lexeme, the Identifier class of the
+    # tokens is another one when this module runs as a script
+    for type, value, line, column in token_rows(lexer):
+        value = getattr(value, "lexeme", value)
+        record = {"token": type, "lexeme": value, "line": line, "column": column}
+        f.write(json.dumps(record) + "\n")
+
+
+def write_table(lexer, f):
+    # tabulate needs all the rows to align the columns
+    from tabulate import tabulate
+
+    print(tabulate(list(token_rows(lexer)), headers=TOKEN_COLUMNS), file=f)
+
+
+TOKEN_WRITERS = {"tsv": write_tsv, "jsonl": write_jsonl, "table": write_table}
+
+
+def main_lexer(lexer, input_file, output_format="tsv", f=None):
+    lexer.input(input_file)
+    TOKEN_WRITERS[output_format](lexer, sys.stdout if f is None else f)
 
 
 if __name__ == "__main__":
@@ -401,14 +487,44 @@ if __name__ == "__main__":
     parser.add_argument(
         "-o", "--out", help="Store output of lexer in a file", default=None
     )
+    parser.add_argument(
+        "--lexer",
+        choices=["ply", "fast"],
+        help="Lexer engine, fast scans without PLY's master regex",
+        default="ply",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=list(TOKEN_WRITERS),
+        help="Write the tokens as TSV or JSON Lines, or tabulate them",
+        default="tsv",
+    )
     parser.add_argument("infile", help="Input File")
     args = parser.parse_args()
 
     with open(args.infile, "r") as f:
         inp = f.read()
 
-    if args.out is not None:
-        sys.stdout = open(args.out, "w")
+    # Defining an object of the lexer, its errors go to stderr so that the
+    # tokens can be read back from the output
+    if args.lexer == "fast":
+        from fastlexer import FastLexer
+
+        lexer = FastLexer(partial(error_func, file=sys.stderr))
+    else:
+        lexer = Lexer(partial(error_func, file=sys.stderr))
+    lexer.build()
 
     lexer.lexerinp = inp
-    main_lexer(lexer.lexer, inp)
+    if args.out is None:
+        try:
+            main_lexer(lexer.lexer, inp, args.format)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # the reader of the tokens stopped early, like head does, stdout
+            # goes to devnull so that the flush at exit does not fail again
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    else:
+        with open(args.out, "w", buffering=1 << 20) as f:
+            main_lexer(lexer.lexer, inp, args.format, f)
@@ -2,17 +2,83 @@
 # https://github.com/dabeaz/ply/blob/master/doc/ply.md
 
 import ply.yacc as yacc
-from lexer import Lexer, error_func
+from lexer import Lexer, error_func, find_position, line_text
 import argparse
 import sys
-import pygraphviz as pgv
 from symboltable import SymbolTable, bcolors
+from ctype import ctype, datatype_size, binary_conversion, clear_caches, INTEGERS
+from prelude import BUILTINS
 from three_address_code import three_address_code
+from three_address_code import FrameSlot, FrameAddress, Indirect, Immediate
 import struct, copy
-
-num_nodes = 0
-graph = pgv.AGraph(strict=False, directed=True)
-graph.layout(prog="circo")
+import os
+import contextvars
+
+# The LALR tables are shipped next to this file as parsetab.py
+TABLE_DIR = os.path.dirname(os.path.abspath(__file__))
+TABLE_MODULE = "parsetab"
+
+# AST graph of the compilation in progress, set by Parser.parse
+current_graph = contextvars.ContextVar("current_graph", default=None)
+
+
+class GraphNode:
+    # stand-in for a pygraphviz node, only holds the name and attributes
+    __slots__ = ("name", "attr")
+
+    def __init__(self, name):
+        self.name = name
+        self.attr = {}
+
+
+class ASTGraph:
+    """
+    Records the AST drawing operations in order. No graphviz object is
+    created until the .dot file is written, at which point the recorded
+    operations are replayed once. With record=False only the nodes are
+    handed out, so the parser can skip the AST graph entirely.
+    """
+
+    def __init__(self, record=True):
+        self.record = record
+        self.num_nodes = 0
+        self.ops = []
+
+    def add_node(self):
+        node = GraphNode(str(self.num_nodes))
+        self.num_nodes += 1
+        if self.record:
+            self.ops.append(("node", node))
+        return node
+
+    def add_edge(self, u, v, **attr):
+        if self.record:
+            self.ops.append(("edge", (u, v), attr))
+
+    def add_subgraph(self, nbunch, **attr):
+        if self.record:
+            self.ops.append(("subgraph", list(nbunch), attr))
+
+    def remove_node(self, node):
+        if self.record:
+            self.ops.append(("remove", node))
+
+    def write(self, path):
+        # imported here so that pygraphviz stays off the startup path
+        import pygraphviz as pgv
+
+        graph = pgv.AGraph(strict=False, directed=True)
+        name = lambda node: node.name if isinstance(node, GraphNode) else node
+        for op in self.ops:
+            if op[0] == "node":
+                graph.add_node(op[1].name, **op[1].attr)
+            elif op[0] == "edge":
+                graph.add_edge(*map(name, op[1]), **op[2])
+            elif op[0] == "subgraph":
+                graph.add_subgraph(list(map(name, op[1])), **op[2])
+            else:
+                graph.remove_node(name(op[1]))
+        graph.write(path)
 
 
 class Node:
@@ -20,6 +86,7 @@ class Node:
         self.label = label
         self.children = []
         self.create_ast = create_ast
+        self.graph = current_graph.get()
         self.attributes = {"error": False}
         self.is_var = False
         self.variables = {}
@@ -74,10 +141,10 @@ class Node:
         listNode = []
         for idx, child in enumerate(children):
             listNode = listNode + [child.node]
-            graph.add_edge(self.node, child.node)
+            self.graph.add_edge(self.node, child.node)
         for i in range(0, len(children) - 1):
-            graph.add_edge(children[i].node, children[i + 1].node, style="invis")
-        graph.add_subgraph(listNode, rank="same")
+            self.graph.add_edge(children[i].node, children[i + 1].node, style="invis")
+        self.graph.add_subgraph(listNode, rank="same")
         self.children = self.children + children
 
     def make_graph(self):
@@ -93,73 +160,129 @@ class Node:
             self.children = children
             if self.children is not None:
                 listNode = []
-                self.node = new_node()
+                self.node = new_node(self.graph)
                 self.node.attr["label"] = self.label
                 for idx, child in enumerate(self.children):
-                    graph.add_edge(self.node, child.node)
+                    self.graph.add_edge(self.node, child.node)
                     listNode.append(child.node)
-                graph.add_subgraph(listNode, rank="same")
+                self.graph.add_subgraph(listNode, rank="same")
         else:
-            self.node = new_node()
+            self.node = new_node(self.graph)
             self.node.attr["label"] = self.label
 
     def remove_graph(self):
         for child in self.children:
             if child.node:
                 child.remove_graph()
-        remove_node(self.node)
+        remove_node(self.node, G=self.graph)
         self.node = None
 
 
-datatype_size = dict()
-datatype_size["void"] = 0
-datatype_size["bool"] = 1
-datatype_size["char"] = 1
-datatype_size["short"] = 2
-datatype_size["ptr"] = 4
-datatype_size["int"] = 4
-datatype_size["float"] = 4
-datatype_size["unsigned int"] = 4
-datatype_size["int unsigned"] = 4
-datatype_size["str"] = 4  # char pointer
-
-
 class Parser:
 
     tokens = Lexer.tokens
     keywords = Lexer.keywords
     precedence = (("nonassoc", "IF_STATEMENTS"), ("nonassoc", "ELSE"))
 
-    def __init__(self):
-        self.symtab = SymbolTable()
+    def __init__(self, ast=True, builtins=None):
+        # builtins: the library functions declared before the program, see
+        # prelude.py
+        self.builtins = BUILTINS if builtins is None else builtins
+        self.reset(ast)
+
+    def reset(self, ast=True):
+        # per compilation state, a built parser can be reused after a reset
+        clear_caches()
+        self.graph = ASTGraph(record=ast)
+        token = current_graph.set(self.graph)
         self.ast_root = Node("AST Root")
+        current_graph.reset(token)
+        self.symtab = SymbolTable()
         self.error = False
         self.three_address_code = three_address_code()
 
-    def symtab_size_update(self, variables, var_name):
-        multiplier = 1
-        new_list = list()
-        for idx, var in enumerate(variables):
-            new_list += var.split(" ")
-        variables = new_list
-
-        if "*" in variables:
-            self.symtab.modify_symbol(var_name, "allocated_size", datatype_size["ptr"])
-        elif "struct" in variables:
-            found = self.symtab.return_type_tab_entry_su(variables[1], "struct")
+    def type_size(self, variables):
+        ct = ctype(variables)
+        if ct.struct is not None:
+            found = self.symtab.return_type_tab_entry_su(ct.struct, "struct")
             if found is not None:
-                struct_size = found["allocated_size"]
-                self.symtab.modify_symbol(var_name, "allocated_size", struct_size)
-        else:
-            datatype_arr = ["float", "short", "int", "char", "bool", "void"]
-            flag = False
-            for idx, dtype in enumerate(datatype_arr):
-                if dtype in variables:
-                    flag = True
-                    self.symtab.modify_symbol(
-                        var_name, "allocated_size", datatype_size[dtype]
-                    )
-                    break
+                return found["allocated_size"]
+        return ct.size
+
+    def symtab_size_update(self, variables, var_name):
+        size = self.type_size(variables)
+        if size is not None:
+            self.symtab.modify_symbol(var_name, "allocated_size", size)
+
+    def new_temp(self, types, size=None):
+        # temporaries get their frame slot from the allocator of the three
+        # address code and never enter the symbol table. Globals keep their
+        # name.
+        temp = self.three_address_code.create_temp_var()
+        if self.symtab.is_global():
+            return temp
+        if size is None:
+            size = self.type_size(types)
+        if size is None:
+            print(
+                bcolors.FAIL
+                + f"Error: Unknown size of temporary type {types}"
+                + bcolors.ENDC
+            )
+            self.symtab.error = True
+            size = datatype_size["int"]
+        return self.three_address_code.temps.new_temp(size)
+
+    def cast_operand(self, operand, totype):
+        # the operand, wrapped in a conversion node when it is cast
+        if totype is None:
+            operand.totype = None
+            return operand
+        operand.totype = list(totype)
+        return Node("_".join(("to",) + totype), [operand])
+
+    def binary_operation(self, p, conversion):
+        # the node of p[1] op p[3] with the types of a binary_conversion
+        p1 = self.cast_operand(p[1], conversion.lhs)
+        p3 = self.cast_operand(p[3], conversion.rhs)
+        p[0] = Node(str(p[2]), [p1, p3])
+        p[0].type = list(conversion.type)
+        p[0].label = conversion.label
+        p[0].node.attr["label"] = p[0].label
+        return p1, p3
+
+    def pointer_comparison(self, p):
+        # pointers are compared as unsigned ints
+        p1 = self.cast_operand(p[1], ("int", "unsigned"))
+        p3 = self.cast_operand(p[3], ("int", "unsigned"))
+        p[0] = Node(str(p[2]), [p1, p3])
+        p[0].type = ["int"]
+        p[0].label += "_*"
+        p[0].node.attr["label"] = p[0].label
+        return p1, p3
+
+    def emit_binary(self, p, p1, p3):
+        # casts the operands, computes p[0] into a new temporary and jumps on
+        # its value for when the operation is used as a condition
+        for operand, node in ((p[1], p1), (p[3], p3)):
+            totype = operand.totype
+            if totype is not None and ctype(totype) is not ctype(operand.type):
+                node.temp = self.new_temp(totype)
+                self.three_address_code.emit(
+                    "cast",
+                    node.temp,
+                    operand.temp,
+                    ctype(totype).name + "," + ctype(operand.type).cast_name,
+                )
+            else:
+                node.temp = operand.temp
+
+        p[0].temp = self.new_temp(p[0].type)
+        self.three_address_code.emit(p[0].label, p[0].temp, p1.temp, p3.temp)
+        p[0].true_list.append(self.three_address_code.next_statement)
+        p[0].false_list.append(self.three_address_code.next_statement + 1)
+        self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
+        self.three_address_code.emit("goto", "", "", "")
 
     # inspired from https://stackoverflow.com/a/60384184
     def convertFloatRepToLong(self, val):
@@ -170,11 +293,27 @@ class Parser:
         self.three_address_code.float_values.append(long_rep)
         return len(self.three_address_code.float_values) - 1
 
-    def build(self):
+    def build(self, debug=False, rebuild_tables=False):
+        # PLY reuses the shipped tables as long as their signature matches the
+        # grammar, and regenerates them otherwise. Debug mode needs a fresh
+        # build since parser.out is only written while building the tables.
+        if rebuild_tables or debug:
+            remove_tables()
         self.parser = yacc.yacc(
-            module=self, start="start", outputdir="tmp", debug=args.debug
+            module=self,
+            start="start",
+            tabmodule=TABLE_MODULE,
+            outputdir=TABLE_DIR,
+            debug=debug,
         )
 
+    def parse(self, inp, lexer):
+        token = current_graph.set(self.graph)
+        try:
+            return self.parser.parse(inp, lexer=lexer)
+        finally:
+            current_graph.reset(token)
+
     def p_start(self, p):
         """
         start : push_lib_functions translation_unit
@@ -186,42 +325,7 @@ class Parser:
 
     def p_error(self, p):
         self.error = True
-        position = (
-            p.lexer.lexpos
-            - sum(map(lambda line: len(line) + 1, p.lexer.lines[: p.lineno - 1]))
-            - len(p.value)
-            + 1
-        )
-        print(
-            bcolors.BOLD + "{}:{}:".format(p.lineno, position) + bcolors.ENDC,
-            end="",
-            file=sys.stderr,
-        )
-        print(
-            bcolors.FAIL + " SyntaxError: " + bcolors.ENDC,
-            "Unexpected token {}".format(p.value),
-            file=sys.stderr,
-        )
-        print(
-            "     {} |{}".format(p.lineno, p.lexer.lines[p.lineno - 1][: position - 1]),
-            end="",
-            file=sys.stderr,
-        )
-        print(
-            bcolors.WARNING
-            + bcolors.UNDERLINE
-            + "{}".format(
-                p.lexer.lines[p.lineno - 1][position - 1 : position - 1 + len(p.value)]
-            )
-            + bcolors.ENDC
-            + bcolors.ENDC,
-            end="",
-            file=sys.stderr,
-        )
-        print(
-            "{}".format(p.lexer.lines[p.lineno - 1][position - 1 + len(p.value) :]),
-            file=sys.stderr,
-        )
+        print_syntax_error(p)
 
     # Expressions
 
@@ -242,32 +346,8 @@ class Parser:
         p[0].type = ["int"]
         if self.symtab.error == True:
             return
-        p[0].temp = self.three_address_code.create_temp_var()
-        self.symtab.insert_symbol(p[0].temp, 0)
-        self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-        self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-        self.symtab_size_update(p[0].type, p[0].temp)
-        if self.symtab.is_global(p[0].temp):
-            self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-        else:
-            self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-            found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-            var_size = found["allocated_size"]
-            if found["variable_scope"] == "Local":
-                if found["offset"] > 0:
-                    self.symtab.modify_symbol(
-                        p[0].temp,
-                        "temp",
-                        f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                    )
-                else:
-                    self.symtab.modify_symbol(
-                        p[0].temp,
-                        "temp",
-                        f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                    )
-            p[0].temp = found["temp"]
-        self.three_address_code.emit("=_int", p[0].temp, f"${p[1]}")
+        p[0].temp = self.new_temp(p[0].type)
+        self.three_address_code.emit("=_int", p[0].temp, Immediate(p[1]))
 
     def p_float_constant(self, p):
         """float_constant : FLOAT_CONSTANT"""
@@ -278,31 +358,7 @@ class Parser:
         p[0].type = ["float"]
         if self.symtab.error == True:
             return
-        p[0].temp = self.three_address_code.create_temp_var()
-        self.symtab.insert_symbol(p[0].temp, 0)
-        self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-        self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-        self.symtab_size_update(p[0].type, p[0].temp)
-        if self.symtab.is_global(p[0].temp):
-            self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-        else:
-            self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-            found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-            var_size = found["allocated_size"]
-            if found["variable_scope"] == "Local":
-                if found["offset"] > 0:
-                    self.symtab.modify_symbol(
-                        p[0].temp,
-                        "temp",
-                        f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                    )
-                else:
-                    self.symtab.modify_symbol(
-                        p[0].temp,
-                        "temp",
-                        f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                    )
-            p[0].temp = found["temp"]
+        p[0].temp = self.new_temp(p[0].type)
         self.three_address_code.emit("load_float", f".LF{idx}", p[0].temp, "")
 
     def p_char_constant(self, p):
@@ -313,32 +369,8 @@ class Parser:
         p[0].type = ["char"]
         if self.symtab.error == True:
             return
-        p[0].temp = self.three_address_code.create_temp_var()
-        self.symtab.insert_symbol(p[0].temp, 0)
-        self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-        self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-        self.symtab_size_update(p[0].type, p[0].temp)
-        if self.symtab.is_global(p[0].temp):
-            self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-        else:
-            self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-            found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-            var_size = found["allocated_size"]
-            if found["variable_scope"] == "Local":
-                if found["offset"] > 0:
-                    self.symtab.modify_symbol(
-                        p[0].temp,
-                        "temp",
-                        f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                    )
-                else:
-                    self.symtab.modify_symbol(
-                        p[0].temp,
-                        "temp",
-                        f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                    )
-            p[0].temp = found["temp"]
-        self.three_address_code.emit("=_char", p[0].temp, f"${p[1]}")
+        p[0].temp = self.new_temp(p[0].type)
+        self.three_address_code.emit("=_char", p[0].temp, Immediate(p[1]))
 
     def p_string_constant(self, p):
         """string_constant : STRING_CONSTANT"""
@@ -353,7 +385,7 @@ class Parser:
             if self.three_address_code.string_list[i] == p[1]:
                 idx = i
                 break
-        p[0].temp = f"$.LC{idx}"
+        p[0].temp = Immediate(f".LC{idx}")
 
     def p_primary_expression(self, p):
         """
@@ -369,7 +401,7 @@ class Parser:
             return
 
         if p.slice[1].type == "IDENTIFIER":
-            found, entry = self.symtab.return_sym_tab_entry(p[1]["lexeme"], p.lineno(1))
+            found, entry = self.symtab.return_sym_tab_entry(p[1].lexeme, p.lineno(1))
             if found:
                 if "data_type" not in entry.keys():
                     self.symtab.error = True
@@ -381,7 +413,7 @@ class Parser:
                     )
                     return
                 if entry["identifier_type"] == "function":
-                    p[0] = Node(str(p[1]["lexeme"]))
+                    p[0] = Node(str(p[1].lexeme))
                     p[0].type.append("function")
                     p[0].ret_type = []
                     type_list = entry["data_type"]
@@ -483,15 +515,13 @@ class Parser:
                     p[0].parameter_nums = entry["num_parameters"]
                     p[0].parameters = []
 
-                    if "scope" in entry.keys():
-                        for var in entry["scope"][0]:
-                            if var == "struct":
-                                p[0].struct = entry["scope"][0][var]
-                                continue
-                            if var == "scope" or var == "scope_num":
-                                continue
-                            if entry["scope"][0][var]["identifier_type"] == "parameter":
-                                p[0].parameters.append(entry["scope"][0][var])
+                    if "scopes" in entry:
+                        body = entry.scopes[0]
+                        if body.struct is not None:
+                            p[0].struct = body.struct
+                        for param in body.symbols.values():
+                            if param["identifier_type"] == "parameter":
+                                p[0].parameters.append(param)
 
                     if self.symtab.error == True:
                         return
@@ -508,7 +538,7 @@ class Parser:
                     ):
                         isArr += 1
 
-                p[0] = Node(str(p[1]["lexeme"]))
+                p[0] = Node(str(p[1].lexeme))
                 type_list = entry["data_type"]
 
                 if type_list is None or set(type_list) == {"*"}:
@@ -614,7 +644,7 @@ class Parser:
             if self.symtab.error == True:
                 return
 
-            p[0].var_name.append(p[1]["lexeme"])
+            p[0].var_name.append(p[1].lexeme)
             p[0].temp = self.three_address_code.find_symbol_in_symtab(
                 self.symtab, p[0].label
             )
@@ -642,16 +672,16 @@ class Parser:
         """identifier : IDENTIFIER"""
         if self.error == True:
             return
-        p[0] = Node(str(p[1]["lexeme"]))
+        p[0] = Node(str(p[1].lexeme))
         p[0].variables[p[0].label] = []
         p[0].is_var = 1
-        self.symtab.insert_symbol(p[1]["lexeme"], p[1]["additional"]["line"])
-        self.symtab.modify_symbol(p[1]["lexeme"], "identifier_type", "variable")
+        self.symtab.insert_symbol(p[1].lexeme, p[1].line)
+        self.symtab.modify_symbol(p[1].lexeme, "identifier_type", "variable")
 
         if self.symtab.error == True:
             return
 
-        self.symtab.modify_symbol(p[1]["lexeme"], "temp", p[1]["lexeme"])
+        self.symtab.modify_symbol(p[1].lexeme, "temp", p[1].lexeme)
 
     def p_postfix_expression(self, p):
         """
@@ -671,30 +701,20 @@ class Parser:
             if p[1] == None or p[1].type == None:
                 self.symtab.error = True
                 return
-            for i in range(len(p[1].type) - 1, 0, -1):
-                if p[1].type[i][0] != "[":
-                    break
-                else:
-                    if p[0].dim_list is None:
-                        p[0].dim_list = []
-                    if len(p[0].dim_list) == 0 and len(p[1].type[i][1:-1]) == 0:
-                        p[0].dim_list.append(0)
-                    else:
-                        try:
-                            p[0].dim_list.append(int(p[1].type[i][1:-1]))
-                        except:
-                            p[0].dim_list.append(p[1].type[i][1:-1])
+            dims = ctype(p[1].type).dims
+            if dims and p[0].dim_list is None:
+                p[0].dim_list = []
             if p[0].dim_list is not None:
                 p[0].dim_list.reverse()
+                p[0].dim_list[:0] = dims
                 p[0].dim_list.append("is_first_access")
-                var = p[0].temp.split("(")[0]
-                if var == "" or var is None:
-                    return
-                if var[0] != "-":
-                    var = "+" + var
-                p[0].address = f"%ebp{var}"
-                if var[0] == "-":
-                    p[0].temp = p[0].address
+                if type(p[0].temp) is FrameSlot:
+                    p[0].address = FrameAddress(p[0].temp.offset)
+                    if p[0].temp.offset < 0:
+                        p[0].temp = p[0].address
+                elif type(p[0].temp) is str and p[0].temp != "":
+                    # the address of a global is its name
+                    p[0].address = Immediate(p[0].temp)
 
         elif len(p) == 3:
             if p[1] == None or p[1].type == None or p[1].type == []:
@@ -706,7 +726,8 @@ class Parser:
                     + bcolors.ENDC
                 )
             elif (
-                p[1].type[0] not in ["char", "short", "int"] and p[1].type[0][-1] != "*"
+                p[1].type[0] not in ["char", "short", "int"]
+                and not ctype(p[1].type).is_pointer
             ):
                 self.symtab.error = True
                 print(
@@ -725,7 +746,7 @@ class Parser:
                     + str(p.lineno(2))
                     + bcolors.ENDC
                 )
-            elif p[1].is_var == 0 and p[1].type[0][-1] != "*":
+            elif p[1].is_var == 0 and not ctype(p[1].type).is_pointer:
                 self.symtab.error = True
                 print(
                     bcolors.FAIL
@@ -733,7 +754,7 @@ class Parser:
                     + str(p.lineno(2))
                     + bcolors.ENDC
                 )
-            elif p[1].type[0][-1] == "*" and "arr" in p[1].type:
+            elif ctype(p[1].type).is_pointer and ctype(p[1].type).is_array:
                 self.symtab.error = True
                 print(
                     bcolors.FAIL
@@ -749,36 +770,16 @@ class Parser:
                     return
 
                 p[0].var_name = p[1].var_name
-                p[0].temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[0].type, p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
+                p[0].temp = self.new_temp(p[0].type)
                 self.three_address_code.emit("=_int", p[0].temp, p[1].temp, "")
                 if str(p[2]) == "++":
-                    self.three_address_code.emit("+_int", p[1].temp, p[1].temp, f"$1")
+                    self.three_address_code.emit(
+                        "+_int", p[1].temp, p[1].temp, Immediate(1)
+                    )
                 else:
-                    self.three_address_code.emit("-_int", p[1].temp, p[1].temp, f"$1")
+                    self.three_address_code.emit(
+                        "-_int", p[1].temp, p[1].temp, Immediate(1)
+                    )
                 p[0].true_list.append(self.three_address_code.next_statement)
                 p[0].false_list.append(self.three_address_code.next_statement + 1)
                 self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
@@ -786,7 +787,7 @@ class Parser:
 
         elif len(p) == 4:
             if p[2] == ".":
-                p3val = p[3]["lexeme"]
+                p3val = p[3].lexeme
                 p[3] = Node(str(p3val))
                 p[0] = Node(".", children=[p[1], p[3]])
                 if p[1] == None or p[1].type == None or p[1].type == []:
@@ -935,11 +936,11 @@ class Parser:
                     if p[0].var_name[1] in found["vars"].keys():
                         ptr_flag = 0
                         p[0].temp = p[1].temp
-                        if p[0].temp[0] == "(":
+                        if type(p[0].temp) is Indirect:
                             ptr_flag = 1
                             p0_offset = 0
                         else:
-                            p0_offset = int(p[0].temp.split("(")[0])
+                            p0_offset = p[0].temp.offset
                         if len(p[0].var_name) == 2:
                             tmp_offset = 0
                             for item in found["vars"]:
@@ -950,12 +951,12 @@ class Parser:
                             if ptr_flag == 1:
                                 self.three_address_code.emit(
                                     "+_int",
-                                    p[0].temp[1:-1],
-                                    p[0].temp[1:-1],
-                                    f"${p0_offset}",
+                                    p[0].temp.pointer,
+                                    p[0].temp.pointer,
+                                    Immediate(p0_offset),
                                 )
                             else:
-                                p[0].temp = f"{p0_offset}(%ebp)"
+                                p[0].temp = FrameSlot(p0_offset)
                         else:
                             type_to_check = found["vars"][p[0].var_name[1]]["data_type"]
                             idx = 2
@@ -979,12 +980,12 @@ class Parser:
                                     if ptr_flag == 1:
                                         self.three_address_code.emit(
                                             "+_int",
-                                            p[0].temp[1:-1],
-                                            p[0].temp[1:-1],
-                                            f"${p0_offset}",
+                                            p[0].temp.pointer,
+                                            p[0].temp.pointer,
+                                            Immediate(p0_offset),
                                         )
                                     else:
-                                        p[0].temp = f"{p0_offset}(%ebp)"
+                                        p[0].temp = FrameSlot(p0_offset)
                                     break
                                 type_to_check = found2["vars"][p[0].var_name[idx]][
                                     "data_type"
@@ -1037,31 +1038,7 @@ class Parser:
                 p[0].var_name = p[1].var_name
                 if self.symtab.error == True:
                     return
-                p[0].temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[0].type, p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
+                p[0].temp = self.new_temp(p[0].type)
                 found, entry = self.symtab.return_sym_tab_entry(p[1].label)
                 if ("struct" in found["data_type"]) and ("*" not in found["data_type"]):
                     self.three_address_code.emit(
@@ -1081,7 +1058,7 @@ class Parser:
                     self.three_address_code.emit("goto", "", "", "")
 
             elif p[2] == "->":
-                p3val = p[3]["lexeme"]
+                p3val = p[3].lexeme
                 p[3] = Node(str(p3val))
                 p[0] = Node("->", children=[p[1], p[3]])
 
@@ -1223,31 +1200,7 @@ class Parser:
                     return
 
                 p[0].var_name = p[1].var_name + [p3val]
-                p[0].temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", ["int"])
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-                self.symtab_size_update(["int"], p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
+                p[0].temp = self.new_temp(["int"])
 
                 try:
                     found, entry = self.symtab.return_sym_tab_entry(
@@ -1273,7 +1226,7 @@ class Parser:
                                 tmp_offset += found["vars"][item]["allocated_size"]
                             p0_offset += tmp_offset
                             self.three_address_code.emit(
-                                "+_int", p[0].temp, p[1].temp, f"${p0_offset}"
+                                "+_int", p[0].temp, p[1].temp, Immediate(p0_offset)
                             )
                         else:
                             type_to_check = found["vars"][p[0].var_name[1]]["data_type"]
@@ -1296,7 +1249,10 @@ class Parser:
                                         ]
                                     p0_offset += tmp_offset
                                     self.three_address_code.emit(
-                                        "+_int", p[0].temp, p[1].temp, f"${p0_offset}"
+                                        "+_int",
+                                        p[0].temp,
+                                        p[1].temp,
+                                        Immediate(p0_offset),
                                     )
                                     break
                                 type_to_check = found2["vars"][p[0].var_name[idx]][
@@ -1304,7 +1260,7 @@ class Parser:
                                 ]
                                 idx += 1
 
-                p[0].temp = f"({p[0].temp})"
+                p[0].temp = Indirect(p[0].temp)
                 p[0].true_list.append(self.three_address_code.next_statement)
                 p[0].false_list.append(self.three_address_code.next_statement + 1)
                 self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
@@ -1567,65 +1523,23 @@ class Parser:
                         if self.symtab.error == True:
                             return
 
-                        isin = True
-                        p3totype = []
-                        for single_type in paramtype:
-                            if (
-                                single_type != "arr"
-                                and single_type[0] != "["
-                                and single_type[-1] != "]"
-                            ):
-                                p3totype.append(single_type)
-                                if single_type not in p[3].parameters[ctr]:
-                                    isin = False
+                        p3totype = list(ctype(paramtype).plain.words)
+                        isin = all(
+                            single_type in p[3].parameters[ctr]
+                            for single_type in p3totype
+                        )
 
                         if isin == False:
 
-                            p3temp = self.three_address_code.create_temp_var()
-                            self.symtab.insert_symbol(p3temp, 0)
-                            self.symtab.modify_symbol(p3temp, "data_type", p3totype)
-                            self.symtab.modify_symbol(p3temp, "identifier_type", "TEMP")
-                            self.symtab_size_update(p3totype, p3temp)
-                            if self.symtab.is_global(p3temp):
-                                self.symtab.modify_symbol(
-                                    p3temp, "variable_scope", "Global"
-                                )
-                            else:
-                                self.symtab.modify_symbol(
-                                    p3temp, "variable_scope", "Local"
-                                )
-                                found, entry = self.symtab.return_sym_tab_entry(p3temp)
-                                var_size = found["allocated_size"]
-                                if found["variable_scope"] == "Local":
-                                    if found["offset"] > 0:
-                                        self.symtab.modify_symbol(
-                                            p3temp,
-                                            "temp",
-                                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                                        )
-                                    else:
-                                        self.symtab.modify_symbol(
-                                            p3temp,
-                                            "temp",
-                                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                                        )
-                                p3temp = found["temp"]
+                            p3temp = self.new_temp(p3totype)
 
-                            currtype = []
-                            for single_type in p[3].parameters[ctr]:
-                                if (
-                                    single_type != "arr"
-                                    and single_type[0] != "["
-                                    and single_type[-1] != "]"
-                                ):
-                                    currtype.append(single_type)
-                            currtyprstr = "," + " ".join(currtype).replace(" ", "_")
+                            currtyprstr = "," + ctype(p[3].parameters[ctr]).cast_name
 
                             self.three_address_code.emit(
                                 "cast",
                                 p3temp,
                                 p[3].argument_list[ctr][0],
-                                " ".join(p3totype).replace(" ", "_") + currtyprstr,
+                                ctype(p3totype).name + currtyprstr,
                             )
                             p[3].argument_list[ctr] = [p3temp, p3totype]
 
@@ -1635,31 +1549,7 @@ class Parser:
                 if self.symtab.error == True:
                     return
 
-                p[0].temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[0].type, p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
+                p[0].temp = self.new_temp(p[0].type)
 
                 math_funcs_list_single = [
                     "sqrt",
@@ -1679,7 +1569,7 @@ class Parser:
                 math_funcs_list_double = ["pow", "fmod"]
                 for arg in reversed(p[3].argument_list):
                     if p[1].label == "printf":
-                        if arg[0][0] == "$'":
+                        if type(arg[0]) is Immediate and str(arg[0].value)[:1] == "'":
                             self.three_address_code.emit("param", arg[0], "", "")
                         else:
                             if "float" in arg[1]:
@@ -1732,11 +1622,13 @@ class Parser:
                                             )
                                         else:
                                             self.three_address_code.emit(
-                                                "param", item[1], "$4"
+                                                "param", item[1], Immediate(4)
                                             )
                                 else:
                                     self.three_address_code.emit(
-                                        "param", arg[0], f"${datatype_size[req_type]}"
+                                        "param",
+                                        arg[0],
+                                        Immediate(datatype_size[req_type]),
                                     )
                             else:
                                 self.symtab.error = True
@@ -1803,7 +1695,7 @@ class Parser:
                     )
                     return
                 else:
-                    if p[1].type[0][-1] != "*":
+                    if not ctype(p[1].type).is_pointer:
                         self.symtab.error = True
                         print(
                             bcolors.FAIL
@@ -1816,84 +1708,26 @@ class Parser:
                         return
                     else:
                         p[0] = Node("array_subscript", [p[1], p[3]])
-                        p[0].type = []
-                        for single_type in p[1].type:
-                            if single_type[0] == "[" and single_type[-1] == "]":
-                                pass
-                            else:
-                                p[0].type.append(single_type)
-
-                        p[0].type[0] = p[0].type[0][0:-2]
+                        p[0].type = list(ctype(p[1].type).element.words)
                         p[0].array_level = p[1].array_level - 1
 
-                        if p[0].type[0][-1] != "*":
+                        if not ctype(p[0].type).is_pointer:
                             p[0].is_var = 1
-                        elif "arr" not in p[0].type:
+                        elif not ctype(p[0].type).is_array:
                             p[0].is_var = 1
-                        for i in range(len(p[1].type)):
-                            if p[1].type[i][0] == "[" and p[1].type[i][-1] == "]":
-                                p[0].type.append(p[1].type[i])
 
                         if "struct" in p[0].type[0]:
                             p[0].vars = p[1].vars
 
                 p[0].var_name = p[1].var_name
-                p[0].temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", ["int"])
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-                self.symtab_size_update(["int"], p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
+                p[0].temp = self.new_temp(["int"])
 
                 p[0].dim_list = p[1].dim_list
                 is_first_access = False
 
                 if p[0].dim_list is None:
 
-                    arrtemp = self.three_address_code.create_temp_var()
-                    self.symtab.insert_symbol(arrtemp, 0)
-                    self.symtab.modify_symbol(arrtemp, "data_type", ["int"])
-                    self.symtab.modify_symbol(arrtemp, "identifier_type", "TEMP")
-                    self.symtab_size_update(["int"], arrtemp)
-                    if self.symtab.is_global(arrtemp):
-                        self.symtab.modify_symbol(arrtemp, "variable_scope", "Global")
-                    else:
-                        self.symtab.modify_symbol(arrtemp, "variable_scope", "Local")
-                        found, entry = self.symtab.return_sym_tab_entry(arrtemp)
-                        var_size = found["allocated_size"]
-                        if found["variable_scope"] == "Local":
-                            if found["offset"] > 0:
-                                self.symtab.modify_symbol(
-                                    arrtemp,
-                                    "temp",
-                                    f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                                )
-                            else:
-                                self.symtab.modify_symbol(
-                                    arrtemp,
-                                    "temp",
-                                    f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                                )
-                        arrtemp = found["temp"]
+                    arrtemp = self.new_temp(["int"])
 
                     var = 0
                     if "*" in (" ".join(p[0].type)).split(" "):
@@ -1901,14 +1735,13 @@ class Parser:
                     else:
                         var = datatype_size[" ".join(p[0].type)]
 
-                    self.three_address_code.emit("*_int", arrtemp, p[3].temp, f"${var}")
+                    self.three_address_code.emit(
+                        "*_int", arrtemp, p[3].temp, Immediate(var)
+                    )
 
                     if p[1].address is not None:
-                        var = p[1].address.split("(")[0]
-                        if var[0] != "-":
-                            var = "+" + var
                         self.three_address_code.emit(
-                            "+_int", p[0].temp, f"%ebp{var}", arrtemp
+                            "+_int", p[0].temp, p[1].address, arrtemp
                         )
                     else:
                         self.three_address_code.emit(
@@ -1917,7 +1750,7 @@ class Parser:
 
                     self.three_address_code.emit("UNARY*", p[0].temp, p[0].temp, "")
 
-                    p[0].temp = f"({p[0].temp})"
+                    p[0].temp = Indirect(p[0].temp)
 
                     p[0].true_list.append(self.three_address_code.next_statement)
                     p[0].false_list.append(self.three_address_code.next_statement + 1)
@@ -1941,7 +1774,7 @@ class Parser:
                             return
                         curDimension = p[0].dim_list[-1]
                         self.three_address_code.emit(
-                            "*_int", p[0].temp, p[1].temp, f"${curDimension}"
+                            "*_int", p[0].temp, p[1].temp, Immediate(curDimension)
                         )
                         self.three_address_code.emit(
                             "+_int", p[0].temp, p[0].temp, p[3].temp
@@ -1950,9 +1783,9 @@ class Parser:
                     p[0].dim_list.pop()
 
                     if len(p[0].dim_list) == 0:
-                        if p[0].type[0][-1] == "*":
+                        if ctype(p[0].type).is_pointer:
                             self.three_address_code.emit(
-                                "*_int", p[0].temp, p[0].temp, "$4"
+                                "*_int", p[0].temp, p[0].temp, Immediate(4)
                             )
                         else:
                             if "struct" == p[0].type[0]:
@@ -1961,27 +1794,27 @@ class Parser:
                                     "*_int",
                                     p[0].temp,
                                     p[0].temp,
-                                    f"${datatype_size[ strtype ]}",
+                                    Immediate(datatype_size[strtype]),
                                 )
                             else:
                                 self.three_address_code.emit(
                                     "*_int",
                                     p[0].temp,
                                     p[0].temp,
-                                    f"${datatype_size[p[0].type[0]]}",
+                                    Immediate(datatype_size[p[0].type[0]]),
                                 )
 
                         if p[1].address is None or p[1].address == "":
                             self.symtab.error = True
                             return
-                        var = p[1].address[4]
+                        # a parameter array is the pointer in its slot
                         p1_addr = p[1].address
-                        if var == "+":
-                            p1_addr = f"{p[1].address[5:]}(%ebp)"
+                        if type(p1_addr) is FrameAddress and p1_addr.offset >= 0:
+                            p1_addr = FrameSlot(p1_addr.offset)
                         self.three_address_code.emit(
                             "+_int", p[0].temp, p1_addr, p[0].temp
                         )
-                        p[0].temp = f"({p[0].temp})"
+                        p[0].temp = Indirect(p[0].temp)
 
                         p[0].true_list.append(self.three_address_code.next_statement)
                         p[0].false_list.append(
@@ -2056,7 +1889,7 @@ class Parser:
 
                 elif (
                     p[2].type[0] not in ["int", "char", "short"]
-                    and p[2].type[0][-1] != "*"
+                    and not ctype(p[2].type).is_pointer
                 ):
                     self.symtab.error = True
                     print(
@@ -2073,7 +1906,7 @@ class Parser:
                         + str(p.lineno(1))
                         + bcolors.ENDC
                     )
-                elif p[2].is_var == False and p[2].type[0][-1] != "*":
+                elif p[2].is_var == False and not ctype(p[2].type).is_pointer:
                     self.symtab.error = True
                     print(
                         bcolors.FAIL
@@ -2081,7 +1914,7 @@ class Parser:
                         + str(p.lineno(1))
                         + bcolors.ENDC
                     )
-                elif p[2].type[0][-1] == "*" and "arr" in p[2].type:
+                elif ctype(p[2].type).is_pointer and ctype(p[2].type).is_array:
                     self.symtab.error = True
                     print(
                         bcolors.FAIL
@@ -2099,38 +1932,22 @@ class Parser:
                     return
 
                 p[0].var_name = p[2].var_name
-                p[0].temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[0].type, p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
+                p[0].temp = self.new_temp(p[0].type)
                 self.three_address_code.emit("=_int", p[0].temp, p[2].temp, "")
                 if str(p[1]) == "++":
-                    self.three_address_code.emit("+_int", p[0].temp, p[0].temp, f"$1")
-                    self.three_address_code.emit("+_int", p[2].temp, p[2].temp, f"$1")
+                    self.three_address_code.emit(
+                        "+_int", p[0].temp, p[0].temp, Immediate(1)
+                    )
+                    self.three_address_code.emit(
+                        "+_int", p[2].temp, p[2].temp, Immediate(1)
+                    )
                 else:
-                    self.three_address_code.emit("-_int", p[0].temp, p[0].temp, f"$1")
-                    self.three_address_code.emit("-_int", p[2].temp, p[2].temp, f"$1")
+                    self.three_address_code.emit(
+                        "-_int", p[0].temp, p[0].temp, Immediate(1)
+                    )
+                    self.three_address_code.emit(
+                        "-_int", p[2].temp, p[2].temp, Immediate(1)
+                    )
                 p[0].true_list.append(self.three_address_code.next_statement)
                 p[0].false_list.append(self.three_address_code.next_statement + 1)
                 self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
@@ -2141,31 +1958,7 @@ class Parser:
                 p[0].type = ["int"]
                 if self.symtab.error == True:
                     return
-                p[0].temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[0].type, p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
+                p[0].temp = self.new_temp(p[0].type)
 
                 p[0].var_name = p[2].var_name
                 if p[2].type is None or p[2].type == []:
@@ -2191,7 +1984,9 @@ class Parser:
                     req_type = " ".join(new_p2_list)
                 if req_type in datatype_size:
                     self.three_address_code.emit(
-                        "=_int", p[0].temp, f"${multiplier*datatype_size[req_type]}"
+                        "=_int",
+                        p[0].temp,
+                        Immediate(multiplier * datatype_size[req_type]),
                     )
                 else:
                     self.symtab.error = True
@@ -2209,7 +2004,7 @@ class Parser:
                 p[0] = p[1]
                 if (p[2] is not None) and (p[2].node is not None):
                     p[0].children.append(p[2])
-                    graph.add_edge(p[0].node, p[2].node)
+                    p[0].graph.add_edge(p[0].node, p[2].node)
 
                     if p[2].type is None or p[2].type == []:
                         self.symtab.error = True
@@ -2307,11 +2102,7 @@ class Parser:
                                 + bcolors.ENDC
                             )
                             return
-                        elif (
-                            len(p[2].type) > 0
-                            and p[2].type[0][-1] != "*"
-                            and ("*" not in p[2].type)
-                        ):
+                        elif len(p[2].type) > 0 and not ctype(p[2].type).is_pointer:
                             self.symtab.error = True
                             print(
                                 bcolors.FAIL
@@ -2324,10 +2115,7 @@ class Parser:
                             return
                         else:
                             p[0].is_var = 1
-                            p[0].type = p[2].type
-                            p[0].type[0] = p[0].type[0][:-1]
-                            if len(p[0].type) > 0 and p[0].type[0][-1] == " ":
-                                p[0].type[0] = p[0].type[0][:-1]
+                            p[0].type = list(ctype(p[2].type).element.words)
                             try:
                                 p[0].vars = p[2].vars
                             except:
@@ -2375,50 +2163,19 @@ class Parser:
                 if self.symtab.error == True:
                     return
 
-                if p[2].totype is not None and p[2].totype != p[2].type:
+                if p[2].totype is not None and ctype(p[2].totype) is not ctype(
+                    p[2].type
+                ):
 
-                    p2.temp = self.three_address_code.create_temp_var()
-                    self.symtab.insert_symbol(p2.temp, 0)
-                    self.symtab.modify_symbol(p2.temp, "data_type", p[2].totype)
-                    self.symtab.modify_symbol(p2.temp, "identifier_type", "TEMP")
-                    self.symtab_size_update(p[2].totype, p2.temp)
-                    if self.symtab.is_global(p2.temp):
-                        self.symtab.modify_symbol(p2.temp, "variable_scope", "Global")
-                    else:
-                        self.symtab.modify_symbol(p2.temp, "variable_scope", "Local")
-                        found, entry = self.symtab.return_sym_tab_entry(p2.temp)
-                        var_size = found["allocated_size"]
-                        if found["variable_scope"] == "Local":
-
-                            if found["offset"] > 0:
-                                self.symtab.modify_symbol(
-                                    p2.temp,
-                                    "temp",
-                                    f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                                )
-                            else:
-                                self.symtab.modify_symbol(
-                                    p2.temp,
-                                    "temp",
-                                    f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                                )
-                        p2.temp = found["temp"]
+                    p2.temp = self.new_temp(p[2].totype)
 
-                    currtype = []
-                    for single_type in p[2].type:
-                        if (
-                            single_type != "arr"
-                            and single_type[0] != "["
-                            and single_type[-1] != "]"
-                        ):
-                            currtype.append(single_type)
-                    cstr = "," + " ".join(currtype).replace(" ", "_")
+                    cstr = "," + ctype(p[2].type).cast_name
 
                     self.three_address_code.emit(
                         "cast",
                         p2.temp,
                         p[2].temp,
-                        " ".join(p[2].totype).replace(" ", "_") + cstr,
+                        ctype(p[2].totype).name + cstr,
                     )
 
                 else:
@@ -2429,12 +2186,6 @@ class Parser:
                         pass
 
                 p[0].var_name = p[2].var_name
-                p[0].temp = self.three_address_code.create_temp_var()
-
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-
                 if p[1].label == "UNARY*":
 
                     try:
@@ -2448,38 +2199,16 @@ class Parser:
                             + f"Invalid usage of UNARY* operator at line {p[1].lineno}"
                         )
                         return
-                    var_size = found["allocated_size"]
-                    self.symtab.modify_symbol(p[0].temp, "allocated_size", var_size)
-                else:
-                    self.symtab_size_update(p[0].type, p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
+                    p[0].temp = self.new_temp(p[0].type, found["allocated_size"])
                 else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
+                    p[0].temp = self.new_temp(p[0].type)
                 try:
                     self.three_address_code.emit(p[0].label, p[0].temp, p2.temp)
                 except:
                     self.three_address_code.emit(p[0].label, p[0].temp, p[2].temp)
 
                 if p[1].label == "UNARY*":
-                    p[0].temp = f"({p[0].temp})"
+                    p[0].temp = Indirect(p[0].temp)
 
                 if p[1].label[-1] == "!":
                     p[0].true_list = p[1].false_list
@@ -2496,32 +2225,7 @@ class Parser:
             if self.symtab.error == True:
                 return
 
-            p[0].temp = self.three_address_code.create_temp_var()
-            self.symtab.insert_symbol(p[0].temp, 0)
-            self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-            self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-            self.symtab_size_update(p[0].type, p[0].temp)
-            if self.symtab.is_global(p[0].temp):
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-            else:
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                var_size = found["allocated_size"]
-                if found["variable_scope"] == "Local":
-
-                    if found["offset"] > 0:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                        )
-                p[0].temp = found["temp"]
+            p[0].temp = self.new_temp(p[0].type)
 
             if p[3].type is None or p[3].type == []:
                 self.symtab.error = True
@@ -2537,7 +2241,7 @@ class Parser:
 
             if req_type in datatype_size:
                 self.three_address_code.emit(
-                    "=_int", p[0].temp, f"${datatype_size[req_type]}"
+                    "=_int", p[0].temp, Immediate(datatype_size[req_type])
                 )
             else:
                 self.symtab.error = True
@@ -2632,7 +2336,7 @@ class Parser:
                     + bcolors.ENDC
                 )
                 return
-            if "unsigned" in p[2].type and "signed" in p[2].type:
+            if ctype(p[2].type).is_unsigned and "signed" in p[2].type:
                 self.symtab.error = True
                 print(
                     bcolors.FAIL
@@ -2648,7 +2352,7 @@ class Parser:
                 if (
                     "int" in p[2].type
                     or "short" in p[2].type
-                    or "unsigned" in p[2].type
+                    or ctype(p[2].type).is_unsigned
                     or "signed" in p[2].type
                 ):
                     data_type_count += 1
@@ -2810,7 +2514,7 @@ class Parser:
             elif (
                 p[0].type[0] in ["bool", "char", "short", "int", "float"]
                 and p[4].type[0] not in ["bool", "char", "short", "int", "float"]
-                and p[4].type[0][-1] != "*"
+                and not ctype(p[4].type).is_pointer
             ):
                 self.symtab.error = True
                 print(
@@ -2823,7 +2527,7 @@ class Parser:
             elif (
                 "*" in p[2].type
                 and p[4].type[0] not in ["bool", "char", "short", "int"]
-                and p[4].type[0][-1] != "*"
+                and not ctype(p[4].type).is_pointer
             ):
                 self.symtab.error = True
                 print(
@@ -2839,46 +2543,14 @@ class Parser:
             if self.symtab.error == True:
                 return
 
-            p[0].temp = self.three_address_code.create_temp_var()
-            self.symtab.insert_symbol(p[0].temp, 0)
-            self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-            self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-            self.symtab_size_update(p[0].type, p[0].temp)
-            if self.symtab.is_global(p[0].temp):
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-            else:
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                var_size = found["allocated_size"]
-                if found["variable_scope"] == "Local":
-                    if found["offset"] > 0:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                        )
-                p[0].temp = found["temp"]
+            p[0].temp = self.new_temp(p[0].type)
 
-            currtype = []
-            for single_type in p[4].type:
-                if (
-                    single_type != "arr"
-                    and single_type[0] != "["
-                    and single_type[-1] != "]"
-                ):
-                    currtype.append(single_type)
-            cstr = "," + " ".join(currtype).replace(" ", "_")
+            cstr = "," + ctype(p[4].type).cast_name
             self.three_address_code.emit(
                 "cast",
                 p[0].temp,
                 p[4].temp,
-                " ".join(p[4].totype).replace(" ", "_") + cstr,
+                ctype(p[4].totype).name + cstr,
             )
             p[0].true_list.append(self.three_address_code.next_statement)
             p[0].false_list.append(self.three_address_code.next_statement + 1)
@@ -2912,114 +2584,21 @@ class Parser:
                     + str(p.lineno(2))
                     + bcolors.ENDC
                 )
+                return
 
-            elif str(p[2]) == "%":
-                if p[1].type[0] not in ["bool", "char", "short", "int"] or p[3].type[
-                    0
-                ] not in ["bool", "char", "short", "int"]:
-                    self.symtab.error = True
-                    print(
-                        bcolors.FAIL
-                        + "Cannot perform modulo operation between expressions of type {p[1].type} and {p[3].type} only line {p.lineno(2)}"
-                        + bcolors.ENDC
-                    )
-
-                    return
-                p0type = ["int"]
-                if "unsigned" in p[1].type or "unsigned" in p[3].type:
-                    p0type.append("unsigned")
-                p0typestr = "to"
-                for single_type in p0type:
-                    p0typestr += "_" + single_type
-                p0typestr = p0typestr.replace(" ", "_")
-
-                flag = True
-                for i in p0type:
-                    if i not in p[1].type:
-                        flag = False
-                if flag == False:
-                    p[1].totype = p0type
-                    p1 = Node(p0typestr, [p[1]])
-                else:
-                    p1 = p[1]
-
-                flag = True
-                for i in p0type:
-                    if i not in p[3].type:
-                        flag = False
-                if flag == False:
-                    p[3].totype = p0type
-                    p3 = Node(p0typestr, [p[3]])
-                else:
-                    p3 = p[3]
-
-                p[0] = Node(str(p[2]), [p1, p3])
-                p[0].type = p0type
-
-                p[0].label = p[0].label + "_" + p[0].type[0]
-
-                if len(p[0].type) == 2:
-                    p[0].label = p[0].label + "_" + p[0].type[1]
-
-                p[0].label = p[0].label.replace(" ", "_")
-
-                p[0].node.attr["label"] = p[0].label
+            conversion = binary_conversion(
+                str(p[2]), ctype(p[1].type), ctype(p[3].type)
+            )
+            if conversion is not None:
+                p1, p3 = self.binary_operation(p, conversion)
 
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0] in ["bool", "char", "short", "int", "float"]
-                and len(p[3].type) > 0
-                and p[3].type[0] in ["bool", "char", "short", "int", "float"]
-            ):
-                p0type = []
-                p0type.append(
-                    ["bool", "char", "short", "int", "float"][
-                        max(
-                            ["bool", "char", "short", "int", "float"].index(
-                                p[1].type[0]
-                            ),
-                            ["bool", "char", "short", "int", "float"].index(
-                                p[3].type[0]
-                            ),
-                        )
-                    ]
+            elif str(p[2]) == "%":
+                self.symtab.error = True
+                print(
+                    bcolors.FAIL
+                    + "Cannot perform modulo operation between expressions of type {p[1].type} and {p[3].type} only line {p.lineno(2)}"
+                    + bcolors.ENDC
                 )
-                if ("unsigned" in p[1].type or "unsigned" in p[3].type) and max(
-                    ["bool", "char", "short", "int", "float"].index(p[1].type[0]),
-                    ["bool", "char", "short", "int", "float"].index(p[3].type[0]),
-                ) <= 4:
-                    p0type.append("unsigned")
-                p0typestr = "to"
-                for single_type in p0type:
-                    p0typestr += "_" + single_type
-                p0typestr = p0typestr.replace(" ", "_")
-
-                isIn = True
-                for single_type in p0type:
-                    if single_type not in p[1].type:
-                        isIn = False
-                if isIn == False:
-                    p[1].totype = p0type
-                    p1 = Node(p0typestr, [p[1]])
-                else:
-                    p1 = p[1]
-                isIn = True
-                for single_type in p0type:
-                    if single_type not in p[3].type:
-                        isIn = False
-                if isIn == False:
-                    p[3].totype = p0type
-                    p3 = Node(p0typestr, [p[3]])
-                else:
-                    p3 = p[3]
-                p[0] = Node(str(p[2]), [p1, p3])
-                p[0].type = p0type
-
-                p[0].label = p[0].label + "_" + p[0].type[0]
-                if len(p[0].type) == 2:
-                    p[0].label = p[0].label + "_" + p[0].type[1]
-                p[0].label = p[0].label.replace(" ", "_")
-                p[0].node.attr["label"] = p[0].label
 
             else:
                 self.symtab.error = True
@@ -3036,124 +2615,7 @@ class Parser:
 
             if self.symtab.error == True:
                 return
-            if p[1].totype is not None and p[1].totype != p[1].type:
-                p1.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p1.temp, 0)
-                self.symtab.modify_symbol(p1.temp, "data_type", p[1].totype)
-                self.symtab.modify_symbol(p1.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[1].totype, p1.temp)
-                if self.symtab.is_global(p1.temp):
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p1.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p1.temp = found["temp"]
-
-                currtype = []
-                for single_type in p[1].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p1.temp,
-                    p[1].temp,
-                    " ".join(p[1].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p1.temp = p[1].temp
-            if p[3].totype is not None and p[3].totype != p[3].type:
-                p3.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p3.temp, 0)
-                self.symtab.modify_symbol(p3.temp, "data_type", p[3].totype)
-                self.symtab.modify_symbol(p3.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[3].totype, p3.temp)
-                if self.symtab.is_global(p3.temp):
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p3.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p3.temp = found["temp"]
-                currtype = []
-                for single_type in p[3].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p3.temp,
-                    p[3].temp,
-                    " ".join(p[3].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p3.temp = p[3].temp
-
-            p[0].temp = self.three_address_code.create_temp_var()
-            self.symtab.insert_symbol(p[0].temp, 0)
-            self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-            self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-            self.symtab_size_update(p[0].type, p[0].temp)
-            if self.symtab.is_global(p[0].temp):
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-            else:
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                var_size = found["allocated_size"]
-                if found["variable_scope"] == "Local":
-                    if found["offset"] > 0:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                        )
-                p[0].temp = found["temp"]
-            self.three_address_code.emit(p[0].label, p[0].temp, p1.temp, p3.temp)
-            p[0].true_list.append(self.three_address_code.next_statement)
-            p[0].false_list.append(self.three_address_code.next_statement + 1)
-            self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
-            self.three_address_code.emit("goto", "", "", "")
+            self.emit_binary(p, p1, p3)
 
     def p_additive_expression(self, p):
         """
@@ -3163,8 +2625,6 @@ class Parser:
         """
         if self.error == True:
             return
-        temp_list_aa = ["bool", "char", "short", "int", "float"]
-        temp_list_ii = ["bool", "char", "short", "int"]
         if len(p) == 2:
             p[0] = p[1]
         elif len(p) == 4:
@@ -3183,69 +2643,15 @@ class Parser:
                     + str(p.lineno(2))
                     + bcolors.ENDC
                 )
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0] in ["bool", "char", "short", "int", "float"]
-                and len(p[3].type) > 0
-                and p[3].type[0] in temp_list_aa
-            ):
-                p0type = []
-                p0type.append(
-                    temp_list_aa[
-                        max(
-                            temp_list_aa.index(p[1].type[0]),
-                            temp_list_aa.index(p[3].type[0]),
-                        )
-                    ]
-                )
-
-                if ("unsigned" in p[1].type or "unsigned" in p[3].type) and max(
-                    temp_list_aa.index(p[1].type[0]), temp_list_aa.index(p[3].type[0])
-                ) <= 2:
-                    p0type.append("unsigned")
-
-                p0typestr = "to"
-                for single_type in p0type:
-                    p0typestr += "_" + single_type
-
-                p0typestr = p0typestr.replace(" ", "_")
-
-                isIn = True
-                for single_type in p0type:
-                    if single_type not in p[1].type:
-                        isIn = False
-                if isIn == False:
-                    p[1].totype = p0type
-                    p1 = Node(p0typestr, [p[1]])
-                else:
-                    p1 = p[1]
-
-                isIn = True
-                for single_type in p0type:
-                    if single_type not in p[3].type:
-                        isIn = False
-                if isIn == False:
-                    p[3].totype = p0type
-                    p3 = Node(p0typestr, [p[3]])
-                else:
-                    p3 = p[3]
-
-                p[0] = Node(str(p[2]), [p1, p3])
-                p[0].type = p0type
-                p[0].label = p[0].label + "_" + p[0].type[0]
-
-                if len(p[0].type) == 2:
-                    p[0].label = p[0].label + "_" + p[0].type[1]
-                p[0].label = p[0].label.replace(" ", "_")
+                return
 
-                p[0].node.attr["label"] = p[0].label
+            conversion = binary_conversion(
+                str(p[2]), ctype(p[1].type), ctype(p[3].type)
+            )
+            if conversion is not None:
+                p1, p3 = self.binary_operation(p, conversion)
 
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0][-1] == "*"
-                and len(p[3].type) > 0
-                and p[3].type[0] in temp_list_ii
-            ):
+            elif ctype(p[1].type).is_pointer and p[3].type[0] in INTEGERS:
                 self.symtab.error = True
                 print(
                     bcolors.FAIL
@@ -3254,10 +2660,8 @@ class Parser:
                     + bcolors.ENDC
                 )
             elif (
-                len(p[3].type) > 0
-                and p[3].type[0][-1] == "*"
-                and len(p[1].type) > 0
-                and p[1].type[0] in ["bool", "char", "short", "int"]
+                ctype(p[3].type).is_pointer
+                and p[1].type[0] in INTEGERS
                 and str(p[2]) == "+"
             ):
                 self.symtab.error = True
@@ -3268,13 +2672,7 @@ class Parser:
                     + bcolors.ENDC
                 )
 
-            elif (
-                len(p[3].type) > 0
-                and p[3].type[0][-1] == "*"
-                and len(p[1].type) > 0
-                and p[1].type[0] in temp_list_ii
-                and str(p[2]) == "-"
-            ):
+            elif ctype(p[3].type).is_pointer and p[1].type[0] in INTEGERS:
                 self.symtab.error = True
                 print(
                     bcolors.FAIL
@@ -3296,128 +2694,7 @@ class Parser:
 
             if self.symtab.error == True:
                 return
-
-            if p[1].totype is not None and p[1].totype != p[1].type:
-                p1.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p1.temp, 0)
-                self.symtab.modify_symbol(p1.temp, "data_type", p[1].totype)
-                self.symtab.modify_symbol(p1.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[1].totype, p1.temp)
-                if self.symtab.is_global(p1.temp):
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p1.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p1.temp = found["temp"]
-                currtype = []
-                for single_type in p[1].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p1.temp,
-                    p[1].temp,
-                    " ".join(p[1].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p1.temp = p[1].temp
-            if p[3].totype is not None and p[3].totype != p[3].type:
-                p3.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p3.temp, 0)
-                self.symtab.modify_symbol(p3.temp, "data_type", p[3].totype)
-                self.symtab.modify_symbol(p3.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[3].totype, p3.temp)
-                if self.symtab.is_global(p3.temp):
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p3.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p3.temp = found["temp"]
-                currtype = []
-                for single_type in p[3].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p3.temp,
-                    p[3].temp,
-                    " ".join(p[3].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p3.temp = p[3].temp
-
-            p[0].temp = self.three_address_code.create_temp_var()
-            self.symtab.insert_symbol(p[0].temp, 0)
-            self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-            self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-            self.symtab_size_update(p[0].type, p[0].temp)
-            if self.symtab.is_global(p[0].temp):
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-            else:
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                var_size = found["allocated_size"]
-                if found["variable_scope"] == "Local":
-
-                    if found["offset"] > 0:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                        )
-                p[0].temp = found["temp"]
-            self.three_address_code.emit(p[0].label, p[0].temp, p1.temp, p3.temp)
-
-            p[0].true_list.append(self.three_address_code.next_statement)
-            p[0].false_list.append(self.three_address_code.next_statement + 1)
-            self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
-            self.three_address_code.emit("goto", "", "", "")
+            self.emit_binary(p, p1, p3)
 
     def p_shift_expression(self, p):
         """
@@ -3447,57 +2724,13 @@ class Parser:
                     + str(p.lineno(2))
                     + bcolors.ENDC
                 )
+                return
 
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0] in ["char", "short", "int"]
-                and p[3].type[0]
-                in [
-                    "char",
-                    "short",
-                    "int",
-                ]
-            ):
-                p0type = []
-                p0label = str(p[2])
-                p0typestr = "to"
-
-                p0type = ["int"]
-                p0label += "_int"
-                p0typestr += "_int"
-
-                if "unsigned" in p[1].type:
-                    p0type.append("unsigned")
-                    p0label += "_unsigned"
-                    p0typestr += "_unsigned"
-
-                flag = True
-
-                for i in p0type:
-                    if i not in p[1].type:
-                        flag = False
-                if flag == False:
-                    p[1].totype = p0type
-                    p1 = Node(p0typestr, [p[1]])
-                else:
-                    p1 = p[1]
-
-                isin = True
-                for single_type in p0type:
-                    if single_type not in p[3].type:
-                        isin = False
-                if isin == False:
-                    p[3].totype = p0type
-                    p3 = Node(p0typestr, [p[3]])
-                else:
-                    p3 = p[3]
-
-                p[0] = Node(str(p[2]), [p1, p[3]])
-                p[0].type = p0type
-                p[0].label = p0label
-                p[0].label = p[0].label.replace(" ", "_")
-
-                p[0].node.attr["label"] = p[0].label
+            conversion = binary_conversion(
+                str(p[2]), ctype(p[1].type), ctype(p[3].type)
+            )
+            if conversion is not None:
+                p1, p3 = self.binary_operation(p, conversion)
 
             else:
                 self.symtab.error = True
@@ -3514,126 +2747,7 @@ class Parser:
 
             if self.symtab.error == True:
                 return
-            if p[1].totype is not None and p[1].totype != p[1].type:
-                p1.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p1.temp, 0)
-                self.symtab.modify_symbol(p1.temp, "data_type", p[1].totype)
-                self.symtab.modify_symbol(p1.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[1].totype, p1.temp)
-                if self.symtab.is_global(p1.temp):
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p1.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p1.temp = found["temp"]
-                currtype = []
-                for single_type in p[1].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p1.temp,
-                    p[1].temp,
-                    " ".join(p[1].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p1.temp = p[1].temp
-            if p[3].totype is not None and p[3].totype != p[3].type:
-                p3.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p3.temp, 0)
-                self.symtab.modify_symbol(p3.temp, "data_type", p[3].totype)
-                self.symtab.modify_symbol(p3.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[3].totype, p3.temp)
-                if self.symtab.is_global(p3.temp):
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p3.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p3.temp = found["temp"]
-                currtype = []
-                for single_type in p[3].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p3.temp,
-                    p[3].temp,
-                    " ".join(p[3].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p3.temp = p[3].temp
-
-            p[0].temp = self.three_address_code.create_temp_var()
-            self.symtab.insert_symbol(p[0].temp, 0)
-            self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-            self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-            self.symtab_size_update(p[0].type, p[0].temp)
-            if self.symtab.is_global(p[0].temp):
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-            else:
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                var_size = found["allocated_size"]
-                if found["variable_scope"] == "Local":
-
-                    if found["offset"] > 0:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                        )
-                p[0].temp = found["temp"]
-            self.three_address_code.emit(p[0].label, p[0].temp, p1.temp, p3.temp)
-            p[0].true_list.append(self.three_address_code.next_statement)
-            p[0].false_list.append(self.three_address_code.next_statement + 1)
-            self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
-            self.three_address_code.emit("goto", "", "", "")
+            self.emit_binary(p, p1, p3)
 
     def p_relational_expression(self, p):
         """
@@ -3649,8 +2763,6 @@ class Parser:
             p[0] = p[1]
 
         elif len(p) == 4:
-
-            temp_list = ["bool", "char", "short", "int", "float"]
             if (
                 p[1] is None
                 or p[3] is None
@@ -3666,104 +2778,23 @@ class Parser:
                     + str(p.lineno(2))
                     + bcolors.ENDC
                 )
+                return
 
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0] in temp_list
-                and len(p[3].type) > 0
-                and p[3].type[0] in temp_list
-            ):
-                p[0] = Node(str(p[2]), [p[1], p[3]])
-                p0type = ["int"]
-                val = max(temp_list.index(p[1].type[0]), temp_list.index(p[3].type[0]))
-                p0label = (
-                    str(p[2])
-                    + "_"
-                    + ["bool", "char", "short", "int", "float"][
-                        max(
-                            temp_list.index(p[1].type[0]), temp_list.index(p[3].type[0])
-                        )
-                    ]
-                )
-
-                flag = 0
-                if "unsigned" in p[1].type or "unsigned" in p[3].type and val <= 2:
-                    flag = 1
-                    p0label = p0label + "_" + "unsigned"
-
-                p0label = p0label.replace(" ", "_")
-                p[1].totype = None
-                p[3].totype = None
-
-                if temp_list[val] not in p[1].type:
-                    p[1].totype = [temp_list[val]]
-                    if flag:
-                        p[1].totype.append("unsigned")
-                elif flag and "unsigned" not in p[1].type:
-                    p[1].totype = [temp_list[val], "unsigned"]
-
-                if p[1].totype != None and p[1].totype != p[1].type:
-                    p1str = "to"
-                    for single_type in p[1].totype:
-                        p1str = p1str + "_" + single_type
-                    p1 = Node(p1str, [p[1]])
-                else:
-                    p1 = p[1]
-
-                if temp_list[val] not in p[3].type:
-                    p[3].totype = [temp_list[val]]
-                    if flag:
-                        p[3].totype.append("unsigned")
-                elif flag and "unsigned" not in p[3].type:
-                    p[3].totype = [temp_list[val], "unsigned"]
+            conversion = binary_conversion(
+                str(p[2]), ctype(p[1].type), ctype(p[3].type)
+            )
+            if conversion is not None:
+                p1, p3 = self.binary_operation(p, conversion)
 
-                if p[3].totype != None and p[3].totype != p[3].type:
-                    p3str = "to"
-                    for single_type in p[3].totype:
-                        p3str = p3str + "_" + single_type
-                    p3 = Node(p3str, [p[3]])
-                else:
-                    p3 = p[3]
+            elif p[1].type[0] == "str" and p[3].type[0] == "str":
+                p1, p3 = p[1], p[3]
                 p[0] = Node(str(p[2]), [p1, p3])
-                p[0].type = p0type
-                p[0].label = p0label
-                p[0].node.attr["label"] = p[0].label
-
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0] == "str"
-                and len(p[3].type) > 0
-                and p[3].type[0] == "str"
-            ):
-                p[0] = Node(str(p[2]), [p[1], p[3]])
                 p[0].type = ["int"]
                 p[0].label = p[0].label + "_str"
-                p[0].label = p[0].label.replace(" ", "_")
                 p[0].node.attr["label"] = p[0].label
 
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0][-1] == "*"
-                and len(p[3].type) > 0
-                and p[3].type[0] in ["float"]
-            ):
-                self.symtab.error = True
-                print(
-                    bcolors.FAIL
-                    + "Relational operation failed between incompatible types "
-                    + str(p[1].type)
-                    + " and "
-                    + str(p[3].type)
-                    + " on Line No.: "
-                    + str(p.lineno(2))
-                    + bcolors.ENDC
-                )
-
-            elif (
-                len(p[3].type) > 0
-                and p[3].type[0][-1] == "*"
-                and len(p[1].type) > 0
-                and p[1].type[0] in ["float"]
+            elif (ctype(p[1].type).is_pointer and p[3].type[0] == "float") or (
+                ctype(p[3].type).is_pointer and p[1].type[0] == "float"
             ):
                 self.symtab.error = True
                 print(
@@ -3778,22 +2809,11 @@ class Parser:
                 )
 
             elif (
-                (
-                    (len(p[3].type) > 0 and p[3].type[0][-1] == "*")
-                    or (len(p[1].type) > 0 and p[1].type[0][-1] == "*")
-                )
+                (ctype(p[3].type).is_pointer or ctype(p[1].type).is_pointer)
                 and "struct" not in p[1].type
                 and "struct" not in p[3].type
             ):
-                p[1].totype = ["int", "unsigned"]
-                p1 = Node("to_int_unsigned", [p[1]])
-                p[3].totype = ["int", "unsigned"]
-                p3 = Node("to_int_unsigned", [p[3]])
-                p[0] = Node(str(p[2]), [p1, p3])
-                p[0].type = ["int"]
-                p[0].label = p[0].label + "_*"
-                p[0].label = p[0].label.replace(" ", "_")
-                p[0].node.attr["label"] = p[0].label
+                p1, p3 = self.pointer_comparison(p)
 
             else:
                 self.symtab.error = True
@@ -3809,126 +2829,7 @@ class Parser:
                 )
             if self.symtab.error == True:
                 return
-            if p[1].totype is not None and p[1].totype != p[1].type:
-                p1.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p1.temp, 0)
-                self.symtab.modify_symbol(p1.temp, "data_type", p[1].totype)
-                self.symtab.modify_symbol(p1.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[1].totype, p1.temp)
-                if self.symtab.is_global(p1.temp):
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p1.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p1.temp = found["temp"]
-                currtype = []
-                for single_type in p[1].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p1.temp,
-                    p[1].temp,
-                    " ".join(p[1].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p1.temp = p[1].temp
-            if p[3].totype is not None and p[3].totype != p[3].type:
-                p3.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p3.temp, 0)
-                self.symtab.modify_symbol(p3.temp, "data_type", p[3].totype)
-                self.symtab.modify_symbol(p3.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[3].totype, p3.temp)
-                if self.symtab.is_global(p3.temp):
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p3.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p3.temp = found["temp"]
-                currtype = []
-                for single_type in p[3].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p3.temp,
-                    p[3].temp,
-                    " ".join(p[3].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p3.temp = p[3].temp
-
-            p[0].temp = self.three_address_code.create_temp_var()
-            self.symtab.insert_symbol(p[0].temp, 0)
-            self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-            self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-            self.symtab_size_update(p[0].type, p[0].temp)
-            if self.symtab.is_global(p[0].temp):
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-            else:
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                var_size = found["allocated_size"]
-                if found["variable_scope"] == "Local":
-
-                    if found["offset"] > 0:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                        )
-                p[0].temp = found["temp"]
-            self.three_address_code.emit(p[0].label, p[0].temp, p1.temp, p3.temp)
-            p[0].true_list.append(self.three_address_code.next_statement)
-            p[0].false_list.append(self.three_address_code.next_statement + 1)
-            self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
-            self.three_address_code.emit("goto", "", "", "")
+            self.emit_binary(p, p1, p3)
 
     def p_equality_expression(self, p):
         """
@@ -3941,9 +2842,6 @@ class Parser:
             return
 
         if len(p) == 4:
-
-            temp_list_a = ["bool", "char", "short", "int", "float"]
-
             if (
                 p[1] is None
                 or p[3] is None
@@ -3959,158 +2857,23 @@ class Parser:
                     + str(p.lineno(1))
                     + bcolors.ENDC
                 )
+                return
 
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0] in temp_list_a
-                and len(p[3].type) > 0
-                and p[3].type[0] in temp_list_a
-            ):
-                p0type = ["int"]
-                p0label = (
-                    str(p[2])
-                    + "_"
-                    + temp_list_a[
-                        max(
-                            temp_list_a.index(p[1].type[0]),
-                            temp_list_a.index(p[3].type[0]),
-                        )
-                    ]
-                )
-
-                flag = 0
-                if (
-                    "unsigned" in p[1].type
-                    or "unsigned" in p[3].type
-                    and max(
-                        temp_list_a.index(p[1].type[0]), temp_list_a.index(p[3].type[0])
-                    )
-                    > 0
-                    and max(
-                        temp_list_a.index(p[1].type[0]), temp_list_a.index(p[3].type[0])
-                    )
-                    < 5
-                ):
-                    flag = 1
-                    p0label = p0label + "_" + "unsigned"
-
-                p0label = p0label.replace(" ", "_")
-                p[1].totype = None
-                p[3].totype = None
-
-                if (
-                    temp_list_a[
-                        max(
-                            temp_list_a.index(p[1].type[0]),
-                            temp_list_a.index(p[3].type[0]),
-                        )
-                    ]
-                    not in p[1].type
-                ):
-                    p[1].totype = [
-                        temp_list_a[
-                            max(
-                                temp_list_a.index(p[1].type[0]),
-                                temp_list_a.index(p[3].type[0]),
-                            )
-                        ]
-                    ]
-                    if flag:
-                        p[1].totype.append("unsigned")
-                elif flag and "unsigned" not in p[1].type:
-                    p[1].totype = [
-                        temp_list_a[
-                            max(
-                                temp_list_a.index(p[1].type[0]),
-                                temp_list_a.index(p[3].type[0]),
-                            )
-                        ],
-                        "unsigned",
-                    ]
-
-                if p[1].totype != None and p[1].totype != p[1].type:
-                    p1str = "to"
-                    for single_type in p[1].totype:
-                        p1str = p1str + "_" + single_type
-                    p1 = Node(p1str, [p[1]])
-                else:
-                    p1 = p[1]
-
-                if (
-                    temp_list_a[
-                        max(
-                            temp_list_a.index(p[1].type[0]),
-                            temp_list_a.index(p[3].type[0]),
-                        )
-                    ]
-                    not in p[3].type
-                ):
-                    p[3].totype = [
-                        temp_list_a[
-                            max(
-                                temp_list_a.index(p[1].type[0]),
-                                temp_list_a.index(p[3].type[0]),
-                            )
-                        ]
-                    ]
-                    if flag:
-                        p[3].totype.append("unsigned")
-                elif flag and "unsigned" not in p[3].type:
-                    p[3].totype = [
-                        temp_list_a[
-                            max(
-                                temp_list_a.index(p[1].type[0]),
-                                temp_list_a.index(p[3].type[0]),
-                            )
-                        ],
-                        "unsigned",
-                    ]
-
-                if p[3].totype != None and p[3].totype != p[3].type:
-                    p3str = "to"
-                    for single_type in p[3].totype:
-                        p3str += "_" + single_type
-                    p3 = Node(p3str, [p[3]])
-                else:
-                    p3 = p[3]
+            conversion = binary_conversion(
+                str(p[2]), ctype(p[1].type), ctype(p[3].type)
+            )
+            if conversion is not None:
+                p1, p3 = self.binary_operation(p, conversion)
 
+            elif p[1].type[0] == "str" and p[3].type[0] == "str":
+                p1, p3 = p[1], p[3]
                 p[0] = Node(str(p[2]), [p1, p3])
-                p[0].type = p0type
-                p[0].label = p0label
-                p[0].node.attr["label"] = p[0].label
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0] == "str"
-                and len(p[3].type) > 0
-                and p[3].type[0] == "str"
-            ):
-                p[0] = Node(str(p[2]), [p[1], p[3]])
                 p[0].type = ["int"]
                 p[0].label += "_str"
-                p[0].label = p[0].label.replace(" ", "_")
                 p[0].node.attr["label"] = p[0].label
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0][-1] == "*"
-                and len(p[3].type) > 0
-                and p[3].type[0] == "float"
-            ):
-                self.symtab.error = True
-                print(
-                    bcolors.FAIL
-                    + "Relational operation between incompatible types"
-                    + str(p[1].type)
-                    + " and "
-                    + str(p[3].type)
-                    + "on line "
-                    + str(p.lineno(1))
-                    + bcolors.ENDC
-                )
-            elif (
-                len(p[3].type) > 0
-                and p[3].type[0][-1] == "*"
-                and len(p[1].type) > 0
-                and p[1].type[0] == "float"
+
+            elif (ctype(p[1].type).is_pointer and p[3].type[0] == "float") or (
+                ctype(p[3].type).is_pointer and p[1].type[0] == "float"
             ):
                 self.symtab.error = True
                 print(
@@ -4123,24 +2886,14 @@ class Parser:
                     + str(p.lineno(1))
                     + bcolors.ENDC
                 )
+
             elif (
-                (
-                    (len(p[1].type) > 0 and p[1].type[0][-1] == "*")
-                    or (len(p[3].type) > 0 and p[3].type[0][-1] == "*")
-                )
+                (ctype(p[1].type).is_pointer or ctype(p[3].type).is_pointer)
                 and "struct" not in p[1].type
                 and "struct" not in p[3].type
             ):
-                p[1].totype = ["int", "unsigned"]
-                p1 = Node("to_int_unsigned", [p[1]])
-                p[3].totype = ["int", "unsigned"]
-                p3 = Node("to_int_unsigned", [p[3]])
+                p1, p3 = self.pointer_comparison(p)
 
-                p[0] = Node(str(p[2]), [p1, p3])
-                p[0].type = ["int"]
-                p[0].label += "_*"
-                p[0].label = p[0].label.replace(" ", "_")
-                p[0].node.attr["label"] = p[0].label
             else:
                 self.symtab.error = True
                 print(
@@ -4155,126 +2908,7 @@ class Parser:
                 )
             if self.symtab.error == True:
                 return
-            if p[1].totype is not None and p[1].totype != p[1].type:
-                p1.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p1.temp, 0)
-                self.symtab.modify_symbol(p1.temp, "data_type", p[1].totype)
-                self.symtab.modify_symbol(p1.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[1].totype, p1.temp)
-                if self.symtab.is_global(p1.temp):
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p1.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p1.temp = found["temp"]
-                currtype = []
-                for single_type in p[1].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p1.temp,
-                    p[1].temp,
-                    " ".join(p[1].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p1.temp = p[1].temp
-            if p[3].totype is not None and p[3].totype != p[3].type:
-                p3.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p3.temp, 0)
-                self.symtab.modify_symbol(p3.temp, "data_type", p[3].totype)
-                self.symtab.modify_symbol(p3.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[3].totype, p3.temp)
-                if self.symtab.is_global(p3.temp):
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p3.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p3.temp = found["temp"]
-
-                currtype = []
-                for single_type in p[3].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p3.temp,
-                    p[3].temp,
-                    " ".join(p[3].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p3.temp = p[3].temp
-            p[0].temp = self.three_address_code.create_temp_var()
-            self.symtab.insert_symbol(p[0].temp, 0)
-            self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-            self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-            self.symtab_size_update(p[0].type, p[0].temp)
-            if self.symtab.is_global(p[0].temp):
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-            else:
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                var_size = found["allocated_size"]
-                if found["variable_scope"] == "Local":
-
-                    if found["offset"] > 0:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                        )
-                p[0].temp = found["temp"]
-            self.three_address_code.emit(p[0].label, p[0].temp, p1.temp, p3.temp)
-            p[0].true_list.append(self.three_address_code.next_statement)
-            p[0].false_list.append(self.three_address_code.next_statement + 1)
-            self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
-            self.three_address_code.emit("goto", "", "", "")
+            self.emit_binary(p, p1, p3)
 
         elif len(p) == 2:
             p[0] = p[1]
@@ -4284,7 +2918,6 @@ class Parser:
         and_expression : equality_expression
                     | and_expression '&' equality_expression
         """
-        temp_list = ["bool", "char", "short", "int"]
         if self.error == True:
             return
         if len(p) == 2:
@@ -4306,194 +2939,36 @@ class Parser:
                     + str(p.lineno(2))
                     + bcolors.ENDC
                 )
-
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0] in temp_list
-                and len(p[3].type) > 0
-                and p[3].type[0] in temp_list
-            ):
-                p0type = ["int"]
-                p0label = str(p[2])
-
-                if "unsigned" in p[1].type or "unsigned" in p[3].type:
-                    p[0].type.append("unsigned")
-                    p[0].label += "unsigned"
-                p[0].node.attr["label"] = p[0].label
-
-                flag = True
-                for i in p0type:
-                    if i not in p[1].type:
-                        flag = False
-                if flag == False:
-                    p[1].totype = p0type
-                    strp1 = "to_"
-                    for single_type in p[1].totype:
-                        strp1 += single_type
-                    p1 = Node(strp1, [p[1]])
-                else:
-                    p1 = p[1]
-
-                flag = True
-                for i in p0type:
-                    if i not in p[3].type:
-                        flag = False
-                if flag == False:
-                    p[3].totype = p0type
-                    strp3 = "to_"
-                    for single_type in p[3].totype:
-                        strp3 += single_type
-                    p3 = Node(strp3, [p[3]])
-                else:
-                    p3 = p[3]
-
-                p[0] = Node(str(p[2]), [p1, p3])
-                p[0].type = p0type
-                p[0].label = p0label
-                p[0].node.attr["label"] = p[0].label
-
-            else:
-                self.symtab.error = True
-                print(
-                    bcolors.FAIL
-                    + "Unable to perform bitwise AND operation between incompatible expression types "
-                    + str(p[1].type)
-                    + " and "
-                    + str(p[3].type)
-                    + " on Line No.: "
-                    + str(p.lineno(2))
-                    + bcolors.ENDC
-                )
-
-            if self.symtab.error == True:
                 return
-            if p[1].totype is not None and p[1].totype != p[1].type:
-                p1.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p1.temp, 0)
-                self.symtab.modify_symbol(p1.temp, "data_type", p[1].totype)
-                self.symtab.modify_symbol(p1.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[1].totype, p1.temp)
-                if self.symtab.is_global(p1.temp):
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p1.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p1.temp = found["temp"]
-                currtype = []
-                for single_type in p[1].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p1.temp,
-                    p[1].temp,
-                    " ".join(p[1].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p1.temp = p[1].temp
-            if p[3].totype is not None and p[3].totype != p[3].type:
-                p3.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p3.temp, 0)
-                self.symtab.modify_symbol(p3.temp, "data_type", p[3].totype)
-                self.symtab.modify_symbol(p3.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[3].totype, p3.temp)
-                if self.symtab.is_global(p3.temp):
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p3.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p3.temp = found["temp"]
 
-                currtype = []
-                for single_type in p[3].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p3.temp,
-                    p[3].temp,
-                    " ".join(p[3].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p3.temp = p[3].temp
-            p[0].temp = self.three_address_code.create_temp_var()
-            self.symtab.insert_symbol(p[0].temp, 0)
-            self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-            self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-            self.symtab_size_update(p[0].type, p[0].temp)
-            if self.symtab.is_global(p[0].temp):
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
+            conversion = binary_conversion(
+                str(p[2]), ctype(p[1].type), ctype(p[3].type)
+            )
+            if conversion is not None:
+                p1, p3 = self.binary_operation(p, conversion)
+
             else:
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                var_size = found["allocated_size"]
-                if found["variable_scope"] == "Local":
+                self.symtab.error = True
+                print(
+                    bcolors.FAIL
+                    + "Unable to perform bitwise AND operation between incompatible expression types "
+                    + str(p[1].type)
+                    + " and "
+                    + str(p[3].type)
+                    + " on Line No.: "
+                    + str(p.lineno(2))
+                    + bcolors.ENDC
+                )
 
-                    if found["offset"] > 0:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                        )
-                p[0].temp = found["temp"]
-            self.three_address_code.emit(p[0].label, p[0].temp, p1.temp, p3.temp)
-            p[0].true_list.append(self.three_address_code.next_statement)
-            p[0].false_list.append(self.three_address_code.next_statement + 1)
-            self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
-            self.three_address_code.emit("goto", "", "", "")
+            if self.symtab.error == True:
+                return
+            self.emit_binary(p, p1, p3)
 
     def p_exclusive_or_expression(self, p):
         """
         exclusive_or_expression : and_expression
                                 | exclusive_or_expression '^' and_expression
         """
-        temp_list_ii = ["bool", "char", "short", "int"]
         if self.error == True:
             return
 
@@ -4515,51 +2990,13 @@ class Parser:
                     + str(p.lineno(2))
                     + bcolors.ENDC
                 )
+                return
 
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0] in temp_list_ii
-                and len(p[3].type) > 0
-                and p[3].type[0] in temp_list_ii
-            ):
-                p0type = ["int"]
-                p0label = str(p[2])
-
-                if "unsigned" in p[1].type or "unsigned" in p[3].type:
-                    p0type.append("unsigned")
-                    p[0].label += "_unsigned"
-
-                p0label = p0label.replace(" ", "_")
-
-                isIn = 1
-                for single_type in p0type:
-                    if single_type not in p[1].type:
-                        isIn = 0
-                if isIn == 0:
-                    p[1].totype = p0type
-                    strp1 = "to_"
-                    for single_type in p[1].totype:
-                        strp1 += single_type
-                    p1 = Node(strp1, [p[1]])
-                else:
-                    p1 = p[1]
-
-                isIn = 1
-                for single_type in p0type:
-                    if single_type not in p[3].type:
-                        isIn = 0
-                if isIn == 0:
-                    p[3].totype = p0type
-                    strp3 = "to_"
-                    for single_type in p[3].totype:
-                        strp3 += single_type
-                    p3 = Node(strp3, [p[3]])
-                else:
-                    p3 = p[3]
-                p[0] = Node(str(p[2]), [p1, p3])
-                p[0].type = p0type
-                p[0].label = p0label
-                p[0].node.attr["label"] = p[0].label
+            conversion = binary_conversion(
+                str(p[2]), ctype(p[1].type), ctype(p[3].type)
+            )
+            if conversion is not None:
+                p1, p3 = self.binary_operation(p, conversion)
 
             else:
                 self.symtab.error = True
@@ -4576,135 +3013,13 @@ class Parser:
                 )
             if self.symtab.error == True:
                 return
-
-            if p[1].totype is not None and p[1].totype != p[1].type:
-                p1.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p1.temp, 0)
-                self.symtab.modify_symbol(p1.temp, "data_type", p[1].totype)
-                self.symtab.modify_symbol(p1.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[1].totype, p1.temp)
-                if self.symtab.is_global(p1.temp):
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p1.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p1.temp = found["temp"]
-                currtype = []
-                for single_type in p[1].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p1.temp,
-                    p[1].temp,
-                    " ".join(p[1].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p1.temp = p[1].temp
-            if p[3].totype is not None and p[3].totype != p[3].type:
-                p3.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p3.temp, 0)
-                self.symtab.modify_symbol(p3.temp, "data_type", p[3].totype)
-                self.symtab.modify_symbol(p3.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[3].totype, p3.temp)
-                if self.symtab.is_global(p3.temp):
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p3.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p3.temp = found["temp"]
-
-                currtype = []
-                for single_type in p[3].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p3.temp,
-                    p[3].temp,
-                    " ".join(p[3].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p3.temp = p[3].temp
-
-            p[0].temp = self.three_address_code.create_temp_var()
-            self.symtab.insert_symbol(p[0].temp, 0)
-            self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-            self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-            self.symtab_size_update(p[0].type, p[0].temp)
-            if self.symtab.is_global(p[0].temp):
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-            else:
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                var_size = found["allocated_size"]
-                if found["variable_scope"] == "Local":
-
-                    if found["offset"] > 0:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                        )
-                p[0].temp = found["temp"]
-            self.three_address_code.emit(p[0].label, p[0].temp, p1.temp, p3.temp)
-            p[0].true_list.append(self.three_address_code.next_statement)
-            p[0].false_list.append(self.three_address_code.next_statement + 1)
-            self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
-            self.three_address_code.emit("goto", "", "", "")
+            self.emit_binary(p, p1, p3)
 
     def p_inclusive_or_expression(self, p):
         """
         inclusive_or_expression : exclusive_or_expression
                                 | inclusive_or_expression '|' exclusive_or_expression
         """
-        temp_list = ["bool", "char", "short", "int"]
         if self.error == True:
             return
         if len(p) == 2:
@@ -4726,50 +3041,13 @@ class Parser:
                     + str(p.lineno(2))
                     + bcolors.ENDC
                 )
+                return
 
-            elif (
-                len(p[1].type) > 0
-                and p[1].type[0] in temp_list
-                and len(p[3].type) > 0
-                and p[3].type[0] in temp_list
-            ):
-                p0type = ["int"]
-                p0label = str(p[2])
-
-                if "unsigned" in p[1].type or "unsigned" in p[3].type:
-                    p[0].type.append("unsigned")
-                    p[0].label += "_unsigned"
-
-                flag = True
-                for i in p0type:
-                    if i not in p[1].type:
-                        flag = False
-                if flag == False:
-                    p[1].totype = p0type
-                    strp1 = "to_"
-                    for single_type in p[1].totype:
-                        strp1 += single_type
-                    p1 = Node(strp1, [p[1]])
-                else:
-                    p1 = p[1]
-                flag = True
-
-                for i in p0type:
-                    if i not in p[3].type:
-                        flag = False
-                if flag == False:
-                    p[3].totype = p0type
-                    strp3 = "to_"
-                    for single_type in p[3].totype:
-                        strp3 += single_type
-                    p3 = Node(strp3, [p[3]])
-                else:
-                    p3 = p[3]
-
-                p[0] = Node(str(p[2]), [p1, p3])
-                p[0].type = p0type
-                p[0].label = p0label
-                p[0].node.attr["label"] = p[0].label
+            conversion = binary_conversion(
+                str(p[2]), ctype(p[1].type), ctype(p[3].type)
+            )
+            if conversion is not None:
+                p1, p3 = self.binary_operation(p, conversion)
 
             else:
                 self.symtab.error = True
@@ -4787,128 +3065,7 @@ class Parser:
 
             if self.symtab.error == True:
                 return
-
-            if p[1].totype is not None and p[1].totype != p[1].type:
-                p1.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p1.temp, 0)
-                self.symtab.modify_symbol(p1.temp, "data_type", p[1].totype)
-                self.symtab.modify_symbol(p1.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[1].totype, p1.temp)
-                if self.symtab.is_global(p1.temp):
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p1.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p1.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p1.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p1.temp = found["temp"]
-                currtype = []
-                for single_type in p[1].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p1.temp,
-                    p[1].temp,
-                    " ".join(p[1].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p1.temp = p[1].temp
-            if p[3].totype is not None and p[3].totype != p[3].type:
-                p3.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p3.temp, 0)
-                self.symtab.modify_symbol(p3.temp, "data_type", p[3].totype)
-                self.symtab.modify_symbol(p3.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[3].totype, p3.temp)
-                if self.symtab.is_global(p3.temp):
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p3.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p3.temp = found["temp"]
-
-                currtype = []
-                for single_type in p[3].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
-                self.three_address_code.emit(
-                    "cast",
-                    p3.temp,
-                    p[3].temp,
-                    " ".join(p[3].totype).replace(" ", "_") + cstr,
-                )
-            else:
-                p3.temp = p[3].temp
-
-            p[0].temp = self.three_address_code.create_temp_var()
-            self.symtab.insert_symbol(p[0].temp, 0)
-            self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-            self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-            self.symtab_size_update(p[0].type, p[0].temp)
-            if self.symtab.is_global(p[0].temp):
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-            else:
-                self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                var_size = found["allocated_size"]
-                if found["variable_scope"] == "Local":
-
-                    if found["offset"] > 0:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            p[0].temp,
-                            "temp",
-                            f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                        )
-                p[0].temp = found["temp"]
-            self.three_address_code.emit(p[0].label, p[0].temp, p1.temp, p3.temp)
-            p[0].true_list.append(self.three_address_code.next_statement)
-            p[0].false_list.append(self.three_address_code.next_statement + 1)
-            self.three_address_code.emit("ifnz goto", "", p[0].temp, "")
-            self.three_address_code.emit("goto", "", "", "")
+            self.emit_binary(p, p1, p3)
 
     def p_logical_and_expression(self, p):
         """logical_and_expression : inclusive_or_expression
@@ -4951,33 +3108,8 @@ class Parser:
                 self.three_address_code.backpatch(p[1].false_list, p[5].quadruples)
                 p[0].false_list = p[1].false_list + p[4].false_list
                 p[0].true_list = p[4].true_list
-                p[0].temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[0].type, p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
-                self.three_address_code.emit("=_int", p[0].temp, "$0", "")
+                p[0].temp = self.new_temp(p[0].type)
+                self.three_address_code.emit("=_int", p[0].temp, Immediate(0), "")
                 self.three_address_code.emit(
                     "ifnz goto",
                     self.three_address_code.next_statement + 3,
@@ -4996,7 +3128,7 @@ class Parser:
                 self.three_address_code.emit(
                     "goto", self.three_address_code.next_statement + 3, "", ""
                 )
-                self.three_address_code.emit("=_int", p[0].temp, "$1", "")
+                self.three_address_code.emit("=_int", p[0].temp, Immediate(1), "")
 
     def p_logical_or_expression(self, p):
         """logical_or_expression : logical_and_expression
@@ -5040,34 +3172,9 @@ class Parser:
                 self.three_address_code.backpatch(p[1].true_list, p[5].quadruples)
                 p[0].true_list = p[1].true_list + p[4].true_list
                 p[0].false_list = p[4].false_list
-                p[0].temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[0].type, p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
+                p[0].temp = self.new_temp(p[0].type)
 
-                self.three_address_code.emit("=_int", p[0].temp, "$1", "")
+                self.three_address_code.emit("=_int", p[0].temp, Immediate(1), "")
                 self.three_address_code.emit(
                     "ifnz goto",
                     self.three_address_code.next_statement + 4,
@@ -5080,7 +3187,7 @@ class Parser:
                     p[4].temp,
                     "",
                 )
-                self.three_address_code.emit("=_int", p[0].temp, "$0", "")
+                self.three_address_code.emit("=_int", p[0].temp, Immediate(0), "")
 
     def p_conditional_expression(self, p):
         """conditional_expression : logical_or_expression
@@ -5088,7 +3195,6 @@ class Parser:
         """
         temp_list_aa = ["bool", "char", "short", "int", "float"]
         temp_list_ii = ["bool", "char", "short", "int"]
-        temp_list_di = ["char", "short", "int"]
         if self.error == True:
             return
         if len(p) == 2:
@@ -5171,7 +3277,7 @@ class Parser:
                 return
             elif (
                 p[4].type[0] not in temp_list_aa
-                and p[4].type[0][-1] != "*"
+                and not ctype(p[4].type).is_pointer
                 and p[7].type[0] in temp_list_aa
             ):
                 self.symtab.error = True
@@ -5184,8 +3290,8 @@ class Parser:
                 return
 
             elif (
-                p[4].type[0][-1] == "*"
-                and p[7].type[0][-1] != "*"
+                ctype(p[4].type).is_pointer
+                and not ctype(p[7].type).is_pointer
                 and p[7].type[0] not in temp_list_ii
             ):
                 self.symtab.error = True
@@ -5199,8 +3305,8 @@ class Parser:
                 )
                 return
             elif (
-                p[7].type[0][-1] == "*"
-                and p[4].type[0][-1] != "*"
+                ctype(p[7].type).is_pointer
+                and not ctype(p[4].type).is_pointer
                 and p[4].type[0] not in temp_list_ii
             ):
                 self.symtab.error = True
@@ -5214,26 +3320,27 @@ class Parser:
                 )
                 return
             error_flag = False
+            conversion = binary_conversion("?", ctype(p[4].type), ctype(p[7].type))
             if p[4].type == p[7].type:
                 p0type = p[4].type
 
             elif (
                 len(p[4].type) > 0
-                and p[4].type[0][-1] == "*"
+                and ctype(p[4].type).is_pointer
                 and len(p[7].type) > 0
-                and p[7].type[0][-1] == "*"
+                and ctype(p[7].type).is_pointer
             ):
                 p0type = ["void *"]
 
             elif (
                 len(p[4].type) > 0
-                and p[4].type[0][-1] == "*"
+                and ctype(p[4].type).is_pointer
                 or len(p[7].type) > 0
-                and p[7].type[0][-1] == "*"
+                and ctype(p[7].type).is_pointer
             ):
-                if p[4].type[0][-1] == "*":
+                if ctype(p[4].type).is_pointer:
                     p0type = p[4].type
-                elif p[7].type[0][-1] == "*":
+                elif ctype(p[7].type).is_pointer:
                     p0type = p[7].type
 
             elif "str" in p[4].type:
@@ -5241,27 +3348,8 @@ class Parser:
             elif "str" in p[7].type:
                 p0type = p[4].type
 
-            elif (
-                len(p[4].type) > 0
-                and p[4].type[0] in temp_list_aa
-                and len(p[7].type) > 0
-                and p[7].type[0] in temp_list_aa
-            ):
-                p0type = []
-                p0type.append(
-                    temp_list_aa[
-                        max(
-                            temp_list_aa.index(p[4].type[0]),
-                            temp_list_aa.index(p[7].type[0]),
-                        )
-                    ]
-                )
-                if (
-                    "unsigned" in p[4].type
-                    or "unsigned" in p[7].type
-                    and p0type[0] in temp_list_di
-                ):
-                    p0type.append("unsigned")
+            elif conversion is not None:
+                p0type = list(conversion.type)
             else:
                 error_flag = True
             if not error_flag:
@@ -5286,137 +3374,36 @@ class Parser:
                 if self.symtab.error == True:
                     return
                 p[4].totype = p0type
-                p4type = []
-                for single_type in p[4].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        p4type.append(single_type)
-                if p[4].totype is not None and p[4].totype != p4type:
-                    p4.temp = self.three_address_code.create_temp_var()
-                    self.symtab.insert_symbol(p4.temp, 0)
-                    self.symtab.modify_symbol(p4.temp, "data_type", p[4].totype)
-                    self.symtab.modify_symbol(p4.temp, "identifier_type", "TEMP")
-                    self.symtab_size_update(p[4].totype, p4.temp)
-                    if self.symtab.is_global(p4.temp):
-                        self.symtab.modify_symbol(p4.temp, "variable_scope", "Global")
-                    else:
-                        self.symtab.modify_symbol(p4.temp, "variable_scope", "Local")
-                        found, entry = self.symtab.return_sym_tab_entry(p4.temp)
-                        var_size = found["allocated_size"]
-                        if found["variable_scope"] == "Local":
-
-                            if found["offset"] > 0:
-                                self.symtab.modify_symbol(
-                                    p4.temp,
-                                    "temp",
-                                    f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                                )
-                            else:
-                                self.symtab.modify_symbol(
-                                    p4.temp,
-                                    "temp",
-                                    f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                                )
-                        p4.temp = found["temp"]
-                    currtype = []
-                    for single_type in p[4].type:
-                        if (
-                            single_type != "arr"
-                            and single_type[0] != "["
-                            and single_type[-1] != "]"
-                        ):
-                            currtype.append(single_type)
-                    cstr = "," + " ".join(currtype).replace(" ", "_")
+                if (
+                    p[4].totype is not None
+                    and ctype(p[4].totype) is not ctype(p[4].type).plain
+                ):
+                    p4.temp = self.new_temp(p[4].totype)
+                    cstr = "," + ctype(p[4].type).cast_name
                     self.three_address_code.emit(
                         "cast",
                         p4.temp,
                         p[4].temp,
-                        " ".join(p[4].totype).replace(" ", "_") + cstr,
+                        ctype(p[4].totype).name + cstr,
                     )
                 else:
                     p4.temp = p[4].temp
                 p[7].totype = p0type
-                p7type = []
-                for single_type in p[7].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        p7type.append(single_type)
-                if p[7].totype is not None and p[7].totype != p7type:
-                    p7.temp = self.three_address_code.create_temp_var()
-                    self.symtab.insert_symbol(p7.temp, 0)
-                    self.symtab.modify_symbol(p7.temp, "data_type", p[7].totype)
-                    self.symtab.modify_symbol(p7.temp, "identifier_type", "TEMP")
-                    self.symtab_size_update(p[7].totype, p7.temp)
-                    if self.symtab.is_global(p7.temp):
-                        self.symtab.modify_symbol(p7.temp, "variable_scope", "Global")
-                    else:
-                        self.symtab.modify_symbol(p7.temp, "variable_scope", "Local")
-                        found, entry = self.symtab.return_sym_tab_entry(p7.temp)
-                        var_size = found["allocated_size"]
-                        if found["variable_scope"] == "Local":
-
-                            if found["offset"] > 0:
-                                self.symtab.modify_symbol(
-                                    p7.temp,
-                                    "temp",
-                                    f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                                )
-                            else:
-                                self.symtab.modify_symbol(
-                                    p7.temp,
-                                    "temp",
-                                    f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                                )
-                        p7.temp = found["temp"]
-                    currtype = []
-                    for single_type in p[7].type:
-                        if (
-                            single_type != "arr"
-                            and single_type[0] != "["
-                            and single_type[-1] != "]"
-                        ):
-                            currtype.append(single_type)
-                    cstr = "," + " ".join(currtype).replace(" ", "_")
+                if (
+                    p[7].totype is not None
+                    and ctype(p[7].totype) is not ctype(p[7].type).plain
+                ):
+                    p7.temp = self.new_temp(p[7].totype)
+                    cstr = "," + ctype(p[7].type).cast_name
                     self.three_address_code.emit(
                         "cast",
                         p7.temp,
                         p[7].temp,
-                        " ".join(p[7].totype).replace(" ", "_") + cstr,
+                        ctype(p[7].totype).name + cstr,
                     )
                 else:
                     p7.temp = p[7].temp
-                p[0].temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p[0].temp, 0)
-                self.symtab.modify_symbol(p[0].temp, "data_type", p[0].type)
-                self.symtab.modify_symbol(p[0].temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[0].type, p[0].temp)
-                if self.symtab.is_global(p[0].temp):
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p[0].temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p[0].temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p[0].temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p[0].temp = found["temp"]
+                p[0].temp = self.new_temp(p[0].type)
 
                 self.three_address_code.emit(
                     "ifnz goto",
@@ -5471,7 +3458,7 @@ class Parser:
                             + bcolors.ENDC
                         )
 
-                    elif p[1].type[0][-1] == "*" and "arr" in p[1].type:
+                    elif ctype(p[1].type).is_pointer and ctype(p[1].type).is_array:
                         self.symtab.error = True
                         print(
                             bcolors.FAIL
@@ -5526,7 +3513,7 @@ class Parser:
 
                     elif (
                         p[1].type[0] not in ["bool", "char", "short", "int", "float"]
-                        and p[1].type[0][-1] != "*"
+                        and not ctype(p[1].type).is_pointer
                         and p[3].type[0] in ["bool", "char", "short", "int", "float"]
                     ):
                         self.symtab.error = True
@@ -5538,8 +3525,8 @@ class Parser:
                         )
 
                     elif (
-                        p[1].type[0][-1] == "*"
-                        and p[3].type[0][-1] != "*"
+                        ctype(p[1].type).is_pointer
+                        and not ctype(p[3].type).is_pointer
                         and p[3].type[0] not in ["bool", "char", "short", "int"]
                     ):
                         self.symtab.error = True
@@ -5554,7 +3541,7 @@ class Parser:
                         )
 
                     elif (
-                        p[1].type[0][-1] == "*"
+                        ctype(p[1].type).is_pointer
                         and p[3].type[0] in ["bool", "char", "short", "int"]
                         and p[2].label[0] not in ["+", "-", "="]
                     ):
@@ -5598,11 +3585,11 @@ class Parser:
 
                         if "struct" in p[0].type:
                             p[0].label += "_struct"
-                        elif p[0].type[0][-1] == "*":
+                        elif ctype(p[0].type).is_pointer:
                             p[0].label += "_int_unsigned"
                         else:
                             p[0].label += "_" + p[0].type[0]
-                            if "unsigned" in p[0].type:
+                            if ctype(p[0].type).is_unsigned:
                                 p[0].label += "_unsigned"
                         p[0].label = p[0].label.replace(" ", "_")
                         p[0].node.attr["label"] = p[0].label
@@ -5613,48 +3600,15 @@ class Parser:
                     p[0].insert_edge([p[3]])
             if self.symtab.error == True:
                 return
-            if p[3].totype is not None and p[3].totype != p[3].type:
-                p3.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p3.temp, 0)
-                self.symtab.modify_symbol(p3.temp, "data_type", p[3].totype)
-                self.symtab.modify_symbol(p3.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[3].totype, p3.temp)
-                if self.symtab.is_global(p3.temp):
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p3.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p3.temp = found["temp"]
+            if p[3].totype is not None and ctype(p[3].totype) is not ctype(p[3].type):
+                p3.temp = self.new_temp(p[3].totype)
 
-                currtype = []
-                for single_type in p[3].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
+                cstr = "," + ctype(p[3].type).cast_name
                 self.three_address_code.emit(
                     "cast",
                     p3.temp,
                     p[3].temp,
-                    " ".join(p[3].totype).replace(" ", "_") + cstr,
+                    ctype(p[3].totype).name + cstr,
                 )
             else:
                 p3.temp = p[3].temp
@@ -5677,86 +3631,23 @@ class Parser:
 
             for var in data_struc["vars"].keys():
 
-                if p1temp[0] == "(":
-                    left_new_temp = self.three_address_code.create_temp_var()
-                    self.symtab.insert_symbol(left_new_temp, 0)
-                    self.symtab.modify_symbol(
-                        left_new_temp, "data_type", ["int", "unsigned"]
-                    )
-                    self.symtab.modify_symbol(left_new_temp, "identifier_type", "TEMP")
-                    self.symtab_size_update(["int", "unsigned"], left_new_temp)
-                    if self.symtab.is_global(left_new_temp):
-                        self.symtab.modify_symbol(
-                            left_new_temp, "variable_scope", "Global"
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            left_new_temp, "variable_scope", "Local"
-                        )
-                        found, entry = self.symtab.return_sym_tab_entry(left_new_temp)
-                        var_size = found["allocated_size"]
-                        if found["variable_scope"] == "Local":
-                            if found["offset"] > 0:
-                                self.symtab.modify_symbol(
-                                    left_new_temp,
-                                    "temp",
-                                    f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                                )
-                            else:
-                                self.symtab.modify_symbol(
-                                    left_new_temp,
-                                    "temp",
-                                    f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                                )
-                        left_new_temp = found["temp"]
+                if type(p1temp) is Indirect:
+                    left_new_temp = self.new_temp(["int", "unsigned"])
                     self.three_address_code.emit(
-                        "+_int", left_new_temp, p1temp[1:-1], f"${currOffset}"
+                        "+_int", left_new_temp, p1temp.pointer, Immediate(currOffset)
                     )
-                    left_new_temp = f"({left_new_temp})"
+                    left_new_temp = Indirect(left_new_temp)
                 else:
-                    left_offset = int(p1temp.split("(")[0])
-                    left_new_temp = f"{left_offset+currOffset}(%ebp)"
+                    left_new_temp = FrameSlot(p1temp.offset + currOffset)
 
-                if p3temp[0] == "(":
-                    right_new_temp = self.three_address_code.create_temp_var()
-                    self.symtab.insert_symbol(right_new_temp, 0)
-                    self.symtab.modify_symbol(
-                        right_new_temp, "data_type", ["int", "unsigned"]
-                    )
-                    self.symtab.modify_symbol(right_new_temp, "identifier_type", "TEMP")
-                    self.symtab_size_update(["int", "unsigned"], right_new_temp)
-                    if self.symtab.is_global(right_new_temp):
-                        self.symtab.modify_symbol(
-                            right_new_temp, "variable_scope", "Global"
-                        )
-                    else:
-                        self.symtab.modify_symbol(
-                            right_new_temp, "variable_scope", "Local"
-                        )
-                        found, entry = self.symtab.return_sym_tab_entry(right_new_temp)
-                        var_size = found["allocated_size"]
-                        if found["variable_scope"] == "Local":
-
-                            if found["offset"] > 0:
-                                self.symtab.modify_symbol(
-                                    right_new_temp,
-                                    "temp",
-                                    f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                                )
-                            else:
-                                self.symtab.modify_symbol(
-                                    right_new_temp,
-                                    "temp",
-                                    f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                                )
-                        right_new_temp = found["temp"]
+                if type(p3temp) is Indirect:
+                    right_new_temp = self.new_temp(["int", "unsigned"])
                     self.three_address_code.emit(
-                        "+_int", right_new_temp, p3temp[1:-1], f"${currOffset}"
+                        "+_int", right_new_temp, p3temp.pointer, Immediate(currOffset)
                     )
-                    right_new_temp = f"({right_new_temp})"
+                    right_new_temp = Indirect(right_new_temp)
                 else:
-                    right_offset = int(p3temp.split("(")[0])
-                    right_new_temp = f"{right_offset+currOffset}(%ebp)"
+                    right_new_temp = FrameSlot(p3temp.offset + currOffset)
 
                 if "*" in data_struc["vars"][var]["data_type"]:
                     self.three_address_code.emit(
@@ -6308,7 +4199,7 @@ class Parser:
 
                 elif (
                     p[1].type[0] not in temp_list_aa
-                    and p[1].type[0][-1] != "*"
+                    and not ctype(p[1].type).is_pointer
                     and p[3].type[0] in temp_list_aa
                 ):
                     self.symtab.error = True
@@ -6319,7 +4210,7 @@ class Parser:
                         + bcolors.ENDC
                     )
 
-                elif "arr" in p[1].type and "init_list" not in p[3].type:
+                elif ctype(p[1].type).is_array and "init_list" not in p[3].type:
                     self.symtab.error = True
                     print(
                         bcolors.FAIL
@@ -6329,10 +4220,10 @@ class Parser:
                     )
 
                 elif (
-                    "arr" not in p[1].type
-                    and p[1].type[0][-1] == "*"
+                    not ctype(p[1].type).is_array
+                    and ctype(p[1].type).is_pointer
                     and p[3].type[0] not in temp_list_ii
-                    and p[3].type[0][-1] != "*"
+                    and not ctype(p[3].type).is_pointer
                     and "str" not in p[3].type
                 ):
                     self.symtab.error = True
@@ -6356,7 +4247,7 @@ class Parser:
                         isIn = False
                 if (
                     isIn == False
-                    and "arr" not in p[1].type
+                    and not ctype(p[1].type).is_array
                     and "init_list" not in p[3].type
                 ):
                     p[3].totype = p[0].type
@@ -6376,13 +4267,13 @@ class Parser:
                     p[0].label += "_struct"
                 elif (
                     len(p[0].type) > 0
-                    and p[0].type[0][-1] == "*"
-                    and "arr" not in p[0].type
+                    and ctype(p[0].type).is_pointer
+                    and not ctype(p[0].type).is_array
                 ):
                     p[0].label += "_int unsigned"
                 else:
                     p[0].label += "_" + p[0].type[0]
-                    if "unsigned" in p[0].type:
+                    if ctype(p[0].type).is_unsigned:
                         p[0].label += "_unsigned"
                 p[0].label = p[0].label.replace(" ", "_")
                 p[0].node.attr["label"] = p[0].label
@@ -6398,24 +4289,17 @@ class Parser:
                 found, entry = self.symtab.return_sym_tab_entry(var_name, p.lineno(1))
                 if found and found["variable_scope"] == "Local":
                     for var in found["vars"]:
-                        found["vars"][var][
-                            "temp"
-                        ] = f'-{-found["vars"][var]["offset"] + self.symtab.offset}(%ebp)'
+                        found["vars"][var]["temp"] = FrameSlot(
+                            found["vars"][var]["offset"] - self.symtab.offset
+                        )
             found, entry = self.symtab.return_sym_tab_entry(var_name)
             if found["variable_scope"] == "Local":
 
-                if found["offset"] > 0:
-                    self.symtab.modify_symbol(
-                        var_name,
-                        "temp",
-                        f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                    )
-                else:
-                    self.symtab.modify_symbol(
-                        var_name,
-                        "temp",
-                        f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                    )
+                self.symtab.modify_symbol(
+                    var_name,
+                    "temp",
+                    FrameSlot(-found["offset"] - found["allocated_size"]),
+                )
             p[0].temp = found["temp"]
         if len(p) == 4:
             if self.symtab.error == True:
@@ -6426,46 +4310,13 @@ class Parser:
                 and "init_list" not in p[3].type
                 and "arr" not in p[3].totype
             ):
-                p3.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p3.temp, 0)
-                self.symtab.modify_symbol(p3.temp, "data_type", p[3].totype)
-                self.symtab.modify_symbol(p3.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[3].totype, p3.temp)
-                if self.symtab.is_global(p3.temp):
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p3.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p3.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p3.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p3.temp = found["temp"]
-                currtype = []
-                for single_type in p[3].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
+                p3.temp = self.new_temp(p[3].totype)
+                cstr = "," + ctype(p[3].type).cast_name
                 self.three_address_code.emit(
                     "cast",
                     p3.temp,
                     p[3].temp,
-                    " ".join(p[3].totype).replace(" ", "_") + cstr,
+                    ctype(p[3].totype).name + cstr,
                 )
             else:
                 p3.temp = p[3].temp
@@ -6532,11 +4383,11 @@ class Parser:
         if self.error == True:
             return
         p[0] = p[1]
-        p[0].type += [p[2]["lexeme"]]
+        p[0].type += [p[2].lexeme]
 
         if len(p) == 8:
-            p2val = p[2]["lexeme"]
-            p[2] = Node(str([p[2]["lexeme"]]))
+            p2val = p[2].lexeme
+            p[2] = Node(str([p[2].lexeme]))
 
             p[0].node.attr["label"] = p[0].node.attr["label"] + "{}"
             p[0].label = p[0].node.attr["label"]
@@ -6570,7 +4421,7 @@ class Parser:
             datatype_size[f"{p[1].type[0]} {p2val}"] = struct_size
 
         elif len(p) == 3:
-            pval = p[2]["lexeme"]
+            pval = p[2].lexeme
             p[2] = Node(str(pval))
             if (
                 self.symtab.return_type_tab_entry_su(
@@ -6598,9 +4449,9 @@ class Parser:
         """
         if self.error == True:
             return
-        identity = p[-2]["lexeme"]
+        identity = p[-2].lexeme
         type_name = p[-3].label.upper()
-        line_num = p[-2]["additional"]["line"]
+        line_num = p[-2].line
         self.symtab.flag = 1
         self.symtab.insert_symbol(identity, line_num, type_name)
         self.symtab.flag = 2
@@ -6649,7 +4500,7 @@ class Parser:
             )
             return
 
-        if "signed" in p[1].type and "unsigned" in p[1].type:
+        if "signed" in p[1].type and ctype(p[1].type).is_unsigned:
             self.symtab.error = True
             print(
                 bcolors.FAIL
@@ -6664,7 +4515,7 @@ class Parser:
                 "char" in p[1].type
                 or "short" in p[1].type
                 or "int" in p[1].type
-                or "unsigned" in p[1].type
+                or ctype(p[1].type).is_unsigned
                 or "signed" in p[1].type
             ):
                 count = count + 1
@@ -7358,31 +5209,7 @@ class Parser:
                             self.three_address_code.code[i]
                         )
                         self.three_address_code.next_statement += 1
-                    temp = self.three_address_code.create_temp_var()
-                    self.symtab.insert_symbol(temp, 0)
-                    self.symtab.modify_symbol(temp, "data_type", ["int"])
-                    self.symtab.modify_symbol(temp, "identifier_type", "TEMP")
-                    self.symtab_size_update(["int"], temp)
-                    if self.symtab.is_global(temp):
-                        self.symtab.modify_symbol(temp, "variable_scope", "Global")
-                    else:
-                        self.symtab.modify_symbol(temp, "variable_scope", "Local")
-                        found, entry = self.symtab.return_sym_tab_entry(temp)
-                        var_size = found["allocated_size"]
-                        if found["variable_scope"] == "Local":
-                            if found["offset"] > 0:
-                                self.symtab.modify_symbol(
-                                    temp,
-                                    "temp",
-                                    f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                                )
-                            else:
-                                self.symtab.modify_symbol(
-                                    temp,
-                                    "temp",
-                                    f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                                )
-                        temp = found["temp"]
+                    temp = self.new_temp(["int"])
                     self.three_address_code.emit("==", temp, p[3].temp, item[0])
                     tmplist = [self.three_address_code.next_statement]
                     self.three_address_code.emit("ifnz goto", "", temp, "")
@@ -7582,8 +5409,7 @@ class Parser:
                 p[0].break_list.append(self.three_address_code.next_statement)
                 self.three_address_code.emit("goto", "", "", "")
             elif p[1] == "return":
-                found = list(self.symtab.table[0])
-                functype = self.symtab.table[0][found[-1]]["data_type"]
+                functype = self.symtab.table[0].last_symbol()["data_type"]
 
                 if functype != ["void"]:
                     self.symtab.error = True
@@ -7600,11 +5426,11 @@ class Parser:
                 self.three_address_code.emit("retq", "", "", "")
         else:
             p[0] = Node("RETURN")
-            found = list(self.symtab.table[0])
-            if not "data_type" in self.symtab.table[0][found[-1]].keys():
+            found = self.symtab.table[0].last_symbol()
+            if not "data_type" in found:
                 self.symtab.error = True
                 return
-            functype = self.symtab.table[0][found[-1]]["data_type"]
+            functype = found["data_type"]
             if functype is None:
                 functype = []
 
@@ -7640,7 +5466,7 @@ class Parser:
                 and len(functype) > 0
                 and functype[0] in ["bool", "char", "short", "int", "float"]
                 and p[2].type[0] not in ["bool", "char", "short", "int", "float"]
-                and p[2].type[0][-1] != "*"
+                and not ctype(p[2].type).is_pointer
             ):
                 self.symtab.error = True
                 print(
@@ -7782,46 +5608,14 @@ class Parser:
             p[0].insert_edge([p2])
             if self.symtab.error == True:
                 return
-            if p[2].totype is not None and p[2].totype != p[2].type:
-                p2.temp = self.three_address_code.create_temp_var()
-                self.symtab.insert_symbol(p2.temp, 0)
-                self.symtab.modify_symbol(p2.temp, "data_type", p[2].totype)
-                self.symtab.modify_symbol(p2.temp, "identifier_type", "TEMP")
-                self.symtab_size_update(p[2].totype, p2.temp)
-                if self.symtab.is_global(p2.temp):
-                    self.symtab.modify_symbol(p2.temp, "variable_scope", "Global")
-                else:
-                    self.symtab.modify_symbol(p2.temp, "variable_scope", "Local")
-                    found, entry = self.symtab.return_sym_tab_entry(p2.temp)
-                    var_size = found["allocated_size"]
-                    if found["variable_scope"] == "Local":
-                        if found["offset"] > 0:
-                            self.symtab.modify_symbol(
-                                p2.temp,
-                                "temp",
-                                f'-{found["offset"] + found["allocated_size"] }(%ebp)',
-                            )
-                        else:
-                            self.symtab.modify_symbol(
-                                p2.temp,
-                                "temp",
-                                f'{-found["offset"] - found["allocated_size"] }(%ebp)',
-                            )
-                    p2.temp = found["temp"]
-                currtype = []
-                for single_type in p[2].type:
-                    if (
-                        single_type != "arr"
-                        and single_type[0] != "["
-                        and single_type[-1] != "]"
-                    ):
-                        currtype.append(single_type)
-                cstr = "," + " ".join(currtype).replace(" ", "_")
+            if p[2].totype is not None and ctype(p[2].totype) is not ctype(p[2].type):
+                p2.temp = self.new_temp(p[2].totype)
+                cstr = "," + ctype(p[2].type).cast_name
                 self.three_address_code.emit(
                     "cast",
                     p2.temp,
                     p[2].temp,
-                    " ".join(p[2].totype).replace(" ", "_") + cstr,
+                    ctype(p[2].totype).name + cstr,
                 )
             else:
                 p2.temp = p[2].temp
@@ -7893,7 +5687,7 @@ class Parser:
                 + bcolors.ENDC
             )
 
-        if "unsigned" in p[1].type and "signed" in p[1].type:
+        if ctype(p[1].type).is_unsigned and "signed" in p[1].type:
             self.symtab.error = True
             print(
                 bcolors.fail
@@ -7906,7 +5700,7 @@ class Parser:
             cnt = 0
             if (
                 "signed" in p[1].type
-                or "unsigned" in p[1].type
+                or ctype(p[1].type).is_unsigned
                 or "int" in p[1].type
                 or "short" in p[1].type
             ):
@@ -7977,18 +5771,11 @@ class Parser:
         if "void" in func_type and len(func_type) == 1:
             self.three_address_code.emit("retq", "", "", "")
         else:
-            self.three_address_code.emit("retq", "$0", "", "")
+            self.three_address_code.emit("retq", Immediate(0), "", "")
         self.three_address_code.emit("", "", "", "")
-        for var in entry["scope"][0]:
-            if var == "struct":
-                continue
-            if var == "scope":
-                continue
-            if var == "scope_num":
-                continue
+        for var, param in entry.scopes[0].symbols.items():
             if var[0] == "$":
                 continue
-            param = entry["scope"][0][var]
 
             temp_type_list = []
             temp2_type_list = []
@@ -8207,24 +5994,19 @@ class Parser:
                     found, entry = self.symtab.return_sym_tab_entry(var_name)
                     if found:
                         for var in found["vars"]:
-                            found["vars"][var][
-                                "temp"
-                            ] = f'{found["vars"][var]["offset"] + self.symtab.offset}(%ebp)'
+                            found["vars"][var]["temp"] = FrameSlot(
+                                found["vars"][var]["offset"] + self.symtab.offset
+                            )
 
                 found, entry = self.symtab.return_sym_tab_entry(var_name)
-                alignedSz = self.symtab.top_scope[var_name][szstr]
+                alignedSz = self.symtab.top_scope.symbols[var_name][szstr]
                 self.symtab.offset += alignedSz
                 self.symtab.modify_symbol(
                     var_name, "offset", -(self.symtab.offset), p.lineno(0)
                 )
-                if found["offset"] > 0:
-                    self.symtab.modify_symbol(
-                        var_name, "temp", f'-{found["offset"] + alignedSz}(%ebp)'
-                    )
-                else:
-                    self.symtab.modify_symbol(
-                        var_name, "temp", f'{-found["offset"] - alignedSz}(%ebp)'
-                    )
+                self.symtab.modify_symbol(
+                    var_name, "temp", FrameSlot(-found["offset"] - alignedSz)
+                )
 
         self.symtab.modify_symbol(function_name, "num_parameters", param_nums)
         self.symtab.offset = 0
@@ -8249,246 +6031,143 @@ class Parser:
         """
         if self.error == True:
             return
-        # printf with 2 arguments (string, placeholder value)
-        self.symtab.insert_symbol("printf", -1)
-        self.symtab.modify_symbol("printf", "identifier_type", "function")
-        self.symtab.modify_symbol("printf", "data_type", ["void"])
-        self.symtab.modify_symbol("printf", "num_parameters", 2)
-
-        # scanf with 2 arguments (string, placeholder value)
-        self.symtab.insert_symbol("scanf", -1)
-        self.symtab.modify_symbol("scanf", "identifier_type", "function")
-        self.symtab.modify_symbol("scanf", "data_type", ["void"])
-        self.symtab.modify_symbol("scanf", "num_parameters", 2)
-
-        # abs with a single argument
-        self.symtab.insert_symbol("abs", -1)
-        self.symtab.modify_symbol("abs", "identifier_type", "function")
-        self.symtab.modify_symbol("abs", "data_type", ["int"])
-        self.symtab.modify_symbol("abs", "num_parameters", 1)
-
-        # sqrt with a single argument
-        self.symtab.insert_symbol("sqrt", -1)
-        self.symtab.modify_symbol("sqrt", "identifier_type", "function")
-        self.symtab.modify_symbol("sqrt", "data_type", ["float"])
-        self.symtab.modify_symbol("sqrt", "num_parameters", 1)
-
-        # ceil with a single argument
-        self.symtab.insert_symbol("ceil", -1)
-        self.symtab.modify_symbol("ceil", "identifier_type", "function")
-        self.symtab.modify_symbol("ceil", "data_type", ["float"])
-        self.symtab.modify_symbol("ceil", "num_parameters", 1)
-
-        # floor with a single argument
-        self.symtab.insert_symbol("floor", -1)
-        self.symtab.modify_symbol("floor", "identifier_type", "function")
-        self.symtab.modify_symbol("floor", "data_type", ["float"])
-        self.symtab.modify_symbol("floor", "num_parameters", 1)
-
-        # pow with  2 arguments
-        self.symtab.insert_symbol("pow", -1)
-        self.symtab.modify_symbol("pow", "identifier_type", "function")
-        self.symtab.modify_symbol("pow", "data_type", ["float"])
-        self.symtab.modify_symbol("pow", "num_parameters", 2)
-
-        # fabs with a single argument
-        self.symtab.insert_symbol("fabs", -1)
-        self.symtab.modify_symbol("fabs", "identifier_type", "function")
-        self.symtab.modify_symbol("fabs", "data_type", ["float"])
-        self.symtab.modify_symbol("fabs", "num_parameters", 1)
-
-        # log with a single argument
-        self.symtab.insert_symbol("log", -1)
-        self.symtab.modify_symbol("log", "identifier_type", "function")
-        self.symtab.modify_symbol("log", "data_type", ["float"])
-        self.symtab.modify_symbol("log", "num_parameters", 1)
-
-        # log10 with a single argument
-        self.symtab.insert_symbol("log10", -1)
-        self.symtab.modify_symbol("log10", "identifier_type", "function")
-        self.symtab.modify_symbol("log10", "data_type", ["float"])
-        self.symtab.modify_symbol("log10", "num_parameters", 1)
-
-        # fmod with  2 arguments
-        self.symtab.insert_symbol("fmod", -1)
-        self.symtab.modify_symbol("fmod", "identifier_type", "function")
-        self.symtab.modify_symbol("fmod", "data_type", ["float"])
-        self.symtab.modify_symbol("fmod", "num_parameters", 2)
-
-        # exp with a single argument
-        self.symtab.insert_symbol("exp", -1)
-        self.symtab.modify_symbol("exp", "identifier_type", "function")
-        self.symtab.modify_symbol("exp", "data_type", ["float"])
-        self.symtab.modify_symbol("exp", "num_parameters", 1)
-
-        # cos with a single argument
-        self.symtab.insert_symbol("cos", -1)
-        self.symtab.modify_symbol("cos", "identifier_type", "function")
-        self.symtab.modify_symbol("cos", "data_type", ["float"])
-        self.symtab.modify_symbol("cos", "num_parameters", 1)
-
-        # sin with a single argument
-        self.symtab.insert_symbol("sin", -1)
-        self.symtab.modify_symbol("sin", "identifier_type", "function")
-        self.symtab.modify_symbol("sin", "data_type", ["float"])
-        self.symtab.modify_symbol("sin", "num_parameters", 1)
-
-        # acos with a single argument
-        self.symtab.insert_symbol("acos", -1)
-        self.symtab.modify_symbol("acos", "identifier_type", "function")
-        self.symtab.modify_symbol("acos", "data_type", ["float"])
-        self.symtab.modify_symbol("acos", "num_parameters", 1)
-
-        # asin with a single argument
-        self.symtab.insert_symbol("asin", -1)
-        self.symtab.modify_symbol("asin", "identifier_type", "function")
-        self.symtab.modify_symbol("asin", "data_type", ["float"])
-        self.symtab.modify_symbol("asin", "num_parameters", 1)
-
-        # tan with a single argument
-        self.symtab.insert_symbol("tan", -1)
-        self.symtab.modify_symbol("tan", "identifier_type", "function")
-        self.symtab.modify_symbol("tan", "data_type", ["float"])
-        self.symtab.modify_symbol("tan", "num_parameters", 1)
-
-        # atan with a single argument
-        self.symtab.insert_symbol("atan", -1)
-        self.symtab.modify_symbol("atan", "identifier_type", "function")
-        self.symtab.modify_symbol("atan", "data_type", ["float"])
-        self.symtab.modify_symbol("atan", "num_parameters", 1)
-
-        # strlen with a single argument
-        self.symtab.insert_symbol("strlen", -1)
-        self.symtab.modify_symbol("strlen", "identifier_type", "function")
-        self.symtab.modify_symbol("strlen", "data_type", ["int"])
-        self.symtab.modify_symbol("strlen", "num_parameters", 1)
-
-        # strlwr with a single argument
-        self.symtab.insert_symbol("strlwr", -1)
-        self.symtab.modify_symbol("strlwr", "identifier_type", "function")
-        self.symtab.modify_symbol("strlwr", "data_type", ["char", "*"])
-        self.symtab.modify_symbol("strlwr", "num_parameters", 1)
-
-        # strupr with a single argument
-        self.symtab.insert_symbol("strupr", -1)
-        self.symtab.modify_symbol("strupr", "identifier_type", "function")
-        self.symtab.modify_symbol("strupr", "data_type", ["char", "*"])
-        self.symtab.modify_symbol("strupr", "num_parameters", 1)
-
-        # strcpy with a single argument
-        self.symtab.insert_symbol("strcpy", -1)
-        self.symtab.modify_symbol("strcpy", "identifier_type", "function")
-        self.symtab.modify_symbol("strcpy", "data_type", ["char", "*"])
-        self.symtab.modify_symbol("strcpy", "num_parameters", 2)
-
-        # strcat with a single argument
-        self.symtab.insert_symbol("strcat", -1)
-        self.symtab.modify_symbol("strcat", "identifier_type", "function")
-        self.symtab.modify_symbol("strcat", "data_type", ["char", "*"])
-        self.symtab.modify_symbol("strcat", "num_parameters", 2)
-
-        # strcmp with a single argument
-        self.symtab.insert_symbol("strcmp", -1)
-        self.symtab.modify_symbol("strcmp", "identifier_type", "function")
-        self.symtab.modify_symbol("strcmp", "data_type", ["int"])
-        self.symtab.modify_symbol("strcmp", "num_parameters", 2)
-
-        self.symtab.insert_symbol("strrev", -1)
-        self.symtab.modify_symbol("strrev", "identifier_type", "function")
-        self.symtab.modify_symbol("strrev", "data_type", ["char", "*"])
-        self.symtab.modify_symbol("strrev", "num_parameters", 1)
-
-        # malloc with 1 arguments
-        self.symtab.insert_symbol("malloc", -1)
-        self.symtab.modify_symbol("malloc", "identifier_type", "function")
-        self.symtab.modify_symbol("malloc", "data_type", ["void", "*"])
-        self.symtab.modify_symbol("malloc", "num_parameters", 1)
-
-        # calloc with 1 arguments
-        self.symtab.insert_symbol("calloc", -1)
-        self.symtab.modify_symbol("calloc", "identifier_type", "function")
-        self.symtab.modify_symbol("calloc", "data_type", ["void", "*"])
-        self.symtab.modify_symbol("calloc", "num_parameters", 2)
-
-        # realloc with 1 arguments
-        self.symtab.insert_symbol("realloc", -1)
-        self.symtab.modify_symbol("realloc", "identifier_type", "function")
-        self.symtab.modify_symbol("realloc", "data_type", ["void", "*"])
-        self.symtab.modify_symbol("realloc", "num_parameters", 2)
-
-        # free with 1 arguments
-        self.symtab.insert_symbol("free", -1)
-        self.symtab.modify_symbol("free", "identifier_type", "function")
-        self.symtab.modify_symbol("free", "data_type", ["void"])
-        self.symtab.modify_symbol("free", "num_parameters", 1)
+        self.symtab.declare_builtins(self.builtins)
 
     def printTree(self):
         self.ast_root.print_val()
 
 
-def new_node(G=None, node_num=None, edge=None):
-    global num_nodes
-    num_nodes = num_nodes + 1
-    graph.add_node(num_nodes - 1)
-    node = graph.get_node(num_nodes - 1)
-    return node
-
+def print_syntax_error(p):
+    # points at the token the parser did not expect in its line, the token
+    # ends where the lexer stopped. yacc passes None at the end of the input.
+    if p is None:
+        print(
+            bcolors.FAIL + "SyntaxError: " + bcolors.ENDC,
+            "Unexpected end of input",
+            file=sys.stderr,
+        )
+        return
+    line, position = find_position(p.lexer, p.lexpos)
+    text = line_text(p.lexer, line)
+    end = position + max(p.lexer.lexpos - p.lexpos, 1)
+    print(
+        bcolors.BOLD + "{}:{}:".format(line, position) + bcolors.ENDC,
+        end="",
+        file=sys.stderr,
+    )
+    print(
+        bcolors.FAIL + " SyntaxError: " + bcolors.ENDC,
+        "Unexpected token {}".format(p.value),
+        file=sys.stderr,
+    )
+    print("     {} |{}".format(line, text[: position - 1]), end="", file=sys.stderr)
+    print(
+        bcolors.WARNING
+        + bcolors.UNDERLINE
+        + "{}".format(text[position - 1 : end - 1])
+        + bcolors.ENDC
+        + bcolors.ENDC,
+        end="",
+        file=sys.stderr,
+    )
+    print("{}".format(text[end - 1 :]), file=sys.stderr)
 
-def remove_node(node, node_num=None):
-    graph.remove_node(node)
 
+def new_node(G, node_num=None, edge=None):
+    return G.add_node()
 
-aparser = argparse.ArgumentParser()
-aparser.add_argument(
-    "-d", "--debug", action="store_true", help="Parser Debug Mode", default=False
-)
-aparser.add_argument(
-    "-o", "--out", help="Store output of parser in a file", default=None
-)
-aparser.add_argument("infile", help="Input File")
-args = aparser.parse_args()
 
-with open(args.infile, "r") as f:
-    inp = f.read()
+def remove_node(node, node_num=None, G=None):
+    G.remove_node(node)
 
-lex = Lexer(error_func)
-lex.build()
-lex.lexer.input(inp)
-tokens = lex.tokens
-lex.lexer.lineno = 1
-lex.lexer.lines = inp.split("\n")
 
-parser = Parser()
-parser.build()
-result = parser.parser.parse(inp, lexer=lex.lexer)
+def remove_tables():
+    sys.modules.pop(TABLE_MODULE, None)
+    table_file = os.path.join(TABLE_DIR, TABLE_MODULE + ".py")
+    if os.path.exists(table_file):
+        os.remove(table_file)
 
-fname = args.infile.split("/")[-1].split(".")[0]
-ast = "dot/" + fname + ".dot"
 
-if parser.error:
-    print(
-        bcolors.FAIL
-        + "Error found. Aborting parsing of "
-        + str(sys.argv[1])
-        + "...."
-        + bcolors.ENDC
+if __name__ == "__main__":
+    aparser = argparse.ArgumentParser()
+    aparser.add_argument(
+        "-d", "--debug", action="store_true", help="Parser Debug Mode", default=False
+    )
+    aparser.add_argument(
+        "-o", "--out", help="Store output of parser in a file", default=None
+    )
+    aparser.add_argument(
+        "--rebuild-tables",
+        action="store_true",
+        help="Regenerate the shipped LALR tables",
+        default=False,
     )
-    sys.exit(0)
-elif parser.symtab.error:
-    print(bcolors.FAIL + "Error in semantic analysis." + bcolors.ENDC)
-    sys.exit(0)
-else:
-    # print("Output Symbol Table CSV is at out/symtab/" + fname + ".csv")
-    # print("Output AST is at dot/" + fname + ".dot")
-    # print("Output TAC is at out/tac/" + fname + ".txt")
-
-    symtab_csv = open("out/symtab/" + fname + ".csv", "w")
-    graph.write(ast)
-    orig_stdout = sys.stdout
-    sys.stdout = symtab_csv
-    parser.symtab.print_table()
-    symtab_csv.close()
-    tac = open("out/tac/" + fname + ".txt", "w")
-    sys.stdout = tac
-    parser.three_address_code.print_code()
-    tac.close()
+    aparser.add_argument(
+        "--no-ast",
+        action="store_true",
+        help="Do not produce the AST graph",
+        default=False,
+    )
+    aparser.add_argument(
+        "--symtab",
+        choices=["csv", "jsonl"],
+        help="Also write the symbol table as CSV or JSON Lines",
+        default=None,
+    )
+    aparser.add_argument("infile", nargs="?", help="Input File")
+    args = aparser.parse_args()
+
+    if args.infile is None:
+        if not args.rebuild_tables:
+            aparser.error("the following arguments are required: infile")
+        Parser().build(debug=args.debug, rebuild_tables=True)
+        sys.exit(0)
+
+    with open(args.infile, "r") as f:
+        inp = f.read()
+
+    lex = Lexer(error_func)
+    lex.build()
+    lex.lexer.input(inp)
+    lex.lexer.lineno = 1
+
+    parser = Parser(ast=not args.no_ast)
+    parser.build(debug=args.debug, rebuild_tables=args.rebuild_tables)
+    result = parser.parse(inp, lexer=lex.lexer)
+
+    fname = args.infile.split("/")[-1].split(".")[0]
+    ast = "dot/" + fname + ".dot"
+
+    if parser.error:
+        print(
+            bcolors.FAIL
+            + "Error found. Aborting parsing of "
+            + str(args.infile)
+            + "...."
+            + bcolors.ENDC
+        )
+        sys.exit(0)
+    elif parser.symtab.error:
+        print(bcolors.FAIL + "Error in semantic analysis." + bcolors.ENDC)
+        sys.exit(0)
+    else:
+        # print("Output Symbol Table CSV is at out/symtab/" + fname + ".csv")
+        # print("Output AST is at dot/" + fname + ".dot")
+        # print("Output TAC is at out/tac/" + fname + ".txt")
+
+        if args.symtab:
+            os.makedirs("out/symtab", exist_ok=True)
+            path = "out/symtab/" + fname + "." + args.symtab
+            with open(path, "w", newline="") as f:
+                if args.symtab == "jsonl":
+                    parser.symtab.write_jsonl(f)
+                else:
+                    parser.symtab.write_csv(f)
+        if not args.no_ast:
+            parser.graph.write(ast)
+        orig_stdout = sys.stdout
+        os.makedirs("out/tac", exist_ok=True)
+        tac = open("out/tac/" + fname + ".txt", "w")
+        sys.stdout = tac
+        parser.three_address_code.print_code()
+        tac.close()
@@ -0,0 +1,232 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "startnonassocIF_STATEMENTSnonassocELSEADD_ASSIGN AND_ASSIGN AND_OP BOOL BREAK CASE CHAR CHAR_CONSTANT CONTINUE DEC_OP DEFAULT DIV_ASSIGN DO ELSE EQ_OP FALSE FLOAT FLOAT_CONSTANT FOR GE_OP IDENTIFIER IF INC_OP INT INTEGER_CONSTANT LEFT_ASSIGN LEFT_OP LE_OP MOD_ASSIGN MUL_ASSIGN NE_OP OR_ASSIGN OR_OP PTR_OP RETURN RIGHT_ASSIGN RIGHT_OP SHORT SIGNED SIZEOF STRING_CONSTANT STRUCT SUB_ASSIGN SWITCH TRUE UNSIGNED VOID WHILE XOR_ASSIGN\n        start : push_lib_functions translation_unit\n        bool_constant : TRUE\n        | FALSE\n        integer_constant : INTEGER_CONSTANTfloat_constant : FLOAT_CONSTANTchar_constant : CHAR_CONSTANTstring_constant : STRING_CONSTANT\n        primary_expression : IDENTIFIER\n                        | integer_constant\n                        | float_constant\n                        | char_constant\n                        | bool_constant\n                        | string_constant\n                        | '(' expression ')'\n        identifier : IDENTIFIER\n        postfix_expression : primary_expression\n                        | postfix_expression '[' expression ']'\n                        | postfix_expression '(' ')'\n                        | postfix_expression '(' argument_expression_list ')'\n                        | postfix_expression '.' IDENTIFIER\n                        | postfix_expression PTR_OP IDENTIFIER\n                        | postfix_expression INC_OP\n                        | postfix_expression DEC_OP\n        \n        argument_expression_list : assignment_expression\n                                | argument_expression_list ',' assignment_expression\n        \n        unary_expression : postfix_expression\n                        | INC_OP unary_expression\n                        | DEC_OP unary_expression\n                        | unary_operator cast_expression\n                        | SIZEOF unary_expression\n                        | SIZEOF '(' type_name ')'\n        \n        unary_operator : '&'\n                    | '*'\n                    | '+'\n                    | '-'\n                    | '~'\n                    | '!'\n        \n        cast_expression : unary_expression\n                        | '(' type_name ')' cast_expression\n        \n        multiplicative_expression : cast_expression\n                                | multiplicative_expression '*' cast_expression\n                                | multiplicative_expression '/' cast_expression\n                                | multiplicative_expression '%' cast_expression\n        \n        additive_expression : multiplicative_expression\n                            | additive_expression '+' multiplicative_expression\n                            | additive_expression '-' multiplicative_expression\n        \n        shift_expression : additive_expression\n                        | shift_expression LEFT_OP additive_expression\n                        | shift_expression RIGHT_OP additive_expression\n        \n        relational_expression : shift_expression\n                            | relational_expression '<' shift_expression\n                            | relational_expression '>' shift_expression\n                            | relational_expression LE_OP shift_expression\n                            | relational_expression GE_OP shift_expression\n        \n        equality_expression : relational_expression\n                            | equality_expression EQ_OP relational_expression\n                            | equality_expression NE_OP relational_expression\n        \n        and_expression : equality_expression\n                    | and_expression '&' equality_expression\n        \n        exclusive_or_expression : and_expression\n                                | exclusive_or_expression '^' and_expression\n        \n        inclusive_or_expression : exclusive_or_expression\n                                | inclusive_or_expression '|' exclusive_or_expression\n        logical_and_expression : inclusive_or_expression\n        | logical_and_expression AND_OP marker_global inclusive_or_expression marker_global\n        logical_or_expression : logical_and_expression\n        | logical_or_expression OR_OP marker_global logical_and_expression marker_global\n        conditional_expression : logical_or_expression\n        | logical_or_expression '?' marker_global expression ':' marker_global conditional_expression marker_global\n        \n        assignment_expression : conditional_expression\n                            | unary_expression assignment_operator assignment_expression\n        \n        assignment_operator : '='\n                            | MUL_ASSIGN\n                            | DIV_ASSIGN\n                            | MOD_ASSIGN\n                            | ADD_ASSIGN\n                            | SUB_ASSIGN\n                            | LEFT_ASSIGN\n                            | RIGHT_ASSIGN\n                            | AND_ASSIGN\n                            | XOR_ASSIGN\n                            | OR_ASSIGN\n        \n        expression : assignment_expression\n                | expression ',' assignment_expression\n        \n        constant_expression\t: conditional_expression\n        \n        initializer : assignment_expression\n        declaration\t: declaration_specifiers ';'\n        | declaration_specifiers init_declarator_list ';'\n        declaration_specifiers : type_specifier\n        | type_specifier declaration_specifiers\n        init_declarator_list : init_declarator\n        | init_declarator_list ',' marker_init init_declarator\n        \n        marker_init :\n        init_declarator : declarator\n        | declarator '=' initializer\n        type_specifier : VOID\n        | CHAR\n        | SHORT\n        | INT\n        | FLOAT\n        | SIGNED\n        | UNSIGNED\n        | struct_specifier\n        | BOOL\n        struct_specifier : struct IDENTIFIER '{' marker_struct_1 struct_declaration_list '}' marker_struct_0\n        | struct IDENTIFIER\n        \n        marker_struct_0 :\n        \n        marker_struct_1 :\n        struct : STRUCTstruct_declaration_list : struct_declaration\n        | struct_declaration_list struct_declaration\n        struct_declaration : specifier_qualifier_list struct_declarator_list ';'specifier_qualifier_list : type_specifier\n        | type_specifier specifier_qualifier_list\n        struct_declarator_list : struct_declarator\n        | struct_declarator_list ',' structDeclaratorMarkerStart struct_declarator\n        structDeclaratorMarkerStart :struct_declarator : declaratordeclarator : pointer direct_declarator\n        | direct_declarator\n        function_declarator : pointer direct_declarator\n        | direct_declarator\n        direct_declarator : identifier\n        | '(' declarator ')'\n        | direct_declarator '[' ']'\n        direct_declarator : direct_declarator '[' integer_constant ']'\n        | direct_declarator '(' marker_function_push ')'\n        direct_declarator : direct_declarator '(' marker_function_push parameter_type_list ')'marker_function_push :pointer : '*'\n        | '*' pointer\n        parameter_type_list : parameter_listparameter_list : parameter_declaration\n        | parameter_list ',' parameter_declaration\n        parameter_declaration : declaration_specifiers declaratortype_name : specifier_qualifier_list\n        | specifier_qualifier_list abstract_declarator\n        abstract_declarator : pointer\n        | direct_abstract_declarator\n        | pointer direct_abstract_declarator\n        direct_abstract_declarator : '(' abstract_declarator ')'\n        | '[' ']'\n        | '[' constant_expression ']'\n        | direct_abstract_declarator '[' ']'\n        | direct_abstract_declarator '[' integer_constant ']'\n        | '(' ')'\n        | '(' parameter_type_list ')'\n        | direct_abstract_declarator '(' ')'\n        | direct_abstract_declarator '(' parameter_type_list ')'\n        \n        statement   : labeled_statement\n                    | compound_statement\n                    | expression_statement\n                    | selection_statement\n                    | iteration_statement\n                    | jump_statement\n        \n        labeled_statement : marker_case_1 CASE constant_expression marker_case_2 ':' statement\n        \n        labeled_statement : marker_case_1 DEFAULT ':' statement\n        \n        marker_case_1 :\n        \n        marker_case_2 :\n        \n        compound_statement  : '{' marker_compound_statement_push '}' marker_compound_statement_pop\n                            | '{' marker_compound_statement_push statement_list '}' marker_compound_statement_pop\n                            | '{' marker_compound_statement_push declaration_list '}' marker_compound_statement_pop\n                            | '{' marker_compound_statement_push declaration_list marker_global statement_list '}' marker_compound_statement_pop\n        \n        statement_list  : statement\n                        | statement_list marker_global statement\n        \n        declaration_list    : declaration\n                            | declaration_list marker_global declaration\n        \n        marker_compound_statement_push :\n        \n        marker_compound_statement_pop :\n        \n        block_item_list : block_item\n                        | block_item_list marker_global block_item\n        \n        block_item : declaration\n                    | statement\n        \n        expression_statement    : ';'\n                                | expression ';'\n        \n        selection_statement : IF '(' expression ')' marker_global statement marker_global_2 %prec IF_STATEMENTS\n                            | IF '(' expression ')' marker_global statement marker_global_2 ELSE marker_global statement\n                            | SWITCH '(' expression ')' marker_switch statement\n        \n        marker_switch :\n        \n        marker_global :\n        \n        marker_global_2 :\n        \n        iteration_statement : WHILE marker_global '(' expression ')' marker_global statement\n                            | DO marker_global statement WHILE '(' marker_global expression ')' ';'\n        \n        iteration_statement : FOR '(' expression_statement marker_global expression_statement ')' marker_global statement\n                            | FOR '(' expression_statement marker_global expression_statement marker_global expression ')' marker_global statement\n        iteration_statement : FOR '(' push_marker_loops declaration marker_global expression_statement ')' marker_global statement pop_marker_loops\n        | FOR '(' push_marker_loops declaration marker_global expression_statement marker_global expression ')' marker_global statement pop_marker_loops\n        \n        push_marker_loops :\n        \n        pop_marker_loops :\n        \n        jump_statement  : CONTINUE ';'\n                        | BREAK ';'\n                        | RETURN ';'\n                        | RETURN expression ';'\n        translation_unit : translation_unit external_declaration\n        | external_declaration\n        external_declaration : function_definition\n        | declaration\n        function_definition :  declaration_specifiers function_declarator '{' marker_function_start '}' marker_function_end\n        | declaration_specifiers function_declarator '{' marker_function_start block_item_list '}' marker_function_end\n        marker_function_start :marker_function_end :\n        push_lib_functions :\n        "
+    
+_lr_action_items = {'VOID':([0,2,3,4,5,6,8,9,10,11,12,13,14,15,16,17,20,22,33,34,35,39,45,46,51,65,93,95,96,97,98,99,100,101,102,103,104,105,106,107,151,153,157,175,176,178,179,180,181,184,190,191,192,193,196,213,233,234,238,240,242,243,244,254,255,266,273,274,276,277,279,280,282,301,303,305,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-202,9,9,-195,-196,-197,9,-96,-97,-98,-99,-100,-101,-102,-103,-104,-194,-87,-106,-200,-88,-129,-108,9,9,9,9,-168,-201,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,9,9,9,9,-110,9,-198,-201,9,-175,-188,-190,-191,-192,9,9,-107,-111,-169,-180,-166,-199,-171,9,-193,9,-105,-112,-160,-169,-169,9,-157,-161,-162,-167,-169,-156,-181,-178,-163,-176,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),'CHAR':([0,2,3,4,5,6,8,9,10,11,12,13,14,15,16,17,20,22,33,34,35,39,45,46,51,65,93,95,96,97,98,99,100,101,102,103,104,105,106,107,151,153,157,175,176,178,179,180,181,184,190,191,192,193,196,213,233,234,238,240,242,243,244,254,255,266,273,274,276,277,279,280,282,301,303,305,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-202,10,10,-195,-196,-197,10,-96,-97,-98,-99,-100,-101,-102,-103,-104,-194,-87,-106,-200,-88,-129,-108,10,10,10,10,-168,-201,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,10,10,10,10,-110,10,-198,-201,10,-175,-188,-190,-191,-192,10,10,-107,-111,-169,-180,-166,-199,-171,10,-193,10,-105,-112,-160,-169,-169,10,-157,-161,-162,-167,-169,-156,-181,-178,-163,-176,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),'SHORT':([0,2,3,4,5,6,8,9,10,11,12,13,14,15,16,17,20,22,33,34,35,39,45,46,51,65,93,95,96,97,98,99,100,101,102,103,104,105,106,107,151,153,157,175,176,178,179,180,181,184,190,191,192,193,196,213,233,234,238,240,242,243,244,254,255,266,273,274,276,277,279,280,282,301,303,305,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-202,11,11,-195,-196,-197,11,-96,-97,-98,-99,-100,-101,-102,-103,-104,-194,-87,-106,-200,-88,-129,-108,11,11,11,11,-168,-201,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,11,11,11,11,-110,11,-198,-201,11,-175,-188,-190,-191,-192,11,11,-107,-111,-169,-180,-166,-199,-171,11,-193,11,-105,-112,-160,-169,-169,11,-157,-161,-162,-167,-169,-156,-181,-178,-163,-176,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),'INT':([0,2,3,4,5,6,8,9,10,11,12,13,14,15,16,17,20,22,33,34,35,39,45,46,51,65,93,95,96,97,98,99,100,101,102,103,104,105,106,107,151,153,157,175,176,178,179,180,181,184,190,191,192,193,196,213,233,234,238,240,242,243,244,254,255,266,273,274,276,277,279,280,282,301,303,305,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-202,12,12,-195,-196,-197,12,-96,-97,-98,-99,-100,-101,-102,-103,-104,-194,-87,-106,-200,-88,-129,-108,12,12,12,12,-168,-201,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,12,12,12,12,-110,12,-198,-201,12,-175,-188,-190,-191,-192,12,12,-107,-111,-169,-180,-166,-199,-171,12,-193,12,-105,-112,-160,-169,-169,12,-157,-161,-162,-167,-169,-156,-181,-178,-163,-176,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),'FLOAT':([0,2,3,4,5,6,8,9,10,11,12,13,14,15,16,17,20,22,33,34,35,39,45,46,51,65,93,95,96,97,98,99,100,101,102,103,104,105,106,107,151,153,157,175,176,178,179,180,181,184,190,191,192,193,196,213,233,234,238,240,242,243,244,254,255,266,273,274,276,277,279,280,282,301,303,305,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-202,13,13,-195,-196,-197,13,-96,-97,-98,-99,-100,-101,-102,-103,-104,-194,-87,-106,-200,-88,-129,-108,13,13,13,13,-168,-201,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,13,13,13,13,-110,13,-198,-201,13,-175,-188,-190,-191,-192,13,13,-107,-111,-169,-180,-166,-199,-171,13,-193,13,-105,-112,-160,-169,-169,13,-157,-161,-162,-167,-169,-156,-181,-178,-163,-176,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),'SIGNED':([0,2,3,4,5,6,8,9,10,11,12,13,14,15,16,17,20,22,33,34,35,39,45,46,51,65,93,95,96,97,98,99,100,101,102,103,104,105,106,107,151,153,157,175,176,178,179,180,181,184,190,191,192,193,196,213,233,234,238,240,242,243,244,254,255,266,273,274,276,277,279,280,282,301,303,305,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-202,14,14,-195,-196,-197,14,-96,-97,-98,-99,-100,-101,-102,-103,-104,-194,-87,-106,-200,-88,-129,-108,14,14,14,14,-168,-201,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,14,14,14,14,-110,14,-198,-201,14,-175,-188,-190,-191,-192,14,14,-107,-111,-169,-180,-166,-199,-171,14,-193,14,-105,-112,-160,-169,-169,14,-157,-161,-162,-167,-169,-156,-181,-178,-163,-176,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),'UNSIGNED':([0,2,3,4,5,6,8,9,10,11,12,13,14,15,16,17,20,22,33,34,35,39,45,46,51,65,93,95,96,97,98,99,100,101,102,103,104,105,106,107,151,153,157,175,176,178,179,180,181,184,190,191,192,193,196,213,233,234,238,240,242,243,244,254,255,266,273,274,276,277,279,280,282,301,303,305,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-202,15,15,-195,-196,-197,15,-96,-97,-98,-99,-100,-101,-102,-103,-104,-194,-87,-106,-200,-88,-129,-108,15,15,15,15,-168,-201,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,15,15,15,15,-110,15,-198,-201,15,-175,-188,-190,-191,-192,15,15,-107,-111,-169,-180,-166,-199,-171,15,-193,15,-105,-112,-160,-169,-169,15,-157,-161,-162,-167,-169,-156,-181,-178,-163,-176,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),'BOOL':([0,2,3,4,5,6,8,9,10,11,12,13,14,15,16,17,20,22,33,34,35,39,45,46,51,65,93,95,96,97,98,99,100,101,102,103,104,105,106,107,151,153,157,175,176,178,179,180,181,184,190,191,192,193,196,213,233,234,238,240,242,243,244,254,255,266,273,274,276,277,279,280,282,301,303,305,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-202,17,17,-195,-196,-197,17,-96,-97,-98,-99,-100,-101,-102,-103,-104,-194,-87,-106,-200,-88,-129,-108,17,17,17,17,-168,-201,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,17,17,17,17,-110,17,-198,-201,17,-175,-188,-190,-191,-192,17,17,-107,-111,-169,-180,-166,-199,-171,17,-193,17,-105,-112,-160,-169,-169,17,-157,-161,-162,-167,-169,-156,-181,-178,-163,-176,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),'STRUCT':([0,2,3,4,5,6,8,9,10,11,12,13,14,15,16,17,20,22,33,34,35,39,45,46,51,65,93,95,96,97,98,99,100,101,102,103,104,105,106,107,151,153,157,175,176,178,179,180,181,184,190,191,192,193,196,213,233,234,238,240,242,243,244,254,255,266,273,274,276,277,279,280,282,301,303,305,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-202,19,19,-195,-196,-197,19,-96,-97,-98,-99,-100,-101,-102,-103,-104,-194,-87,-106,-200,-88,-129,-108,19,19,19,19,-168,-201,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,19,19,19,19,-110,19,-198,-201,19,-175,-188,-190,-191,-192,19,19,-107,-111,-169,-180,-166,-199,-171,19,-193,19,-105,-112,-160,-169,-169,19,-157,-161,-162,-167,-169,-156,-181,-178,-163,-176,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),'$end':([1,3,4,5,6,20,22,35,96,179,180,243,],[0,-1,-195,-196,-197,-194,-87,-88,-201,-198,-201,-199,]),';':([7,8,9,10,11,12,13,14,15,16,17,22,23,25,26,28,30,31,32,33,34,35,37,43,46,48,50,52,53,54,55,56,57,58,59,63,66,67,68,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,94,95,97,98,99,100,101,102,103,104,105,106,107,109,113,115,116,117,118,119,120,121,144,145,146,148,149,150,152,178,181,184,189,190,191,192,193,194,195,198,202,205,206,208,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,236,237,238,239,240,241,242,244,247,248,253,255,258,259,260,262,263,272,273,276,277,278,279,280,282,283,284,287,288,290,299,301,302,303,304,305,306,307,308,309,312,316,317,318,319,320,321,324,326,327,328,329,332,334,335,336,337,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[22,-89,-96,-97,-98,-99,-100,-101,-102,-103,-104,-87,35,-120,-91,-123,-94,-15,-90,-106,-200,-88,-119,-120,101,-125,-4,-124,-119,-95,-86,-70,-38,-68,-26,-40,-66,-16,-8,-64,-9,-10,-11,-12,-13,-62,-5,-6,-2,-3,-7,-60,-58,-55,-50,-47,-44,22,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,184,-180,191,192,193,-83,-92,-126,-127,-22,-23,-27,-28,-29,-38,-30,101,101,-175,101,101,-190,-191,-192,255,-128,-71,-18,-20,-21,-14,-63,-61,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-107,274,-115,-118,-169,-180,-180,-164,-166,-171,101,-84,-180,-193,-180,-17,-19,-31,-39,-180,-105,-160,-169,101,-169,101,-157,-180,-179,101,-180,-67,-65,-161,-165,-162,-180,-167,101,101,101,-180,101,-116,-169,-156,-181,-178,101,-180,-180,-163,-176,-182,101,-180,-69,-180,343,-180,-184,101,101,-183,101,-180,-189,-177,-185,101,-186,-189,-187,]),'*':([7,8,9,10,11,12,13,14,15,16,17,22,27,29,32,33,34,35,36,44,46,47,50,57,59,60,61,62,63,64,65,67,68,69,70,71,72,73,74,76,77,78,79,80,82,83,84,85,86,92,94,95,97,98,99,100,101,102,103,104,105,106,107,113,117,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,146,147,148,149,150,151,152,153,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,177,178,181,182,184,185,186,187,189,190,191,192,193,199,200,202,205,206,208,209,213,214,215,216,228,229,230,231,232,233,238,239,240,241,242,244,247,251,253,255,259,260,261,262,263,273,275,276,277,278,279,280,282,283,284,287,288,289,300,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[27,-89,-96,-97,-98,-99,-100,-101,-102,-103,-104,-87,27,27,-90,-106,-200,-88,-93,70,70,27,-4,-38,-26,70,70,70,-40,70,70,-16,-8,-32,-33,-34,-35,-36,-37,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,172,27,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,70,27,70,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,70,70,-22,-23,-27,70,-28,-29,-38,70,-30,70,27,-113,-180,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,27,70,70,70,-175,70,70,70,70,70,-190,-191,-192,70,70,-18,-20,-21,-14,70,27,70,-114,70,172,172,-41,-42,-43,-107,-169,-180,-180,-164,-166,-171,70,70,-180,-193,-17,-19,70,-31,-39,-105,-117,-160,-169,70,-169,70,-157,-180,-179,70,-180,-180,27,-161,-165,-162,-180,-167,70,70,70,-180,-180,-180,70,70,-169,-156,-181,-178,70,70,70,-180,-180,-163,-176,-182,70,70,-180,-180,-180,-184,70,70,-183,70,-180,-189,-177,-185,70,-186,-189,-187,]),'(':([7,8,9,10,11,12,13,14,15,16,17,22,24,25,27,28,29,31,32,33,34,35,36,37,40,42,43,44,46,47,48,50,52,53,59,60,61,62,64,65,67,68,69,70,71,72,73,74,76,77,78,79,80,82,83,84,85,86,94,95,97,98,99,100,101,102,103,104,105,106,107,110,111,112,113,114,117,120,121,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,147,151,153,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,177,178,181,182,184,185,186,187,188,189,190,191,192,193,195,199,200,202,205,206,208,209,211,212,213,214,215,216,233,238,239,240,241,242,244,247,251,253,255,259,260,261,264,268,270,273,275,276,277,278,279,280,282,283,284,286,287,288,289,292,294,296,297,298,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[29,-89,-96,-97,-98,-99,-100,-101,-102,-103,-104,-87,29,39,-130,-123,29,-15,-90,-106,-200,-88,-93,39,-131,29,39,65,65,29,-125,-4,-124,39,141,147,147,151,153,65,-16,-8,-32,-33,-34,-35,-36,-37,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,29,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,186,187,-180,-180,190,65,-126,-127,29,65,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,65,65,-22,-23,65,65,65,213,-113,-180,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,29,65,65,151,-175,65,65,65,251,65,65,-190,-191,-192,-128,65,151,-18,-20,-21,-14,151,213,266,213,151,-114,151,-107,-169,-180,-180,-164,-166,-171,65,65,-180,-193,-17,-19,65,266,-146,-142,-105,-117,-160,-169,65,-169,65,-157,-180,-179,310,65,-180,-180,-144,-148,-141,-147,-143,29,-161,-165,-162,-180,-167,65,65,65,-180,-180,-180,65,151,-145,-149,-169,-156,-181,-178,65,65,65,-180,-180,-163,-176,-182,65,65,-180,-180,-180,-184,65,65,-183,65,-180,-189,-177,-185,65,-186,-189,-187,]),'IDENTIFIER':([7,8,9,10,11,12,13,14,15,16,17,18,19,22,24,27,29,32,33,34,35,36,40,42,44,46,47,60,61,62,64,65,69,70,71,72,73,74,94,95,97,98,99,100,101,102,103,104,105,106,107,113,117,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,147,151,153,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,177,178,181,182,184,185,186,187,189,190,191,192,193,199,200,209,214,215,216,233,238,239,240,241,242,244,247,251,253,255,261,273,275,276,277,278,279,280,282,283,284,287,288,289,300,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[31,-89,-96,-97,-98,-99,-100,-101,-102,-103,-104,33,-109,-87,31,-130,31,-90,-106,-200,-88,-93,-131,31,68,68,31,68,68,68,68,68,-32,-33,-34,-35,-36,-37,31,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,68,31,68,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,68,68,205,206,68,68,68,-113,-180,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,31,68,68,68,-175,68,68,68,68,68,-190,-191,-192,68,68,68,68,-114,68,-107,-169,-180,-180,-164,-166,-171,68,68,-180,-193,68,-105,-117,-160,-169,68,-169,68,-157,-180,-179,68,-180,-180,31,-161,-165,-162,-180,-167,68,68,68,-180,-180,-180,68,68,-169,-156,-181,-178,68,68,68,-180,-180,-163,-176,-182,68,68,-180,-180,-180,-184,68,68,-183,68,-180,-189,-177,-185,68,-186,-189,-187,]),'[':([9,10,11,12,13,14,15,16,17,25,27,28,31,33,37,40,43,48,50,52,53,59,67,68,76,77,78,79,80,82,83,84,85,86,120,121,144,145,156,157,195,202,205,206,208,211,212,213,215,233,259,260,264,268,270,273,292,294,296,297,298,314,315,],[-96,-97,-98,-99,-100,-101,-102,-103,-104,38,-130,-123,-15,-106,38,-131,38,-125,-4,-124,38,140,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-126,-127,-22,-23,214,-113,-128,-18,-20,-21,-14,214,265,214,-114,-107,-17,-19,265,-146,-142,-105,-144,-148,-141,-147,-143,-145,-149,]),')':([9,10,11,12,13,14,15,16,17,27,28,31,33,39,40,41,43,48,50,51,52,53,56,57,58,59,63,66,67,68,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,101,118,120,121,122,123,124,141,144,145,146,148,149,150,152,154,155,156,157,184,195,197,198,202,203,204,205,206,207,208,210,211,212,213,215,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,248,249,250,256,258,259,260,262,263,264,266,267,268,269,270,272,273,285,290,291,292,294,295,296,297,298,299,311,314,315,325,326,330,331,335,340,],[-96,-97,-98,-99,-100,-101,-102,-103,-104,-130,-123,-15,-106,-129,-131,52,-120,-125,-4,121,-124,-119,-70,-38,-68,-26,-40,-66,-16,-8,-64,-9,-10,-11,-12,-13,-62,-5,-6,-2,-3,-7,-60,-58,-55,-50,-47,-44,-174,-83,-126,-127,195,-132,-133,202,-22,-23,-27,-28,-29,-38,-30,208,209,-136,-113,-175,-128,-135,-71,-18,260,-24,-20,-21,262,-14,-137,-138,-139,268,-114,-63,-61,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-107,-84,283,284,-134,-180,-17,-19,-31,-39,-140,294,296,-146,297,-142,-180,-105,309,-67,-25,-144,-148,315,-141,-147,-143,-65,324,-145,-149,334,-180,337,338,-69,345,]),'{':([21,22,25,28,31,33,34,35,37,46,48,52,95,97,98,99,100,101,102,103,104,105,106,107,113,120,121,178,181,184,189,191,192,193,195,238,239,240,241,242,244,247,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[34,-87,-122,-123,-15,45,-200,-88,-121,95,-125,-124,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,-126,-127,95,95,-175,95,-190,-191,-192,-128,-169,-180,-180,-164,-166,-171,95,-193,-160,-169,95,-169,95,-157,-180,-179,-161,-165,-162,-180,-167,95,95,95,-180,-169,-156,-181,-178,95,-180,-163,-176,-182,95,-180,-180,-180,-184,95,95,-183,95,-180,-189,-177,-185,95,-186,-189,-187,]),'}':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,175,176,178,184,191,192,193,234,238,239,240,241,242,244,255,274,276,277,279,282,301,302,303,304,305,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-87,-200,-88,96,-168,180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,233,-110,238,-175,-190,-191,-192,-111,-169,277,279,-164,-166,-171,-193,-112,-160,-169,-169,-157,-161,-165,-162,317,-167,-169,-156,-181,-178,-163,-176,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),'IF':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,113,178,181,184,189,191,192,193,238,239,240,241,242,244,247,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,110,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,110,110,-175,110,-190,-191,-192,-169,-180,-180,-164,-166,-171,110,-193,-160,-169,110,-169,110,-157,-180,-179,-161,-165,-162,-180,-167,110,110,110,-180,-169,-156,-181,-178,110,-180,-163,-176,-182,110,-180,-180,-180,-184,110,110,-183,110,-180,-189,-177,-185,110,-186,-189,-187,]),'SWITCH':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,113,178,181,184,189,191,192,193,238,239,240,241,242,244,247,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,111,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,111,111,-175,111,-190,-191,-192,-169,-180,-180,-164,-166,-171,111,-193,-160,-169,111,-169,111,-157,-180,-179,-161,-165,-162,-180,-167,111,111,111,-180,-169,-156,-181,-178,111,-180,-163,-176,-182,111,-180,-180,-180,-184,111,111,-183,111,-180,-189,-177,-185,111,-186,-189,-187,]),'WHILE':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,113,178,181,184,189,191,192,193,238,239,240,241,242,244,247,252,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,112,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,112,112,-175,112,-190,-191,-192,-169,-180,-180,-164,-166,-171,112,286,-193,-160,-169,112,-169,112,-157,-180,-179,-161,-165,-162,-180,-167,112,112,112,-180,-169,-156,-181,-178,112,-180,-163,-176,-182,112,-180,-180,-180,-184,112,112,-183,112,-180,-189,-177,-185,112,-186,-189,-187,]),'DO':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,113,178,181,184,189,191,192,193,238,239,240,241,242,244,247,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,113,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,113,113,-175,113,-190,-191,-192,-169,-180,-180,-164,-166,-171,113,-193,-160,-169,113,-169,113,-157,-180,-179,-161,-165,-162,-180,-167,113,113,113,-180,-169,-156,-181,-178,113,-180,-163,-176,-182,113,-180,-180,-180,-184,113,113,-183,113,-180,-189,-177,-185,113,-186,-189,-187,]),'FOR':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,113,178,181,184,189,191,192,193,238,239,240,241,242,244,247,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,114,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,114,114,-175,114,-190,-191,-192,-169,-180,-180,-164,-166,-171,114,-193,-160,-169,114,-169,114,-157,-180,-179,-161,-165,-162,-180,-167,114,114,114,-180,-169,-156,-181,-178,114,-180,-163,-176,-182,114,-180,-180,-180,-184,114,114,-183,114,-180,-189,-177,-185,114,-186,-189,-187,]),'CONTINUE':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,113,178,181,184,189,191,192,193,238,239,240,241,242,244,247,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,115,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,115,115,-175,115,-190,-191,-192,-169,-180,-180,-164,-166,-171,115,-193,-160,-169,115,-169,115,-157,-180,-179,-161,-165,-162,-180,-167,115,115,115,-180,-169,-156,-181,-178,115,-180,-163,-176,-182,115,-180,-180,-180,-184,115,115,-183,115,-180,-189,-177,-185,115,-186,-189,-187,]),'BREAK':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,113,178,181,184,189,191,192,193,238,239,240,241,242,244,247,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,116,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,116,116,-175,116,-190,-191,-192,-169,-180,-180,-164,-166,-171,116,-193,-160,-169,116,-169,116,-157,-180,-179,-161,-165,-162,-180,-167,116,116,116,-180,-169,-156,-181,-178,116,-180,-163,-176,-182,116,-180,-180,-180,-184,116,116,-183,116,-180,-189,-177,-185,116,-186,-189,-187,]),'RETURN':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,113,178,181,184,189,191,192,193,238,239,240,241,242,244,247,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,117,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,117,117,-175,117,-190,-191,-192,-169,-180,-180,-164,-166,-171,117,-193,-160,-169,117,-169,117,-157,-180,-179,-161,-165,-162,-180,-167,117,117,117,-180,-169,-156,-181,-178,117,-180,-163,-176,-182,117,-180,-180,-180,-184,117,117,-183,117,-180,-189,-177,-185,117,-186,-189,-187,]),'INC_OP':([22,34,35,44,46,50,59,60,61,62,64,65,67,68,69,70,71,72,73,74,76,77,78,79,80,82,83,84,85,86,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,202,205,206,208,209,214,216,238,239,240,241,242,244,247,251,253,255,259,260,261,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,60,60,-4,144,60,60,60,60,60,-16,-8,-32,-33,-34,-35,-36,-37,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,60,60,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,60,60,-22,-23,60,60,60,-180,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-175,60,60,60,60,60,-190,-191,-192,60,60,-18,-20,-21,-14,60,60,60,-169,-180,-180,-164,-166,-171,60,60,-180,-193,-17,-19,60,-160,-169,60,-169,60,-157,-180,-179,60,-180,-180,-161,-165,-162,-180,-167,60,60,60,-180,-180,-180,60,60,-169,-156,-181,-178,60,60,60,-180,-180,-163,-176,-182,60,60,-180,-180,-180,-184,60,60,-183,60,-180,-189,-177,-185,60,-186,-189,-187,]),'DEC_OP':([22,34,35,44,46,50,59,60,61,62,64,65,67,68,69,70,71,72,73,74,76,77,78,79,80,82,83,84,85,86,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,202,205,206,208,209,214,216,238,239,240,241,242,244,247,251,253,255,259,260,261,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,61,61,-4,145,61,61,61,61,61,-16,-8,-32,-33,-34,-35,-36,-37,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,61,61,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,61,61,-22,-23,61,61,61,-180,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-175,61,61,61,61,61,-190,-191,-192,61,61,-18,-20,-21,-14,61,61,61,-169,-180,-180,-164,-166,-171,61,61,-180,-193,-17,-19,61,-160,-169,61,-169,61,-157,-180,-179,61,-180,-180,-161,-165,-162,-180,-167,61,61,61,-180,-180,-180,61,61,-169,-156,-181,-178,61,61,61,-180,-180,-163,-176,-182,61,61,-180,-180,-180,-184,61,61,-183,61,-180,-189,-177,-185,61,-186,-189,-187,]),'SIZEOF':([22,34,35,44,46,60,61,62,64,65,69,70,71,72,73,74,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,209,214,216,238,239,240,241,242,244,247,251,253,255,261,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,64,64,64,64,64,64,64,-32,-33,-34,-35,-36,-37,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,64,64,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,64,64,64,64,64,-180,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-175,64,64,64,64,64,-190,-191,-192,64,64,64,64,64,-169,-180,-180,-164,-166,-171,64,64,-180,-193,64,-160,-169,64,-169,64,-157,-180,-179,64,-180,-180,-161,-165,-162,-180,-167,64,64,64,-180,-180,-180,64,64,-169,-156,-181,-178,64,64,64,-180,-180,-163,-176,-182,64,64,-180,-180,-180,-184,64,64,-183,64,-180,-189,-177,-185,64,-186,-189,-187,]),'&':([22,34,35,44,46,50,57,59,60,61,62,63,64,65,67,68,69,70,71,72,73,74,76,77,78,79,80,82,83,84,85,86,87,88,89,90,91,92,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,146,147,148,149,150,151,152,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,202,205,206,208,209,214,216,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,238,239,240,241,242,244,247,251,253,255,259,260,261,262,263,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,69,69,-4,-38,-26,69,69,69,-40,69,69,-16,-8,-32,-33,-34,-35,-36,-37,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,161,-58,-55,-50,-47,-44,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,69,69,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,69,69,-22,-23,-27,69,-28,-29,-38,69,-30,69,-180,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-175,69,69,69,69,69,-190,-191,-192,69,69,-18,-20,-21,-14,69,69,69,161,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-169,-180,-180,-164,-166,-171,69,69,-180,-193,-17,-19,69,-31,-39,-160,-169,69,-169,69,-157,-180,-179,69,-180,-180,-161,-165,-162,-180,-167,69,69,69,-180,-180,-180,69,69,-169,-156,-181,-178,69,69,69,-180,-180,-163,-176,-182,69,69,-180,-180,-180,-184,69,69,-183,69,-180,-189,-177,-185,69,-186,-189,-187,]),'+':([22,34,35,44,46,50,57,59,60,61,62,63,64,65,67,68,69,70,71,72,73,74,76,77,78,79,80,82,83,84,85,86,91,92,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,146,147,148,149,150,151,152,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,202,205,206,208,209,214,216,226,227,228,229,230,231,232,238,239,240,241,242,244,247,251,253,255,259,260,261,262,263,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,71,71,-4,-38,-26,71,71,71,-40,71,71,-16,-8,-32,-33,-34,-35,-36,-37,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,170,-44,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,71,71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,71,71,-22,-23,-27,71,-28,-29,-38,71,-30,71,-180,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-175,71,71,71,71,71,-190,-191,-192,71,71,-18,-20,-21,-14,71,71,71,170,170,-45,-46,-41,-42,-43,-169,-180,-180,-164,-166,-171,71,71,-180,-193,-17,-19,71,-31,-39,-160,-169,71,-169,71,-157,-180,-179,71,-180,-180,-161,-165,-162,-180,-167,71,71,71,-180,-180,-180,71,71,-169,-156,-181,-178,71,71,71,-180,-180,-163,-176,-182,71,71,-180,-180,-180,-184,71,71,-183,71,-180,-189,-177,-185,71,-186,-189,-187,]),'-':([22,34,35,44,46,50,57,59,60,61,62,63,64,65,67,68,69,70,71,72,73,74,76,77,78,79,80,82,83,84,85,86,91,92,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,146,147,148,149,150,151,152,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,202,205,206,208,209,214,216,226,227,228,229,230,231,232,238,239,240,241,242,244,247,251,253,255,259,260,261,262,263,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,72,72,-4,-38,-26,72,72,72,-40,72,72,-16,-8,-32,-33,-34,-35,-36,-37,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,171,-44,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,72,72,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,72,72,-22,-23,-27,72,-28,-29,-38,72,-30,72,-180,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-175,72,72,72,72,72,-190,-191,-192,72,72,-18,-20,-21,-14,72,72,72,171,171,-45,-46,-41,-42,-43,-169,-180,-180,-164,-166,-171,72,72,-180,-193,-17,-19,72,-31,-39,-160,-169,72,-169,72,-157,-180,-179,72,-180,-180,-161,-165,-162,-180,-167,72,72,72,-180,-180,-180,72,72,-169,-156,-181,-178,72,72,72,-180,-180,-163,-176,-182,72,72,-180,-180,-180,-184,72,72,-183,72,-180,-189,-177,-185,72,-186,-189,-187,]),'~':([22,34,35,44,46,60,61,62,64,65,69,70,71,72,73,74,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,209,214,216,238,239,240,241,242,244,247,251,253,255,261,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,73,73,73,73,73,73,73,-32,-33,-34,-35,-36,-37,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,73,73,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,73,73,73,73,73,-180,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-175,73,73,73,73,73,-190,-191,-192,73,73,73,73,73,-169,-180,-180,-164,-166,-171,73,73,-180,-193,73,-160,-169,73,-169,73,-157,-180,-179,73,-180,-180,-161,-165,-162,-180,-167,73,73,73,-180,-180,-180,73,73,-169,-156,-181,-178,73,73,73,-180,-180,-163,-176,-182,73,73,-180,-180,-180,-184,73,73,-183,73,-180,-189,-177,-185,73,-186,-189,-187,]),'!':([22,34,35,44,46,60,61,62,64,65,69,70,71,72,73,74,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,209,214,216,238,239,240,241,242,244,247,251,253,255,261,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,74,74,74,74,74,74,74,-32,-33,-34,-35,-36,-37,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,74,74,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,74,74,74,74,74,-180,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-175,74,74,74,74,74,-190,-191,-192,74,74,74,74,74,-169,-180,-180,-164,-166,-171,74,74,-180,-193,74,-160,-169,74,-169,74,-157,-180,-179,74,-180,-180,-161,-165,-162,-180,-167,74,74,74,-180,-180,-180,74,74,-169,-156,-181,-178,74,74,74,-180,-180,-163,-176,-182,74,74,-180,-180,-180,-184,74,74,-183,74,-180,-189,-177,-185,74,-186,-189,-187,]),'INTEGER_CONSTANT':([22,34,35,38,44,46,60,61,62,64,65,69,70,71,72,73,74,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,209,214,216,238,239,240,241,242,244,247,251,253,255,261,265,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,50,50,50,50,50,50,50,50,-32,-33,-34,-35,-36,-37,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,50,50,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,50,50,50,50,50,-180,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,-175,50,50,50,50,50,-190,-191,-192,50,50,50,50,50,-169,-180,-180,-164,-166,-171,50,50,-180,-193,50,50,-160,-169,50,-169,50,-157,-180,-179,50,-180,-180,-161,-165,-162,-180,-167,50,50,50,-180,-180,-180,50,50,-169,-156,-181,-178,50,50,50,-180,-180,-163,-176,-182,50,50,-180,-180,-180,-184,50,50,-183,50,-180,-189,-177,-185,50,-186,-189,-187,]),'FLOAT_CONSTANT':([22,34,35,44,46,60,61,62,64,65,69,70,71,72,73,74,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,209,214,216,238,239,240,241,242,244,247,251,253,255,261,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,82,82,82,82,82,82,82,-32,-33,-34,-35,-36,-37,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,82,82,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,82,82,82,82,82,-180,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-175,82,82,82,82,82,-190,-191,-192,82,82,82,82,82,-169,-180,-180,-164,-166,-171,82,82,-180,-193,82,-160,-169,82,-169,82,-157,-180,-179,82,-180,-180,-161,-165,-162,-180,-167,82,82,82,-180,-180,-180,82,82,-169,-156,-181,-178,82,82,82,-180,-180,-163,-176,-182,82,82,-180,-180,-180,-184,82,82,-183,82,-180,-189,-177,-185,82,-186,-189,-187,]),'CHAR_CONSTANT':([22,34,35,44,46,60,61,62,64,65,69,70,71,72,73,74,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,209,214,216,238,239,240,241,242,244,247,251,253,255,261,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,83,83,83,83,83,83,83,-32,-33,-34,-35,-36,-37,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,83,83,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,83,83,83,83,83,-180,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-175,83,83,83,83,83,-190,-191,-192,83,83,83,83,83,-169,-180,-180,-164,-166,-171,83,83,-180,-193,83,-160,-169,83,-169,83,-157,-180,-179,83,-180,-180,-161,-165,-162,-180,-167,83,83,83,-180,-180,-180,83,83,-169,-156,-181,-178,83,83,83,-180,-180,-163,-176,-182,83,83,-180,-180,-180,-184,83,83,-183,83,-180,-189,-177,-185,83,-186,-189,-187,]),'TRUE':([22,34,35,44,46,60,61,62,64,65,69,70,71,72,73,74,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,209,214,216,238,239,240,241,242,244,247,251,253,255,261,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,84,84,84,84,84,84,84,-32,-33,-34,-35,-36,-37,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,84,84,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,84,84,84,84,84,-180,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-175,84,84,84,84,84,-190,-191,-192,84,84,84,84,84,-169,-180,-180,-164,-166,-171,84,84,-180,-193,84,-160,-169,84,-169,84,-157,-180,-179,84,-180,-180,-161,-165,-162,-180,-167,84,84,84,-180,-180,-180,84,84,-169,-156,-181,-178,84,84,84,-180,-180,-163,-176,-182,84,84,-180,-180,-180,-184,84,84,-183,84,-180,-189,-177,-185,84,-186,-189,-187,]),'FALSE':([22,34,35,44,46,60,61,62,64,65,69,70,71,72,73,74,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,209,214,216,238,239,240,241,242,244,247,251,253,255,261,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,85,85,85,85,85,85,85,-32,-33,-34,-35,-36,-37,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,85,85,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,85,85,85,85,85,-180,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-175,85,85,85,85,85,-190,-191,-192,85,85,85,85,85,-169,-180,-180,-164,-166,-171,85,85,-180,-193,85,-160,-169,85,-169,85,-157,-180,-179,85,-180,-180,-161,-165,-162,-180,-167,85,85,85,-180,-180,-180,85,85,-169,-156,-181,-178,85,85,85,-180,-180,-163,-176,-182,85,85,-180,-180,-180,-184,85,85,-183,85,-180,-189,-177,-185,85,-186,-189,-187,]),'STRING_CONSTANT':([22,34,35,44,46,60,61,62,64,65,69,70,71,72,73,74,95,97,98,99,100,101,102,103,104,105,106,107,113,117,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,184,185,186,187,189,190,191,192,193,199,200,209,214,216,238,239,240,241,242,244,247,251,253,255,261,276,277,278,279,280,282,283,284,287,288,289,301,302,303,304,305,306,307,308,309,310,311,312,313,317,318,319,320,321,322,323,324,325,327,328,329,332,333,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,86,86,86,86,86,86,86,-32,-33,-34,-35,-36,-37,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,-180,86,86,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-180,-180,86,86,86,86,86,-180,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-175,86,86,86,86,86,-190,-191,-192,86,86,86,86,86,-169,-180,-180,-164,-166,-171,86,86,-180,-193,86,-160,-169,86,-169,86,-157,-180,-179,86,-180,-180,-161,-165,-162,-180,-167,86,86,86,-180,-180,-180,86,86,-169,-156,-181,-178,86,86,86,-180,-180,-163,-176,-182,86,86,-180,-180,-180,-184,86,86,-183,86,-180,-189,-177,-185,86,-186,-189,-187,]),'CASE':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,108,113,178,181,184,189,191,192,193,238,239,240,241,242,244,247,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,-158,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,182,-180,-158,-158,-175,-158,-190,-191,-192,-169,-180,-180,-164,-166,-171,-158,-193,-160,-169,-158,-169,-158,-157,-180,-179,-161,-165,-162,-180,-167,-158,-158,-158,-180,-169,-156,-181,-178,-158,-180,-163,-176,-182,-158,-180,-180,-180,-184,-158,-158,-183,-158,-180,-189,-177,-185,-158,-186,-189,-187,]),'DEFAULT':([22,34,35,46,95,97,98,99,100,101,102,103,104,105,106,107,108,113,178,181,184,189,191,192,193,238,239,240,241,242,244,247,255,276,277,278,279,280,282,283,284,301,302,303,304,305,306,307,308,309,317,318,319,320,321,324,327,328,329,332,334,336,338,339,341,342,343,344,345,346,347,348,349,350,351,352,],[-87,-200,-88,-158,-168,-180,-170,-172,-173,-174,-150,-151,-152,-153,-154,-155,183,-180,-158,-158,-175,-158,-190,-191,-192,-169,-180,-180,-164,-166,-171,-158,-193,-160,-169,-158,-169,-158,-157,-180,-179,-161,-165,-162,-180,-167,-158,-158,-158,-180,-169,-156,-181,-178,-158,-180,-163,-176,-182,-158,-180,-180,-180,-184,-158,-158,-183,-158,-180,-189,-177,-185,-158,-186,-189,-187,]),',':([23,25,26,28,30,31,37,43,48,50,52,53,54,55,56,57,58,59,63,66,67,68,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,109,118,119,120,121,123,124,144,145,146,148,149,150,152,154,194,195,197,198,201,202,203,204,205,206,208,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,235,236,237,248,249,250,256,257,258,259,260,262,263,272,285,290,291,299,316,326,330,331,335,340,],[36,-120,-91,-123,-94,-15,-119,-120,-125,-4,-124,-119,-95,-86,-70,-38,-68,-26,-40,-66,-16,-8,-64,-9,-10,-11,-12,-13,-62,-5,-6,-2,-3,-7,-60,-58,-55,-50,-47,-44,185,-83,-92,-126,-127,196,-133,-22,-23,-27,-28,-29,-38,-30,185,185,-128,-135,-71,185,-18,261,-24,-20,-21,-14,-63,-61,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,275,-115,-118,-84,185,185,-134,185,-180,-17,-19,-31,-39,-180,185,-67,-25,-65,-116,-180,185,185,-69,185,]),'=':([25,28,30,31,37,43,48,50,52,53,57,59,67,68,76,77,78,79,80,82,83,84,85,86,120,121,144,145,146,148,149,150,152,195,202,205,206,208,259,260,262,263,],[-120,-123,44,-15,-119,-120,-125,-4,-124,-119,127,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-126,-127,-22,-23,-27,-28,-29,-38,-30,-128,-18,-20,-21,-14,-17,-19,-31,-39,]),']':([38,49,50,56,57,58,59,63,66,67,68,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,118,144,145,146,148,149,150,152,198,201,202,205,206,208,214,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,246,248,258,259,260,262,263,265,271,272,290,293,299,326,335,],[48,120,-4,-70,-38,-68,-26,-40,-66,-16,-8,-64,-9,-10,-11,-12,-13,-62,-5,-6,-2,-3,-7,-60,-58,-55,-50,-47,-44,-83,-22,-23,-27,-28,-29,-38,-30,-71,259,-18,-20,-21,-14,270,-63,-61,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-85,-84,-180,-17,-19,-31,-39,292,298,-180,-67,314,-65,-180,-69,]),'.':([50,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,202,205,206,208,259,260,],[-4,142,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-18,-20,-21,-14,-17,-19,]),'PTR_OP':([50,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,202,205,206,208,259,260,],[-4,143,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-18,-20,-21,-14,-17,-19,]),'MUL_ASSIGN':([50,57,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,146,148,149,150,152,202,205,206,208,259,260,262,263,],[-4,128,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-17,-19,-31,-39,]),'DIV_ASSIGN':([50,57,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,146,148,149,150,152,202,205,206,208,259,260,262,263,],[-4,129,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-17,-19,-31,-39,]),'MOD_ASSIGN':([50,57,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,146,148,149,150,152,202,205,206,208,259,260,262,263,],[-4,130,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-17,-19,-31,-39,]),'ADD_ASSIGN':([50,57,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,146,148,149,150,152,202,205,206,208,259,260,262,263,],[-4,131,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-17,-19,-31,-39,]),'SUB_ASSIGN':([50,57,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,146,148,149,150,152,202,205,206,208,259,260,262,263,],[-4,132,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-17,-19,-31,-39,]),'LEFT_ASSIGN':([50,57,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,146,148,149,150,152,202,205,206,208,259,260,262,263,],[-4,133,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-17,-19,-31,-39,]),'RIGHT_ASSIGN':([50,57,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,146,148,149,150,152,202,205,206,208,259,260,262,263,],[-4,134,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-17,-19,-31,-39,]),'AND_ASSIGN':([50,57,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,146,148,149,150,152,202,205,206,208,259,260,262,263,],[-4,135,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-17,-19,-31,-39,]),'XOR_ASSIGN':([50,57,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,146,148,149,150,152,202,205,206,208,259,260,262,263,],[-4,136,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-17,-19,-31,-39,]),'OR_ASSIGN':([50,57,59,67,68,76,77,78,79,80,82,83,84,85,86,144,145,146,148,149,150,152,202,205,206,208,259,260,262,263,],[-4,137,-26,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-17,-19,-31,-39,]),'/':([50,57,59,63,67,68,76,77,78,79,80,82,83,84,85,86,92,144,145,146,148,149,150,152,202,205,206,208,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,173,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,173,173,-41,-42,-43,-17,-19,-31,-39,]),'%':([50,57,59,63,67,68,76,77,78,79,80,82,83,84,85,86,92,144,145,146,148,149,150,152,202,205,206,208,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,174,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,174,174,-41,-42,-43,-17,-19,-31,-39,]),'LEFT_OP':([50,57,59,63,67,68,76,77,78,79,80,82,83,84,85,86,90,91,92,144,145,146,148,149,150,152,202,205,206,208,222,223,224,225,226,227,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,168,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,168,168,168,168,-48,-49,-45,-46,-41,-42,-43,-17,-19,-31,-39,]),'RIGHT_OP':([50,57,59,63,67,68,76,77,78,79,80,82,83,84,85,86,90,91,92,144,145,146,148,149,150,152,202,205,206,208,222,223,224,225,226,227,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,169,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,169,169,169,169,-48,-49,-45,-46,-41,-42,-43,-17,-19,-31,-39,]),'<':([50,57,59,63,67,68,76,77,78,79,80,82,83,84,85,86,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,220,221,222,223,224,225,226,227,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,164,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,164,164,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-17,-19,-31,-39,]),'>':([50,57,59,63,67,68,76,77,78,79,80,82,83,84,85,86,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,220,221,222,223,224,225,226,227,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,165,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,165,165,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-17,-19,-31,-39,]),'LE_OP':([50,57,59,63,67,68,76,77,78,79,80,82,83,84,85,86,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,220,221,222,223,224,225,226,227,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,166,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,166,166,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-17,-19,-31,-39,]),'GE_OP':([50,57,59,63,67,68,76,77,78,79,80,82,83,84,85,86,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,220,221,222,223,224,225,226,227,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,167,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,167,167,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-17,-19,-31,-39,]),'EQ_OP':([50,57,59,63,67,68,76,77,78,79,80,82,83,84,85,86,88,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,219,220,221,222,223,224,225,226,227,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,162,-55,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,162,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-17,-19,-31,-39,]),'NE_OP':([50,57,59,63,67,68,76,77,78,79,80,82,83,84,85,86,88,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,219,220,221,222,223,224,225,226,227,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,-5,-6,-2,-3,-7,163,-55,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,163,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-17,-19,-31,-39,]),'^':([50,57,59,63,67,68,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,259,260,262,263,],[-4,-38,-26,-40,-16,-8,-9,-10,-11,-12,-13,160,-5,-6,-2,-3,-7,-60,-58,-55,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,160,-61,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-17,-19,-31,-39,]),'|':([50,57,59,63,67,68,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,259,260,262,263,272,],[-4,-38,-26,-40,-16,-8,159,-9,-10,-11,-12,-13,-62,-5,-6,-2,-3,-7,-60,-58,-55,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-63,-61,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-17,-19,-31,-39,159,]),'AND_OP':([50,57,59,63,66,67,68,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,258,259,260,262,263,272,299,],[-4,-38,-26,-40,158,-16,-8,-64,-9,-10,-11,-12,-13,-62,-5,-6,-2,-3,-7,-60,-58,-55,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-63,-61,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,158,-17,-19,-31,-39,-180,-65,]),'?':([50,57,58,59,63,66,67,68,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,258,259,260,262,263,272,290,299,],[-4,-38,138,-26,-40,-66,-16,-8,-64,-9,-10,-11,-12,-13,-62,-5,-6,-2,-3,-7,-60,-58,-55,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-63,-61,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-180,-17,-19,-31,-39,-180,-67,-65,]),'OR_OP':([50,57,58,59,63,66,67,68,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,144,145,146,148,149,150,152,202,205,206,208,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,258,259,260,262,263,272,290,299,],[-4,-38,139,-26,-40,-66,-16,-8,-64,-9,-10,-11,-12,-13,-62,-5,-6,-2,-3,-7,-60,-58,-55,-50,-47,-44,-22,-23,-27,-28,-29,-38,-30,-18,-20,-21,-14,-63,-61,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-180,-17,-19,-31,-39,-180,-67,-65,]),':':([50,56,57,58,59,63,66,67,68,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,118,144,145,146,148,149,150,152,183,198,202,205,206,208,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,245,246,248,257,258,259,260,262,263,272,281,290,299,326,335,],[-4,-70,-38,-68,-26,-40,-66,-16,-8,-64,-9,-10,-11,-12,-13,-62,-5,-6,-2,-3,-7,-60,-58,-55,-50,-47,-44,-83,-22,-23,-27,-28,-29,-38,-30,247,-71,-18,-20,-21,-14,-63,-61,-59,-56,-57,-51,-52,-53,-54,-48,-49,-45,-46,-41,-42,-43,-159,-85,-84,289,-180,-17,-19,-31,-39,-180,306,-67,-65,-180,-69,]),'ELSE':([101,102,103,104,105,106,107,184,191,192,193,238,255,276,277,279,282,301,303,317,318,319,320,327,328,329,339,343,346,347,348,350,351,352,],[-174,-150,-151,-152,-153,-154,-155,-175,-190,-191,-192,-169,-193,-160,-169,-169,-157,-161,-162,-169,-156,-181,-178,-163,336,-182,-184,-183,-189,-177,-185,-186,-189,-187,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'push_lib_functions':([0,],[2,]),'translation_unit':([2,],[3,]),'external_declaration':([2,3,],[4,20,]),'function_definition':([2,3,],[5,5,]),'declaration':([2,3,46,178,181,254,280,],[6,6,99,242,99,288,305,]),'declaration_specifiers':([2,3,8,46,51,178,181,196,213,254,266,280,],[7,7,32,94,125,94,94,125,125,94,125,94,]),'type_specifier':([2,3,8,46,51,65,93,151,153,157,175,178,181,196,213,254,266,280,],[8,8,8,8,8,157,157,157,157,157,157,8,8,8,8,8,8,8,]),'struct_specifier':([2,3,8,46,51,65,93,151,153,157,175,178,181,196,213,254,266,280,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'struct':([2,3,8,46,51,65,93,151,153,157,175,178,181,196,213,254,266,280,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'function_declarator':([7,],[21,]),'init_declarator_list':([7,94,],[23,23,]),'pointer':([7,27,29,47,94,125,156,177,213,300,],[24,40,42,42,42,42,211,42,211,42,]),'direct_declarator':([7,24,29,42,47,94,125,177,300,],[25,37,43,53,43,43,43,43,43,]),'init_declarator':([7,47,94,],[26,119,26,]),'identifier':([7,24,29,42,47,94,125,177,300,],[28,28,28,28,28,28,28,28,28,]),'declarator':([7,29,47,94,125,177,300,],[30,41,30,30,197,237,237,]),'marker_function_start':([34,],[46,]),'marker_init':([36,],[47,]),'integer_constant':([38,44,46,60,61,62,64,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,185,186,187,189,190,199,200,209,214,216,247,251,261,265,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[49,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,293,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'marker_function_push':([39,],[51,]),'initializer':([44,],[54,]),'assignment_expression':([44,46,65,117,126,140,141,147,151,153,178,181,185,186,187,189,190,199,247,251,261,278,280,287,306,307,308,312,321,322,323,332,333,341,342,344,349,],[55,118,118,118,198,118,204,118,118,118,118,118,248,118,118,118,118,118,118,118,291,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'conditional_expression':([44,46,65,117,126,140,141,147,151,153,178,181,182,185,186,187,189,190,199,214,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[56,56,56,56,56,56,56,56,56,56,56,56,246,56,56,56,56,56,56,246,56,56,56,56,56,56,56,56,56,56,326,56,56,56,56,56,56,56,56,56,]),'unary_expression':([44,46,60,61,62,64,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,185,186,187,189,190,199,200,209,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[57,57,146,148,150,152,57,57,57,57,57,57,57,57,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,57,57,150,57,57,57,57,57,57,150,150,150,150,57,57,57,57,57,57,57,57,57,57,150,57,57,57,57,57,57,57,57,57,]),'logical_or_expression':([44,46,65,117,126,140,141,147,151,153,178,181,182,185,186,187,189,190,199,214,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'postfix_expression':([44,46,60,61,62,64,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,185,186,187,189,190,199,200,209,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'unary_operator':([44,46,60,61,62,64,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,185,186,187,189,190,199,200,209,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'cast_expression':([44,46,62,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,185,186,187,189,190,199,200,209,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[63,63,149,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,230,231,232,63,63,63,63,63,63,63,63,63,63,263,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'logical_and_expression':([44,46,65,117,126,140,141,147,151,153,178,181,182,185,186,187,189,190,199,200,214,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,258,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'primary_expression':([44,46,60,61,62,64,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,185,186,187,189,190,199,200,209,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'inclusive_or_expression':([44,46,65,117,126,140,141,147,151,153,178,181,182,185,186,187,189,190,199,200,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,272,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'float_constant':([44,46,60,61,62,64,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,185,186,187,189,190,199,200,209,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,]),'char_constant':([44,46,60,61,62,64,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,185,186,187,189,190,199,200,209,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'bool_constant':([44,46,60,61,62,64,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,185,186,187,189,190,199,200,209,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'string_constant':([44,46,60,61,62,64,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,178,181,182,185,186,187,189,190,199,200,209,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'exclusive_or_expression':([44,46,65,117,126,140,141,147,151,153,159,178,181,182,185,186,187,189,190,199,200,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[81,81,81,81,81,81,81,81,81,81,217,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'and_expression':([44,46,65,117,126,140,141,147,151,153,159,160,178,181,182,185,186,187,189,190,199,200,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[87,87,87,87,87,87,87,87,87,87,87,218,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,]),'equality_expression':([44,46,65,117,126,140,141,147,151,153,159,160,161,178,181,182,185,186,187,189,190,199,200,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[88,88,88,88,88,88,88,88,88,88,88,88,219,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,]),'relational_expression':([44,46,65,117,126,140,141,147,151,153,159,160,161,162,163,178,181,182,185,186,187,189,190,199,200,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[89,89,89,89,89,89,89,89,89,89,89,89,89,220,221,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,]),'shift_expression':([44,46,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,178,181,182,185,186,187,189,190,199,200,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,222,223,224,225,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,]),'additive_expression':([44,46,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,178,181,182,185,186,187,189,190,199,200,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,226,227,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,]),'multiplicative_expression':([44,46,65,117,126,140,141,147,151,153,159,160,161,162,163,164,165,166,167,168,169,170,171,178,181,182,185,186,187,189,190,199,200,214,216,247,251,261,278,280,287,306,307,308,312,313,321,322,323,332,333,341,342,344,349,],[92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,228,229,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,]),'marker_struct_1':([45,],[93,]),'block_item_list':([46,],[97,]),'block_item':([46,181,],[98,244,]),'statement':([46,178,181,189,247,278,280,306,307,308,321,332,341,342,344,349,],[100,241,100,252,282,302,241,318,319,320,329,339,346,347,348,351,]),'labeled_statement':([46,178,181,189,247,278,280,306,307,308,321,332,341,342,344,349,],[102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,]),'compound_statement':([46,178,181,189,247,278,280,306,307,308,321,332,341,342,344,349,],[103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,]),'expression_statement':([46,178,181,189,190,247,278,280,287,306,307,308,312,321,332,341,342,344,349,],[104,104,104,104,253,104,104,104,311,104,104,104,325,104,104,104,104,104,104,]),'selection_statement':([46,178,181,189,247,278,280,306,307,308,321,332,341,342,344,349,],[105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'iteration_statement':([46,178,181,189,247,278,280,306,307,308,321,332,341,342,344,349,],[106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,]),'jump_statement':([46,178,181,189,247,278,280,306,307,308,321,332,341,342,344,349,],[107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,]),'marker_case_1':([46,178,181,189,247,278,280,306,307,308,321,332,341,342,344,349,],[108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,]),'expression':([46,65,117,140,147,151,153,178,181,186,187,189,190,199,247,251,278,280,287,306,307,308,312,321,322,323,332,333,341,342,344,349,],[109,154,194,201,154,154,154,109,109,249,250,109,109,257,109,285,109,109,109,109,109,109,109,109,330,331,109,340,109,109,109,109,]),'parameter_type_list':([51,213,266,],[122,269,295,]),'parameter_list':([51,213,266,],[123,123,123,]),'parameter_declaration':([51,196,213,266,],[124,256,124,124,]),'assignment_operator':([57,],[126,]),'type_name':([65,151,153,],[155,155,207,]),'specifier_qualifier_list':([65,93,151,153,157,175,],[156,177,156,156,215,177,]),'struct_declaration_list':([93,],[175,]),'struct_declaration':([93,175,],[176,234,]),'marker_compound_statement_push':([95,],[178,]),'marker_function_end':([96,180,],[179,243,]),'marker_global':([97,112,113,138,139,158,239,240,253,258,272,283,288,289,304,309,310,311,324,325,326,334,336,338,345,],[181,188,189,199,200,216,278,280,287,290,299,307,312,313,278,321,322,323,332,333,335,341,342,344,349,]),'argument_expression_list':([141,],[203,]),'abstract_declarator':([156,213,],[210,267,]),'direct_abstract_declarator':([156,211,213,],[212,264,212,]),'struct_declarator_list':([177,],[235,]),'struct_declarator':([177,300,],[236,316,]),'statement_list':([178,280,],[239,304,]),'declaration_list':([178,],[240,]),'constant_expression':([182,214,],[245,271,]),'push_marker_loops':([190,],[254,]),'marker_struct_0':([233,],[273,]),'marker_compound_statement_pop':([238,277,279,317,],[276,301,303,327,]),'marker_case_2':([245,],[281,]),'structDeclaratorMarkerStart':([275,],[300,]),'marker_switch':([284,],[308,]),'marker_global_2':([319,],[328,]),'pop_marker_loops':([346,351,],[350,352,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> push_lib_functions translation_unit','start',2,'p_start','parser.py',194),
+  ('bool_constant -> TRUE','bool_constant',1,'p_bool_constant','parser.py',243),
+  ('bool_constant -> FALSE','bool_constant',1,'p_bool_constant','parser.py',244),
+  ('integer_constant -> INTEGER_CONSTANT','integer_constant',1,'p_integer_constant','parser.py',252),
+  ('float_constant -> FLOAT_CONSTANT','float_constant',1,'p_float_constant','parser.py',287),
+  ('char_constant -> CHAR_CONSTANT','char_constant',1,'p_char_constant','parser.py',323),
+  ('string_constant -> STRING_CONSTANT','string_constant',1,'p_string_constant','parser.py',358),
+  ('primary_expression -> IDENTIFIER','primary_expression',1,'p_primary_expression','parser.py',374),
+  ('primary_expression -> integer_constant','primary_expression',1,'p_primary_expression','parser.py',375),
+  ('primary_expression -> float_constant','primary_expression',1,'p_primary_expression','parser.py',376),
+  ('primary_expression -> char_constant','primary_expression',1,'p_primary_expression','parser.py',377),
+  ('primary_expression -> bool_constant','primary_expression',1,'p_primary_expression','parser.py',378),
+  ('primary_expression -> string_constant','primary_expression',1,'p_primary_expression','parser.py',379),
+  ('primary_expression -> ( expression )','primary_expression',3,'p_primary_expression','parser.py',380),
+  ('identifier -> IDENTIFIER','identifier',1,'p_identifier','parser.py',656),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression','parser.py',672),
+  ('postfix_expression -> postfix_expression [ expression ]','postfix_expression',4,'p_postfix_expression','parser.py',673),
+  ('postfix_expression -> postfix_expression ( )','postfix_expression',3,'p_postfix_expression','parser.py',674),
+  ('postfix_expression -> postfix_expression ( argument_expression_list )','postfix_expression',4,'p_postfix_expression','parser.py',675),
+  ('postfix_expression -> postfix_expression . IDENTIFIER','postfix_expression',3,'p_postfix_expression','parser.py',676),
+  ('postfix_expression -> postfix_expression PTR_OP IDENTIFIER','postfix_expression',3,'p_postfix_expression','parser.py',677),
+  ('postfix_expression -> postfix_expression INC_OP','postfix_expression',2,'p_postfix_expression','parser.py',678),
+  ('postfix_expression -> postfix_expression DEC_OP','postfix_expression',2,'p_postfix_expression','parser.py',679),
+  ('argument_expression_list -> assignment_expression','argument_expression_list',1,'p_argument_expression_list','parser.py',2011),
+  ('argument_expression_list -> argument_expression_list , assignment_expression','argument_expression_list',3,'p_argument_expression_list','parser.py',2012),
+  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression','parser.py',2046),
+  ('unary_expression -> INC_OP unary_expression','unary_expression',2,'p_unary_expression','parser.py',2047),
+  ('unary_expression -> DEC_OP unary_expression','unary_expression',2,'p_unary_expression','parser.py',2048),
+  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression','parser.py',2049),
+  ('unary_expression -> SIZEOF unary_expression','unary_expression',2,'p_unary_expression','parser.py',2050),
+  ('unary_expression -> SIZEOF ( type_name )','unary_expression',4,'p_unary_expression','parser.py',2051),
+  ('unary_operator -> &','unary_operator',1,'p_unary_operator','parser.py',2569),
+  ('unary_operator -> *','unary_operator',1,'p_unary_operator','parser.py',2570),
+  ('unary_operator -> +','unary_operator',1,'p_unary_operator','parser.py',2571),
+  ('unary_operator -> -','unary_operator',1,'p_unary_operator','parser.py',2572),
+  ('unary_operator -> ~','unary_operator',1,'p_unary_operator','parser.py',2573),
+  ('unary_operator -> !','unary_operator',1,'p_unary_operator','parser.py',2574),
+  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression','parser.py',2583),
+  ('cast_expression -> ( type_name ) cast_expression','cast_expression',4,'p_cast_expression','parser.py',2584),
+  ('multiplicative_expression -> cast_expression','multiplicative_expression',1,'p_multiplicative_expression','parser.py',2904),
+  ('multiplicative_expression -> multiplicative_expression * cast_expression','multiplicative_expression',3,'p_multiplicative_expression','parser.py',2905),
+  ('multiplicative_expression -> multiplicative_expression / cast_expression','multiplicative_expression',3,'p_multiplicative_expression','parser.py',2906),
+  ('multiplicative_expression -> multiplicative_expression % cast_expression','multiplicative_expression',3,'p_multiplicative_expression','parser.py',2907),
+  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_additive_expression','parser.py',3174),
+  ('additive_expression -> additive_expression + multiplicative_expression','additive_expression',3,'p_additive_expression','parser.py',3175),
+  ('additive_expression -> additive_expression - multiplicative_expression','additive_expression',3,'p_additive_expression','parser.py',3176),
+  ('shift_expression -> additive_expression','shift_expression',1,'p_shift_expression','parser.py',3438),
+  ('shift_expression -> shift_expression LEFT_OP additive_expression','shift_expression',3,'p_shift_expression','parser.py',3439),
+  ('shift_expression -> shift_expression RIGHT_OP additive_expression','shift_expression',3,'p_shift_expression','parser.py',3440),
+  ('relational_expression -> shift_expression','relational_expression',1,'p_relational_expression','parser.py',3654),
+  ('relational_expression -> relational_expression < shift_expression','relational_expression',3,'p_relational_expression','parser.py',3655),
+  ('relational_expression -> relational_expression > shift_expression','relational_expression',3,'p_relational_expression','parser.py',3656),
+  ('relational_expression -> relational_expression LE_OP shift_expression','relational_expression',3,'p_relational_expression','parser.py',3657),
+  ('relational_expression -> relational_expression GE_OP shift_expression','relational_expression',3,'p_relational_expression','parser.py',3658),
+  ('equality_expression -> relational_expression','equality_expression',1,'p_equality_expression','parser.py',3949),
+  ('equality_expression -> equality_expression EQ_OP relational_expression','equality_expression',3,'p_equality_expression','parser.py',3950),
+  ('equality_expression -> equality_expression NE_OP relational_expression','equality_expression',3,'p_equality_expression','parser.py',3951),
+  ('and_expression -> equality_expression','and_expression',1,'p_and_expression','parser.py',4298),
+  ('and_expression -> and_expression & equality_expression','and_expression',3,'p_and_expression','parser.py',4299),
+  ('exclusive_or_expression -> and_expression','exclusive_or_expression',1,'p_exclusive_or_expression','parser.py',4507),
+  ('exclusive_or_expression -> exclusive_or_expression ^ and_expression','exclusive_or_expression',3,'p_exclusive_or_expression','parser.py',4508),
+  ('inclusive_or_expression -> exclusive_or_expression','inclusive_or_expression',1,'p_inclusive_or_expression','parser.py',4718),
+  ('inclusive_or_expression -> inclusive_or_expression | exclusive_or_expression','inclusive_or_expression',3,'p_inclusive_or_expression','parser.py',4719),
+  ('logical_and_expression -> inclusive_or_expression','logical_and_expression',1,'p_logical_and_expression','parser.py',4928),
+  ('logical_and_expression -> logical_and_expression AND_OP marker_global inclusive_or_expression marker_global','logical_and_expression',5,'p_logical_and_expression','parser.py',4929),
+  ('logical_or_expression -> logical_and_expression','logical_or_expression',1,'p_logical_or_expression','parser.py',5016),
+  ('logical_or_expression -> logical_or_expression OR_OP marker_global logical_and_expression marker_global','logical_or_expression',5,'p_logical_or_expression','parser.py',5017),
+  ('conditional_expression -> logical_or_expression','conditional_expression',1,'p_conditional_expression','parser.py',5100),
+  ('conditional_expression -> logical_or_expression ? marker_global expression : marker_global conditional_expression marker_global','conditional_expression',8,'p_conditional_expression','parser.py',5101),
+  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','parser.py',5466),
+  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','parser.py',5467),
+  ('assignment_operator -> =','assignment_operator',1,'p_assignment_operator','parser.py',5814),
+  ('assignment_operator -> MUL_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',5815),
+  ('assignment_operator -> DIV_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',5816),
+  ('assignment_operator -> MOD_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',5817),
+  ('assignment_operator -> ADD_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',5818),
+  ('assignment_operator -> SUB_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',5819),
+  ('assignment_operator -> LEFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',5820),
+  ('assignment_operator -> RIGHT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',5821),
+  ('assignment_operator -> AND_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',5822),
+  ('assignment_operator -> XOR_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',5823),
+  ('assignment_operator -> OR_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',5824),
+  ('expression -> assignment_expression','expression',1,'p_expression','parser.py',5834),
+  ('expression -> expression , assignment_expression','expression',3,'p_expression','parser.py',5835),
+  ('constant_expression -> conditional_expression','constant_expression',1,'p_constant_expression','parser.py',5851),
+  ('initializer -> assignment_expression','initializer',1,'p_initializer','parser.py',5861),
+  ('declaration -> declaration_specifiers ;','declaration',2,'p_declaration','parser.py',5874),
+  ('declaration -> declaration_specifiers init_declarator_list ;','declaration',3,'p_declaration','parser.py',5875),
+  ('declaration_specifiers -> type_specifier','declaration_specifiers',1,'p_declaration_specifiers','parser.py',5886),
+  ('declaration_specifiers -> type_specifier declaration_specifiers','declaration_specifiers',2,'p_declaration_specifiers','parser.py',5887),
+  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','parser.py',5912),
+  ('init_declarator_list -> init_declarator_list , marker_init init_declarator','init_declarator_list',4,'p_init_declarator_list','parser.py',5913),
+  ('marker_init -> <empty>','marker_init',0,'p_marker_init','parser.py',5925),
+  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','parser.py',5933),
+  ('init_declarator -> declarator = initializer','init_declarator',3,'p_init_declarator','parser.py',5934),
+  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','parser.py',6511),
+  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','parser.py',6512),
+  ('type_specifier -> SHORT','type_specifier',1,'p_type_specifier','parser.py',6513),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','parser.py',6514),
+  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','parser.py',6515),
+  ('type_specifier -> SIGNED','type_specifier',1,'p_type_specifier','parser.py',6516),
+  ('type_specifier -> UNSIGNED','type_specifier',1,'p_type_specifier','parser.py',6517),
+  ('type_specifier -> struct_specifier','type_specifier',1,'p_type_specifier','parser.py',6518),
+  ('type_specifier -> BOOL','type_specifier',1,'p_type_specifier','parser.py',6519),
+  ('struct_specifier -> struct IDENTIFIER { marker_struct_1 struct_declaration_list } marker_struct_0','struct_specifier',7,'p_struct_specifier','parser.py',6543),
+  ('struct_specifier -> struct IDENTIFIER','struct_specifier',2,'p_struct_specifier','parser.py',6544),
+  ('marker_struct_0 -> <empty>','marker_struct_0',0,'p_marker_struct_0','parser.py',6603),
+  ('marker_struct_1 -> <empty>','marker_struct_1',0,'p_marker_struct_1','parser.py',6611),
+  ('struct -> STRUCT','struct',1,'p_struct','parser.py',6623),
+  ('struct_declaration_list -> struct_declaration','struct_declaration_list',1,'p_struct_declaration_list','parser.py',6631),
+  ('struct_declaration_list -> struct_declaration_list struct_declaration','struct_declaration_list',2,'p_struct_declaration_list','parser.py',6632),
+  ('struct_declaration -> specifier_qualifier_list struct_declarator_list ;','struct_declaration',3,'p_struct_declaration','parser.py',6644),
+  ('specifier_qualifier_list -> type_specifier','specifier_qualifier_list',1,'p_specifier_qualifier_list','parser.py',6714),
+  ('specifier_qualifier_list -> type_specifier specifier_qualifier_list','specifier_qualifier_list',2,'p_specifier_qualifier_list','parser.py',6715),
+  ('struct_declarator_list -> struct_declarator','struct_declarator_list',1,'p_struct_declarator_list','parser.py',6731),
+  ('struct_declarator_list -> struct_declarator_list , structDeclaratorMarkerStart struct_declarator','struct_declarator_list',4,'p_struct_declarator_list','parser.py',6732),
+  ('structDeclaratorMarkerStart -> <empty>','structDeclaratorMarkerStart',0,'p_structDeclaratorMarkerStart','parser.py',6743),
+  ('struct_declarator -> declarator','struct_declarator',1,'p_struct_declarator','parser.py',6750),
+  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator','parser.py',6849),
+  ('declarator -> direct_declarator','declarator',1,'p_declarator','parser.py',6850),
+  ('function_declarator -> pointer direct_declarator','function_declarator',2,'p_function_declarator','parser.py',6864),
+  ('function_declarator -> direct_declarator','function_declarator',1,'p_function_declarator','parser.py',6865),
+  ('direct_declarator -> identifier','direct_declarator',1,'p_direct_declarator_1','parser.py',6877),
+  ('direct_declarator -> ( declarator )','direct_declarator',3,'p_direct_declarator_1','parser.py',6878),
+  ('direct_declarator -> direct_declarator [ ]','direct_declarator',3,'p_direct_declarator_1','parser.py',6879),
+  ('direct_declarator -> direct_declarator [ integer_constant ]','direct_declarator',4,'p_direct_declarator_2','parser.py',6901),
+  ('direct_declarator -> direct_declarator ( marker_function_push )','direct_declarator',4,'p_direct_declarator_2','parser.py',6902),
+  ('direct_declarator -> direct_declarator ( marker_function_push parameter_type_list )','direct_declarator',5,'p_direct_declarator_3','parser.py',6922),
+  ('marker_function_push -> <empty>','marker_function_push',0,'p_marker_function_push','parser.py',6940),
+  ('pointer -> *','pointer',1,'p_pointer','parser.py',6948),
+  ('pointer -> * pointer','pointer',2,'p_pointer','parser.py',6949),
+  ('parameter_type_list -> parameter_list','parameter_type_list',1,'p_parameter_type_list','parser.py',6980),
+  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','parser.py',6986),
+  ('parameter_list -> parameter_list , parameter_declaration','parameter_list',3,'p_parameter_list','parser.py',6987),
+  ('parameter_declaration -> declaration_specifiers declarator','parameter_declaration',2,'p_parameter_declaration','parser.py',6998),
+  ('type_name -> specifier_qualifier_list','type_name',1,'p_type_name','parser.py',7010),
+  ('type_name -> specifier_qualifier_list abstract_declarator','type_name',2,'p_type_name','parser.py',7011),
+  ('abstract_declarator -> pointer','abstract_declarator',1,'p_abstract_declarator','parser.py',7031),
+  ('abstract_declarator -> direct_abstract_declarator','abstract_declarator',1,'p_abstract_declarator','parser.py',7032),
+  ('abstract_declarator -> pointer direct_abstract_declarator','abstract_declarator',2,'p_abstract_declarator','parser.py',7033),
+  ('direct_abstract_declarator -> ( abstract_declarator )','direct_abstract_declarator',3,'p_direct_abstract_declarator','parser.py',7050),
+  ('direct_abstract_declarator -> [ ]','direct_abstract_declarator',2,'p_direct_abstract_declarator','parser.py',7051),
+  ('direct_abstract_declarator -> [ constant_expression ]','direct_abstract_declarator',3,'p_direct_abstract_declarator','parser.py',7052),
+  ('direct_abstract_declarator -> direct_abstract_declarator [ ]','direct_abstract_declarator',3,'p_direct_abstract_declarator','parser.py',7053),
+  ('direct_abstract_declarator -> direct_abstract_declarator [ integer_constant ]','direct_abstract_declarator',4,'p_direct_abstract_declarator','parser.py',7054),
+  ('direct_abstract_declarator -> ( )','direct_abstract_declarator',2,'p_direct_abstract_declarator','parser.py',7055),
+  ('direct_abstract_declarator -> ( parameter_type_list )','direct_abstract_declarator',3,'p_direct_abstract_declarator','parser.py',7056),
+  ('direct_abstract_declarator -> direct_abstract_declarator ( )','direct_abstract_declarator',3,'p_direct_abstract_declarator','parser.py',7057),
+  ('direct_abstract_declarator -> direct_abstract_declarator ( parameter_type_list )','direct_abstract_declarator',4,'p_direct_abstract_declarator','parser.py',7058),
+  ('statement -> labeled_statement','statement',1,'p_statement','parser.py',7089),
+  ('statement -> compound_statement','statement',1,'p_statement','parser.py',7090),
+  ('statement -> expression_statement','statement',1,'p_statement','parser.py',7091),
+  ('statement -> selection_statement','statement',1,'p_statement','parser.py',7092),
+  ('statement -> iteration_statement','statement',1,'p_statement','parser.py',7093),
+  ('statement -> jump_statement','statement',1,'p_statement','parser.py',7094),
+  ('labeled_statement -> marker_case_1 CASE constant_expression marker_case_2 : statement','labeled_statement',6,'p_labeled_statement_1','parser.py',7102),
+  ('labeled_statement -> marker_case_1 DEFAULT : statement','labeled_statement',4,'p_labeled_statement_2','parser.py',7116),
+  ('marker_case_1 -> <empty>','marker_case_1',0,'p_marker_case_1','parser.py',7130),
+  ('marker_case_2 -> <empty>','marker_case_2',0,'p_marker_case_2','parser.py',7141),
+  ('compound_statement -> { marker_compound_statement_push } marker_compound_statement_pop','compound_statement',4,'p_compound_statement','parser.py',7152),
+  ('compound_statement -> { marker_compound_statement_push statement_list } marker_compound_statement_pop','compound_statement',5,'p_compound_statement','parser.py',7153),
+  ('compound_statement -> { marker_compound_statement_push declaration_list } marker_compound_statement_pop','compound_statement',5,'p_compound_statement','parser.py',7154),
+  ('compound_statement -> { marker_compound_statement_push declaration_list marker_global statement_list } marker_compound_statement_pop','compound_statement',7,'p_compound_statement','parser.py',7155),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',7195),
+  ('statement_list -> statement_list marker_global statement','statement_list',3,'p_statement_list','parser.py',7196),
+  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','parser.py',7232),
+  ('declaration_list -> declaration_list marker_global declaration','declaration_list',3,'p_declaration_list','parser.py',7233),
+  ('marker_compound_statement_push -> <empty>','marker_compound_statement_push',0,'p_marker_compound_statement_push','parser.py',7269),
+  ('marker_compound_statement_pop -> <empty>','marker_compound_statement_pop',0,'p_marker_compound_statement_pop','parser.py',7277),
+  ('block_item_list -> block_item','block_item_list',1,'p_block_item_list','parser.py',7285),
+  ('block_item_list -> block_item_list marker_global block_item','block_item_list',3,'p_block_item_list','parser.py',7286),
+  ('block_item -> declaration','block_item',1,'p_block_item','parser.py',7322),
+  ('block_item -> statement','block_item',1,'p_block_item','parser.py',7323),
+  ('expression_statement -> ;','expression_statement',1,'p_expression_statement','parser.py',7332),
+  ('expression_statement -> expression ;','expression_statement',2,'p_expression_statement','parser.py',7333),
+  ('selection_statement -> IF ( expression ) marker_global statement marker_global_2','selection_statement',7,'p_selection_statement','parser.py',7344),
+  ('selection_statement -> IF ( expression ) marker_global statement marker_global_2 ELSE marker_global statement','selection_statement',10,'p_selection_statement','parser.py',7345),
+  ('selection_statement -> SWITCH ( expression ) marker_switch statement','selection_statement',6,'p_selection_statement','parser.py',7346),
+  ('marker_switch -> <empty>','marker_switch',0,'p_marker_switch','parser.py',7432),
+  ('marker_global -> <empty>','marker_global',0,'p_marker_global','parser.py',7444),
+  ('marker_global_2 -> <empty>','marker_global_2',0,'p_marker_global_2','parser.py',7455),
+  ('iteration_statement -> WHILE marker_global ( expression ) marker_global statement','iteration_statement',7,'p_iteration_statement_1','parser.py',7467),
+  ('iteration_statement -> DO marker_global statement WHILE ( marker_global expression ) ;','iteration_statement',9,'p_iteration_statement_1','parser.py',7468),
+  ('iteration_statement -> FOR ( expression_statement marker_global expression_statement ) marker_global statement','iteration_statement',8,'p_iteration_statement_2','parser.py',7496),
+  ('iteration_statement -> FOR ( expression_statement marker_global expression_statement marker_global expression ) marker_global statement','iteration_statement',10,'p_iteration_statement_2','parser.py',7497),
+  ('iteration_statement -> FOR ( push_marker_loops declaration marker_global expression_statement ) marker_global statement pop_marker_loops','iteration_statement',10,'p_iteration_statement_3','parser.py',7531),
+  ('iteration_statement -> FOR ( push_marker_loops declaration marker_global expression_statement marker_global expression ) marker_global statement pop_marker_loops','iteration_statement',12,'p_iteration_statement_3','parser.py',7532),
+  ('push_marker_loops -> <empty>','push_marker_loops',0,'p_push_marker_loops','parser.py',7560),
+  ('pop_marker_loops -> <empty>','pop_marker_loops',0,'p_pop_marker_loops','parser.py',7569),
+  ('jump_statement -> CONTINUE ;','jump_statement',2,'p_jump_statement','parser.py',7580),
+  ('jump_statement -> BREAK ;','jump_statement',2,'p_jump_statement','parser.py',7581),
+  ('jump_statement -> RETURN ;','jump_statement',2,'p_jump_statement','parser.py',7582),
+  ('jump_statement -> RETURN expression ;','jump_statement',3,'p_jump_statement','parser.py',7583),
+  ('translation_unit -> translation_unit external_declaration','translation_unit',2,'p_translation_unit','parser.py',7851),
+  ('translation_unit -> external_declaration','translation_unit',1,'p_translation_unit','parser.py',7852),
+  ('external_declaration -> function_definition','external_declaration',1,'p_external_declaration','parser.py',7866),
+  ('external_declaration -> declaration','external_declaration',1,'p_external_declaration','parser.py',7867),
+  ('function_definition -> declaration_specifiers function_declarator { marker_function_start } marker_function_end','function_definition',6,'p_function_definition','parser.py',7874),
+  ('function_definition -> declaration_specifiers function_declarator { marker_function_start block_item_list } marker_function_end','function_definition',7,'p_function_definition','parser.py',7875),
+  ('marker_function_start -> <empty>','marker_function_start',0,'p_marker_function_start','parser.py',8094),
+  ('marker_function_end -> <empty>','marker_function_end',0,'p_marker_function_end','parser.py',8251),
+  ('push_lib_functions -> <empty>','push_lib_functions',0,'p_push_lib_functions','parser.py',8262),
+]
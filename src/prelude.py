@@ -0,0 +1,118 @@
+# The library functions a program can call without declaring them.
+# The registry maps each name to its return type and parameter count. It is
+# declared in the global scope before the program, in this order, so the
+# symbol table lists the builtins first. Prototype files add functions or
+# replace builtins with one prototype per line, the return type followed by
+# the name and the parameter count, e.g.
+#
+#   # <return type> <name> <parameter count>
+#   char * strncpy 3
+#   int puts 1
+
+import re
+
+BUILTINS = {
+    # printf and scanf with 2 arguments (string, placeholder value)
+    "printf": (("void",), 2),
+    "scanf": (("void",), 2),
+    # math
+    "abs": (("int",), 1),
+    "sqrt": (("float",), 1),
+    "ceil": (("float",), 1),
+    "floor": (("float",), 1),
+    "pow": (("float",), 2),
+    "fabs": (("float",), 1),
+    "log": (("float",), 1),
+    "log10": (("float",), 1),
+    "fmod": (("float",), 2),
+    "exp": (("float",), 1),
+    "cos": (("float",), 1),
+    "sin": (("float",), 1),
+    "acos": (("float",), 1),
+    "asin": (("float",), 1),
+    "tan": (("float",), 1),
+    "atan": (("float",), 1),
+    # strings
+    "strlen": (("int",), 1),
+    "strlwr": (("char", "*"), 1),
+    "strupr": (("char", "*"), 1),
+    "strcpy": (("char", "*"), 2),
+    "strcat": (("char", "*"), 2),
+    "strcmp": (("int",), 2),
+    "strrev": (("char", "*"), 1),
+    # memory
+    "malloc": (("void", "*"), 1),
+    "calloc": (("void", "*"), 2),
+    "realloc": (("void", "*"), 2),
+    "free": (("void",), 1),
+}
+
+
+# the types a prototype can return and the words that give their signedness
+BASE_TYPES = ["void", "bool", "char", "short", "int", "float"]
+INTEGER_TYPES = ["char", "short", "int"]
+SIGNEDNESS = ["unsigned", "signed"]
+
+
+def return_type(words):
+    """
+    Returns the return type words of a prototype the way the parser keeps
+    types, the base type, its signedness and a "*" per level of indirection,
+    e.g. ("int", "unsigned", "*") for "unsigned int*". Returns None if the
+    words do not name a type.
+    """
+    names = []
+    stars = 0
+    for word in words:
+        for part in re.findall(r"\*|[^*]+", word):
+            if part == "*":
+                stars += 1
+            elif stars:
+                return None
+            else:
+                names.append(part)
+    signs = [name for name in names if name in SIGNEDNESS]
+    bases = [name for name in names if name not in SIGNEDNESS] or ["int"]
+    if len(bases) != 1 or bases[0] not in BASE_TYPES or len(signs) > 1:
+        return None
+    if signs and bases[0] not in INTEGER_TYPES:
+        return None
+    return tuple(bases + signs + ["*"] * stars)
+
+
+def read_prototypes(path):
+    """
+    Returns the prototypes of a prototype file in the form of BUILTINS.
+    Raises ValueError naming the line of a malformed prototype.
+    """
+    prototypes = {}
+    with open(path, "r") as f:
+        for lineno, line in enumerate(f, 1):
+            words = line.split("#", 1)[0].split()
+            if not words:
+                continue
+            if len(words) < 3 or not words[-1].isdigit():
+                raise ValueError(f"{path}:{lineno}: expected a prototype: {line!r}")
+            data_type = return_type(words[:-2])
+            if data_type is None:
+                raise ValueError(f"{path}:{lineno}: unknown return type: {line!r}")
+            prototypes[words[-2]] = (data_type, int(words[-1]))
+    return prototypes
+
+
+preludes = {}
+
+
+def prelude(paths=()):
+    """
+    Returns the builtins with the prototypes of the files in paths. Each
+    prelude is only read once per process.
+    """
+    key = tuple(paths)
+    found = preludes.get(key)
+    if found is None:
+        found = dict(BUILTINS)
+        for path in key:
+            found.update(read_prototypes(path))
+        preludes[key] = found
+    return found
@@ -0,0 +1,333 @@
+# Linear scan register allocation for the generated assembly (-O1).
+# The op_* handlers of the code generator only use registers inside the code
+# of one TAC instruction, every value goes back to its N(%ebp) slot in
+# between. This pass keeps stack slots in registers across instructions:
+# live ranges of the slots are computed over the TAC instructions of each
+# function and get one of the registers that the handler code of their range
+# leaves alone. Slots whose range gets no register are spilled, i.e. they
+# keep living in their stack slot as with -O0. Parameters that stay in a
+# register are loaded once after the function prologue.
+
+import re
+
+from three_address_code import Opcode
+
+slot_pattern = re.compile(r"(-?\d+)\(%ebp\)")
+register_pattern = re.compile(r"%(e?[abcd]x|[abcd][lh]|e?[sd]i)\b")
+
+# instructions that read or write a whole 32 bit slot and also take a
+# register in its place
+WORD_OPS = {
+    "movl": "write",
+    "addl": "update",
+    "subl": "update",
+    "imull": "update",
+    "andl": "update",
+    "orl": "update",
+    "xorl": "update",
+    "negl": "update",
+    "notl": "update",
+    "cmpl": "read",
+    "cmp": "read",
+    "push": "read",
+    "idivl": "read",
+}
+
+# bytes touched by the other instructions that address a slot
+ACCESS_SIZES = {
+    "movb": 1,
+    "movzbl": 1,
+    "movsbl": 1,
+    "flds": 4,
+    "fstps": 4,
+    "fsts": 4,
+    "fadds": 4,
+    "fsubs": 4,
+    "fmuls": 4,
+    "fdivs": 4,
+    "fildl": 4,
+    "fistpl": 4,
+    "fisttpl": 4,
+}
+
+
+def register_name(name):
+    if len(name) == 2 and name[1] in "lhx":
+        return "%e" + name[0] + "x"
+    if len(name) == 2:
+        return "%e" + name
+    return "%" + name
+
+
+class Window:
+    # the assembly of one TAC instruction, final_code[start:end]
+    __slots__ = (
+        "opcode",
+        "fields",
+        "start",
+        "end",
+        "touched",
+        "accesses",
+        "use",
+        "defs",
+        "live_in",
+        "live_out",
+    )
+
+    def __init__(self, opcode, fields, start, end):
+        self.opcode = opcode
+        self.fields = fields
+        self.start = start
+        self.end = end
+        self.touched = set()
+        self.accesses = []
+        self.use = set()
+        self.defs = set()
+        self.live_in = set()
+        self.live_out = set()
+
+
+class Web:
+    __slots__ = ("slot", "start", "end", "register")
+
+    def __init__(self, slot, start, end):
+        self.slot = slot
+        self.start = start
+        self.end = end
+        self.register = None
+
+
+class RegisterAllocator:
+    def __init__(self, final_code, register_list):
+        self.final_code = final_code
+        self.register_list = register_list
+        self.promoted = []
+        self.spilled = []
+        self.loads = {}
+
+    def allocate(self, windows):
+        # every function starts with its label
+        start = 0
+        for i in range(1, len(windows) + 1):
+            if i == len(windows) or windows[i].opcode == Opcode.LABEL:
+                self.allocate_function(windows[start:i], start)
+                start = i
+
+        code = []
+        for n, line in enumerate(self.final_code):
+            code += self.loads.get(n, [])
+            code.append(line)
+        self.final_code[:] = code
+
+    def scan(self, window, blocked, escapes):
+        for line in self.final_code[window.start : window.end]:
+            mnemonic = line.split(" ", 1)[0]
+            if mnemonic == "call":
+                window.touched.update(self.register_list)
+            elif mnemonic in ("cltd", "idivl"):
+                window.touched.update(("%eax", "%edx"))
+            for match in register_pattern.finditer(line):
+                window.touched.add(register_name(match.group(1)))
+
+            for match in slot_pattern.finditer(line):
+                slot = int(match.group(1))
+                # the saved %ebp and the return address
+                if 0 <= slot < 8:
+                    continue
+                if mnemonic == "leal":
+                    escapes.append(slot)
+                elif mnemonic in WORD_OPS:
+                    kind = WORD_OPS[mnemonic]
+                    # only the last operand is written
+                    if match.end() != len(line.rstrip()):
+                        kind = "read"
+                    window.accesses.append((slot, kind))
+                else:
+                    blocked.append((slot, ACCESS_SIZES.get(mnemonic, 8)))
+
+        for slot, kind in window.accesses:
+            if kind != "write" and slot not in window.defs:
+                window.use.add(slot)
+            if kind != "read":
+                window.defs.add(slot)
+
+    def candidates(self, windows, blocked, escapes):
+        # slots that are only ever accessed as a whole word and whose address
+        # is never taken. An address taken at N reaches everything above it
+        # within the locals or the parameters, arrays and structs grow upwards
+        # from their base.
+        lowest_local = min([slot for slot in escapes if slot < 0], default=0)
+        lowest_param = min([slot for slot in escapes if slot > 0], default=None)
+        slots = {slot for window in windows for slot, _ in window.accesses}
+        candidates = set()
+        for slot in slots:
+            if lowest_local <= slot < 0:
+                continue
+            if slot > 0 and lowest_param is not None and slot >= lowest_param:
+                continue
+            # parameters are loaded after the prologue of the function
+            if slot > 0 and windows[0].opcode != Opcode.LABEL:
+                continue
+            if any(other < slot + 4 and slot < other + size for other, size in blocked):
+                continue
+            if any(other != slot and abs(other - slot) < 4 for other in slots):
+                continue
+            candidates.add(slot)
+        return candidates
+
+    def successors(self, windows, base, i):
+        window = windows[i]
+        following = [i + 1] if i + 1 < len(windows) else []
+        if window.opcode in (Opcode.RETURN, Opcode.RETURN_STRUCT):
+            return []
+        if window.opcode == Opcode.GOTO:
+            following = []
+        if window.opcode in (Opcode.GOTO, Opcode.IFNZ_GOTO):
+            label = window.fields[1 if window.opcode == Opcode.GOTO else 2]
+            target = int(label) - 1 - base
+            if 0 <= target < len(windows):
+                following.append(target)
+        return following
+
+    def liveness(self, windows, successors):
+        changed = True
+        while changed:
+            changed = False
+            for i in reversed(range(len(windows))):
+                window = windows[i]
+                live_out = set()
+                for j in successors[i]:
+                    live_out |= windows[j].live_in
+                live_in = window.use | (live_out - window.defs)
+                if live_in != window.live_in or live_out != window.live_out:
+                    window.live_in = live_in
+                    window.live_out = live_out
+                    changed = True
+
+    def find_webs(self, windows, successors, slot):
+        # maximal runs of instructions where the slot is live or accessed,
+        # joined by the jumps that carry its value
+        present = [
+            slot in window.live_in
+            or slot in window.live_out
+            or slot in window.use
+            or slot in window.defs
+            for window in windows
+        ]
+        run_of = [None] * len(windows)
+        runs = []
+        for i in range(len(windows)):
+            if present[i]:
+                if i == 0 or not present[i - 1]:
+                    runs.append([i, i])
+                runs[-1][1] = i
+                run_of[i] = len(runs) - 1
+
+        parent = list(range(len(runs)))
+
+        def find(run):
+            while parent[run] != run:
+                parent[run] = parent[parent[run]]
+                run = parent[run]
+            return run
+
+        for i, window in enumerate(windows):
+            if slot not in window.live_out:
+                continue
+            for j in successors[i]:
+                if slot in windows[j].live_in:
+                    parent[find(run_of[i])] = find(run_of[j])
+
+        webs = {}
+        for run, (start, end) in enumerate(runs):
+            root = find(run)
+            if root not in webs:
+                webs[root] = Web(slot, start, end)
+            web = webs[root]
+            web.start = min(web.start, start)
+            web.end = max(web.end, end)
+        return [
+            webs[find(run_of[i])] if present[i] else None for i in range(len(windows))
+        ]
+
+    def linear_scan(self, webs, touched):
+        def usable(register, web):
+            counts = touched[register]
+            return counts[web.end + 1] - counts[web.start] == 0
+
+        active = []
+        for web in sorted(webs, key=lambda web: (web.start, web.end)):
+            active = [other for other in active if other.end >= web.start]
+            in_use = {other.register for other in active}
+            registers = [r for r in self.register_list if usable(r, web)]
+            free = [r for r in registers if r not in in_use]
+            if free:
+                web.register = free[0]
+            else:
+                # spill whichever range ends last
+                victims = [other for other in active if other.register in registers]
+                victim = max(victims, key=lambda other: other.end, default=None)
+                if victim is None or victim.end <= web.end:
+                    self.spilled.append(web)
+                    continue
+                web.register = victim.register
+                victim.register = None
+                active.remove(victim)
+                self.spilled.append(victim)
+            active.append(web)
+        self.promoted += [web for web in webs if web.register is not None]
+
+    def allocate_function(self, windows, base):
+        blocked = []
+        escapes = []
+        for window in windows:
+            # UNARY& %esp only sets the stack pointer below the frame
+            if window.opcode == Opcode.UNARY_AMPERSAND and window.fields[1] == "%esp":
+                for line in self.final_code[window.start : window.end]:
+                    for match in register_pattern.finditer(line):
+                        window.touched.add(register_name(match.group(1)))
+                continue
+            self.scan(window, blocked, escapes)
+
+        slots = self.candidates(windows, blocked, escapes)
+        if not slots:
+            return
+        for window in windows:
+            window.use &= slots
+            window.defs &= slots
+        successors = [self.successors(windows, base, i) for i in range(len(windows))]
+        self.liveness(windows, successors)
+
+        web_of = {slot: self.find_webs(windows, successors, slot) for slot in slots}
+        webs = list(
+            {id(web): web for slot in slots for web in web_of[slot] if web}.values()
+        )
+
+        touched = {}
+        for register in self.register_list:
+            counts = [0]
+            for window in windows:
+                counts.append(counts[-1] + (register in window.touched))
+            touched[register] = counts
+        self.linear_scan(webs, touched)
+
+        entry = windows[0]
+        for slot in slots:
+            web = web_of[slot][0]
+            if slot > 0 and web and web.register and slot in entry.live_in:
+                load = f"movl {slot}(%ebp), {web.register}"
+                self.loads.setdefault(entry.end, []).append(load)
+
+        for i, window in enumerate(windows):
+            if not window.accesses:
+                continue
+
+            def replace(match):
+                slot = int(match.group(1))
+                web = web_of[slot][i] if slot in web_of else None
+                if web is None or web.register is None:
+                    return match.group(0)
+                return web.register
+
+            for n in range(window.start, window.end):
+                self.final_code[n] = slot_pattern.sub(replace, self.final_code[n])
@@ -1,6 +1,6 @@
 from collections import OrderedDict
-import copy, sys
-import pandas as pd
+import copy, csv, json, sys
+from three_address_code import FrameSlot
 
 ST = 0  # Symbol table branch
 SN = 1  # Adding Struct Name
@@ -19,61 +19,169 @@ class bcolors:
     UNDERLINE = "\033[4m"
 
 
+class SymbolEntry:
+    """
+    A declared identifier. Fields that were never set are absent, as the
+    keys of the dict an entry used to be. The parser reads and writes the
+    fields by name, found["data_type"] is found.data_type.
+    """
+
+    __slots__ = (
+        "line",
+        "identifier_type",
+        "data_type",
+        "num_parameters",
+        "allocated_size",
+        "offset",
+        "temp",
+        "variable_scope",
+        "vars",
+        "scopes",
+    )
+    fields = frozenset(__slots__)
+
+    def __init__(self, line):
+        self.line = line
+
+    def __getitem__(self, field):
+        try:
+            return getattr(self, field)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def __setitem__(self, field, value):
+        setattr(self, field, value)
+
+    def __contains__(self, field):
+        return field in self.fields and hasattr(self, field)
+
+    def get(self, field, default=None):
+        if field not in self.fields:
+            return default
+        return getattr(self, field, default)
+
+    def keys(self):
+        return [field for field in self.__slots__ if hasattr(self, field)]
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in self.keys()]
+
+
+class Scope:
+    # symbols in declaration order, the scopes nested in it and the structs
+    # declared in it. scopes_at is the number of symbols declared before the
+    # first nested scope, the symbol table output lists them in that order.
+    # bottom is the lowest frame slot of the locals of the scope and of the
+    # scopes closed inside it.
+    __slots__ = ("symbols", "scopes", "scopes_at", "struct", "bottom")
+
+    def __init__(self):
+        self.symbols = {}
+        self.scopes = None
+        self.scopes_at = 0
+        self.struct = None
+        self.bottom = 0
+
+    def last_symbol(self):
+        return next(reversed(self.symbols.values()))
+
+
+def nested_scope(parent):
+    # opens a scope inside a scope or inside the entry of a function
+    if getattr(parent, "scopes", None) is None:
+        parent.scopes = []
+        if isinstance(parent, Scope):
+            parent.scopes_at = len(parent.symbols)
+    scope = Scope()
+    parent.scopes.append(scope)
+    return scope
+
+
+def type_string(data_type):
+    str1 = ""
+    if data_type[-1] == "*":
+        for i in range(len(data_type) - 2):
+            str1 += data_type[i]
+        return (str(data_type[-2]) + " " + str(data_type[-1]) + " " + str1).strip()
+    for i in range(len(data_type) - 1):
+        str1 += data_type[i]
+    return (str(data_type[-1]) + " " + str1).strip()
+
+
+# header and JSON Lines key of the columns of the symbol table export
+COLUMNS = [
+    ("Identifier", "identifier"),
+    ("Local/Global", "function"),
+    ("Line Number", "line"),
+    ("Identifier Type", "identifier_type"),
+    ("Data Type", "data_type"),
+    ("Parameter Count", "num_parameters"),
+    ("Allocated Size", "allocated_size"),
+    ("Offset", "offset"),
+    ("Struct", "struct"),
+    ("Scope", "scope"),
+]
+
+
+def symbol_row(name, fname, entry):
+    cur_row = [name, fname, "", "", "", "", "", "", "", ""]
+    for field, value in entry.items():
+        if field == "line":
+            cur_row[2] = value
+        elif field == "identifier_type":
+            cur_row[3] = value
+        elif field == "data_type":
+            cur_row[4] = type_string(value)
+        elif field == "allocated_size":
+            cur_row[6] = value
+        elif field == "offset":
+            cur_row[7] = value
+    return cur_row
+
+
+def bind(bindings, id, level, scope):
+    bindings.setdefault(id, []).append((level, scope))
+
+
+def unbind(bindings, scope, names):
+    # drops the bindings of a scope that is closed
+    for id in names:
+        stack = bindings.get(id)
+        if stack and stack[-1][1] is scope:
+            stack.pop()
+            if not stack:
+                del bindings[id]
+
+
+def innermost(bindings, id, top_scope):
+    # the innermost enclosing scope declaring id, the current one excluded
+    for level, scope in reversed(bindings.get(id, ())):
+        if scope is not top_scope:
+            return level, scope
+    return None
+
+
 class SymbolTable:
     def __init__(self):
         self.table_su = []
         self.top_scope_su = OrderedDict()
         self.table = []
-        self.top_scope = OrderedDict()
+        self.top_scope = Scope()
         self.error = False
         self.offset = 0
         self.offset_list = []
         self.flag = ST
-
-    def p_error(self, p):
-        self.error = True
-        position = (
-            p.lexer.lexpos
-            - sum(map(lambda line: len(line) + 1, p.lexer.lines[: p.lineno - 1]))
-            - len(p.value)
-            + 1
-        )
-        print(
-            bcolors.BOLD + "{}:{}:".format(p.lineno, position) + bcolors.ENDC,
-            end="",
-            file=sys.stderr,
-        )
-        print(
-            bcolors.FAIL + " SyntaxError: " + bcolors.ENDC,
-            "Unexpected token {}".format(p.value),
-            file=sys.stderr,
-        )
-        print(
-            "     {} |{}".format(p.lineno, p.lexer.lines[p.lineno - 1][: position - 1]),
-            end="",
-            file=sys.stderr,
-        )
-        print(
-            bcolors.WARNING
-            + bcolors.UNDERLINE
-            + "{}".format(
-                p.lexer.lines[p.lineno - 1][position - 1 : position - 1 + len(p.value)]
-            )
-            + bcolors.ENDC
-            + bcolors.ENDC,
-            end="",
-            file=sys.stderr,
-        )
-        print(
-            "{}".format(p.lexer.lines[p.lineno - 1][position - 1 + len(p.value) :]),
-            file=sys.stderr,
-        )
+        # name -> (level, scope) of every open scope that declares it, the
+        # innermost one last
+        self.bindings = {}
+        self.bindings_su = {}
 
     def insert_symbol_su(self, id, tname, lno, path):
         if path == SN:
             present = self.top_scope_su.get(id, False)
             if not present:
                 self.top_scope_su[id] = {}
+                bind(self.bindings_su, id, len(self.table_su), self.top_scope_su)
                 self.top_scope_su[id]["identifier_type"] = tname
                 self.top_scope_su[id]["line"] = lno
                 self.top_scope_su[id]["vars"] = dict()
@@ -122,16 +230,13 @@ class SymbolTable:
                     return False
 
     def find_symbol_in_table_su(self, id, path):
-        lvl = 1
-        if path == SN:
-            for elems in reversed(self.table_su):
-                if elems is not None and elems.__contains__(id):
-                    return abs(len(self.table_su) - lvl), elems.get(id)
-                lvl = lvl + 1
-        elif path == IS:
-            for elems in reversed(self.table_su):
-                if elems is not None and elems.__contains__(id):
-                    return elems.get(id)
+        found = innermost(self.bindings_su, id, self.top_scope_su)
+        if found is not None:
+            lvl, elems = found
+            if path == SN:
+                return lvl, elems.get(id)
+            elif path == IS:
+                return elems.get(id)
         return False
 
     def find_symbol_in_current_scope_su(self, id):
@@ -143,6 +248,7 @@ class SymbolTable:
         return
 
     def pop_scope_su(self):
+        unbind(self.bindings_su, self.top_scope_su, self.top_scope_su)
         self.top_scope_su = self.table_su.pop()
 
     def modify_symbol_su(self, id, field, val, sline, path):
@@ -259,8 +365,8 @@ class SymbolTable:
                         + str(present[1]["line"])
                         + bcolors.ENDC
                     )
-                self.top_scope[id] = OrderedDict()
-                self.top_scope[id]["line"] = lno
+                self.top_scope.symbols[id] = SymbolEntry(lno)
+                bind(self.bindings, id, len(self.table), self.top_scope)
             else:
                 print(
                     bcolors.FAIL
@@ -279,16 +385,13 @@ class SymbolTable:
             self.insert_symbol_su(id, None, lno, self.flag)
 
     def find_symbol_in_table(self, id, path):
-        lvl = 1
-        if path == SN:
-            for tree in reversed(self.table):
-                if tree is not None and tree.__contains__(id):
-                    return abs(len(self.table) - lvl), tree.get(id)
-                lvl += 1
-        elif path == IS:
-            for tree in reversed(self.table):
-                if tree is not None and tree.__contains__(id):
-                    return tree.get(id), tree[id]
+        found = innermost(self.bindings, id, self.top_scope)
+        if found is not None:
+            lvl, tree = found
+            if path == SN:
+                return lvl, tree.symbols.get(id)
+            elif path == IS:
+                return tree.symbols.get(id), tree.symbols[id]
 
         if path == 2:
             return False, []
@@ -296,108 +399,54 @@ class SymbolTable:
             return False
 
     def find_symbol_in_current_scope(self, id):
-        present = self.top_scope.get(id, False)
+        present = self.top_scope.symbols.get(id, False)
         if present:
-            return present, self.top_scope[id]
+            return present, present
         else:
             return present, []
 
     def push_scope(self, three_address_code):
         self.offset_list.append(self.offset)
 
-        temporary_ptr = 0
-        for item in self.top_scope.keys():
-            if (
-                item != "scope"
-                and item != "struct"
-                and item != "scope_num"
-                and "temp" in self.top_scope[item].keys()
-                and self.top_scope[item]["temp"][0] == "-"
-            ):
-                temporary_ptr = min(
-                    temporary_ptr, int(self.top_scope[item]["temp"].split("(")[0])
-                )
-        self.lastScopeTemp = temporary_ptr
-
         if len(self.table) == 0:
+            # the body of a function is kept in the entry of the function,
+            # the global scope only stays on top when the results are stored
             self.table.append(self.top_scope)
-            TopScopeName = list(self.top_scope.items())[-1][0]
-            if TopScopeName != "struct":
-                self.top_scope = list(self.top_scope.items())[-1][1]
-                if "scope" not in self.top_scope:
-                    self.top_scope["scope"] = []
-                parentScopeList = self.top_scope["scope"]
-                parentScopeList.append(OrderedDict())
-                self.top_scope = parentScopeList[-1]
+            if self.top_scope.struct is None:
+                self.top_scope = nested_scope(self.top_scope.last_symbol())
         else:
-            if "scope" not in self.top_scope:
-                self.top_scope["scope"] = []
-
-            parentScopeList = self.top_scope["scope"]
             self.table.append(self.top_scope)
-            parentScopeList.append(OrderedDict())
-            self.top_scope = parentScopeList[-1]
+            self.top_scope = nested_scope(self.top_scope)
 
         self.push_scope_su()
-
-        three_address_code.counter_scope += 1
-        three_address_code.scope_list[three_address_code.counter_scope] = []
-        self.top_scope["scope_num"] = three_address_code.counter_scope
-        three_address_code.scope_list[self.top_scope["scope_num"]].append(
-            three_address_code.next_statement
-        )
-        three_address_code.emit("PushScope", "", "", "")
+        three_address_code.emit_stack_reset()
 
         return
 
     def store_results(self, three_address_code):
-        self.top_scope["struct"] = dict(self.top_scope_su)
+        self.top_scope.struct = dict(self.top_scope_su)
         self.push_scope(three_address_code)
         three_address_code.code.pop()
+        three_address_code.stack_resets.pop()
         return
 
     #### make changes
 
     def pop_scope(self, three_address_code, flag=None):
+        if len(self.table) > 1:
+            # the enclosing scope takes over the extent of the frame
+            parent = self.table[-1]
+            parent.bottom = min(parent.bottom, self.top_scope.bottom)
+            if flag is None:
+                three_address_code.emit_stack_reset()
+        else:
+            # the body of the function is closed, its frame size is known
+            three_address_code.fix_stack_resets(self.top_scope.bottom)
 
-        temp_of_lastScope = self.lastScopeTemp
-        if self.top_scope:
-            for i in self.top_scope.keys():
-                if (
-                    i != "scope"
-                    and i != "struct"
-                    and i != "scope_num"
-                    and "temp" in self.top_scope[i].keys()
-                    and self.top_scope[i]["temp"][0] == "-"
-                ):
-                    # print("Start")
-                    # print(temp_of_lastScope)
-                    # print(self.top_scope[i]["temp"])
-                    temp_of_lastScope = min(
-                        temp_of_lastScope, int(self.top_scope[i]["temp"].split("(")[0])
-                    )
-                    # print("Start 2")
-                    # print(temp_of_lastScope)
-                    # print(self.top_scope[i]["temp"])
-
-            for lines in three_address_code.scope_list[self.top_scope["scope_num"]]:
-                three_address_code.code[lines] = [
-                    "UNARY&",
-                    "%esp",
-                    f"{temp_of_lastScope}(%ebp)",
-                    "",
-                ]
-
-            if len(self.table) > 1 and flag is None:
-                prev_scope_num = self.table[-1]["scope_num"]
-                three_address_code.scope_list[prev_scope_num].append(
-                    three_address_code.next_statement
-                )
-                three_address_code.emit("PushScope", "", "", "")
-
-        self.top_scope["struct"] = dict(self.top_scope_su)
+        self.top_scope.struct = dict(self.top_scope_su)
         self.pop_scope_su()
         TScope = self.top_scope
+        unbind(self.bindings, TScope, TScope.symbols)
         self.offset = self.offset_list[-1]
         self.offset_list.pop()
 
@@ -407,224 +456,60 @@ class SymbolTable:
             self.top_scope = None
         return TScope
 
-    def del_struct(self, temp):
-        list_copy = []
-        for item in temp["scope"]:
-            item.pop("struct", None)
-            if "scope" in item:
-                self.del_struct(item)
-            if not item:
-                continue
-            list_copy.append(item)
-        if len(list_copy) == 0:
-            temp.pop("scope", None)
-        else:
-            temp["scope"] = list_copy
-
-    def scope_rows(self, fname, val, ver):
-        data_rows = []
-        for scope_ctr, scope in enumerate(val):
-            for k, v in scope.items():
-                if k == "scope":
-                    data_rows += self.scope_rows(
-                        fname, v, ver + str(scope_ctr + 1) + "."
-                    )
-                elif k != "scope_num":
-
-                    if "vars" in v.keys():
-                        for varname, stvars in v["vars"].items():
-                            cur_row = [varname, fname, "", "", "", "", "", "", "", ""]
-                            cur_row[8] = k
-                            for key2, value2 in stvars.items():
-                                if key2 == "line":
-                                    cur_row[2] = value2
-                                elif key2 == "identifier_type":
-                                    cur_row[3] = value2
-                                elif key2 == "data_type":
-                                    str1 = ""
-                                    if value2[-1] == "*":
-                                        for i in range(len(value2) - 2):
-                                            str1 += value2[i]
-                                        cur_row[4] = (
-                                            str(value2[-2])
-                                            + " "
-                                            + str(value2[-1])
-                                            + " "
-                                            + str1
-                                        ).strip()
-                                    else:
-                                        for i in range(len(value2) - 1):
-                                            str1 += value2[i]
-                                        cur_row[4] = (
-                                            str(value2[-1]) + " " + str1
-                                        ).strip()
-                                elif key2 == "allocated_size":
-                                    cur_row[6] = value2
-                                elif key2 == "offset":
-                                    cur_row[7] = value2
-                                cur_row[9] = ver + str(scope_ctr + 1)
-                            data_rows.append(cur_row)
-
-                    cur_row = [k, fname, "", "", "", "", "", "", "", ""]
-                    for key2, value2 in v.items():
-                        if key2 == "line":
-                            cur_row[2] = value2
-                        elif key2 == "identifier_type":
-                            cur_row[3] = value2
-                        elif key2 == "data_type":
-                            str1 = ""
-                            if value2[-1] == "*":
-                                for i in range(len(value2) - 2):
-                                    str1 += value2[i]
-                                cur_row[4] = (
-                                    str(value2[-2]) + " " + str(value2[-1]) + " " + str1
-                                ).strip()
-                            else:
-                                for i in range(len(value2) - 1):
-                                    str1 += value2[i]
-                                cur_row[4] = (str(value2[-1]) + " " + str1).strip()
-                        elif key2 == "allocated_size":
-                            cur_row[6] = value2
-                        elif key2 == "offset":
-                            cur_row[7] = value2
-                        cur_row[9] = ver + str(scope_ctr + 1)
-                    data_rows.append(cur_row)
-
-        return data_rows
-
-    def print_table(self):
-        col = [
-            "Identifier",
-            "Local/Global        ",
-            "Line Number",
-            "Identifier Type",
-            "Data Type",
-            "Parameter Count",
-            "Allocated Size",
-            "Offset",
-            "Struct",
-            "Scope",
-        ]
-        #     0              1                   2          3         4      5                   6                      7          8                9
-        data_rows = []
-
-        for key, value in self.table[0].items():
-            cur_row = [key, "Global", "", "", "", "", "", "", "", ""]
-            if key != "struct" and key != "scope_num":
-                for key2, value2 in value.items():
-                    if key2 == "line":
-                        cur_row[2] = value2
-                    elif key2 == "identifier_type":
-                        cur_row[3] = value2
-                    elif key2 == "data_type":
-                        str1 = ""
-                        if value2[-1] == "*":
-                            for i in range(len(value2) - 2):
-                                str1 += value2[i]
-                            cur_row[4] = (
-                                str(value2[-2]) + " " + str(value2[-1]) + " " + str1
-                            ).strip()
-                        else:
-                            for i in range(len(value2) - 1):
-                                str1 += value2[i]
-                            cur_row[4] = (str(value2[-1]) + " " + str1).strip()
-                    elif key2 == "num_parameters":
-                        cur_row[5] = value2
-                data_rows.append(cur_row)
-
-        # (print)(self.table[0].items())
-        for key, value in self.table[0].items():
-            if key != "scope_num" and "scope" in value:
-                tmp = copy.deepcopy(value["scope"][0])
-                # print(tmp)
-                del tmp["struct"]
-                if "scope" in tmp:
-                    self.del_struct(tmp)
-
-                if len(tmp) > 0:
-                    # print(tmp)
-                    for k, v in tmp.items():
-                        if k == "scope":
-                            data_rows += self.scope_rows(key, v, "")
-                        elif k != "scope_num":
-
-                            if "vars" in v.keys():
-                                for varname, stvars in v["vars"].items():
-                                    cur_row = [
-                                        varname,
-                                        key,
-                                        "",
-                                        "",
-                                        "",
-                                        "",
-                                        "",
-                                        "",
-                                        "",
-                                        "",
-                                    ]
-                                    cur_row[8] = k
-                                    for key2, value2 in stvars.items():
-                                        if key2 == "line":
-                                            cur_row[2] = value2
-                                        elif key2 == "identifier_type":
-                                            cur_row[3] = value2
-                                        elif key2 == "data_type":
-                                            str1 = ""
-                                            if value2[-1] == "*":
-                                                for i in range(len(value2) - 2):
-                                                    str1 += value2[i]
-                                                cur_row[4] = (
-                                                    str(value2[-2])
-                                                    + " "
-                                                    + str(value2[-1])
-                                                    + " "
-                                                    + str1
-                                                ).strip()
-                                            else:
-                                                for i in range(len(value2) - 1):
-                                                    str1 += value2[i]
-                                                cur_row[4] = (
-                                                    str(value2[-1]) + " " + str1
-                                                ).strip()
-                                        elif key2 == "allocated_size":
-                                            cur_row[6] = value2
-                                        elif key2 == "offset":
-                                            cur_row[7] = value2
-                                    data_rows.append(cur_row)
-
-                            cur_row = [k, key, "", "", "", "", "", "", "", ""]
-                            for key2, value2 in v.items():
-                                if key2 == "line":
-                                    cur_row[2] = value2
-                                elif key2 == "identifier_type":
-                                    cur_row[3] = value2
-                                elif key2 == "data_type":
-                                    str1 = ""
-                                    if value2[-1] == "*":
-                                        for i in range(len(value2) - 2):
-                                            str1 += value2[i]
-                                        cur_row[4] = (
-                                            str(value2[-2])
-                                            + " "
-                                            + str(value2[-1])
-                                            + " "
-                                            + str1
-                                        ).strip()
-                                    else:
-                                        for i in range(len(value2) - 1):
-                                            str1 += value2[i]
-                                        cur_row[4] = (
-                                            str(value2[-1]) + " " + str1
-                                        ).strip()
-                                elif key2 == "allocated_size":
-                                    cur_row[6] = value2
-                                elif key2 == "offset":
-                                    cur_row[7] = value2
-                            data_rows.append(cur_row)
-
-        data_rows = [col] + data_rows
-        df = pd.DataFrame(data_rows)
-        print(df.to_string(index=False, header=False))
+    def scope_rows(self, fname, scopes, ver):
+        for scope_ctr, scope in enumerate(scopes):
+            yield from self.symbol_rows(fname, scope, ver + str(scope_ctr + 1))
+
+    def symbol_rows(self, fname, scope, ver):
+        # the rows of the symbols of a scope, the nested scopes follow the
+        # symbols declared before them. Only nested scopes are numbered.
+        names = list(scope.symbols)
+        for n, k in enumerate(names + [None]):
+            if n == scope.scopes_at and scope.scopes is not None:
+                yield from self.scope_rows(
+                    fname, scope.scopes, ver + "." if ver else ""
+                )
+            if k is None:
+                break
+            v = scope.symbols[k]
+
+            if "vars" in v:
+                for varname, stvars in v["vars"].items():
+                    cur_row = symbol_row(varname, fname, stvars)
+                    cur_row[8] = k
+                    if stvars:
+                        cur_row[9] = ver
+                    yield cur_row
+
+            cur_row = symbol_row(k, fname, v)
+            cur_row[9] = ver
+            yield cur_row
+
+    def rows(self):
+        """
+        Yields a row of COLUMNS for every symbol, the globals first and then
+        the symbols of every function in scope order.
+        """
+        for key, value in self.table[0].symbols.items():
+            cur_row = symbol_row(key, "Global", value)
+            cur_row[5] = value.get("num_parameters", "")
+            cur_row[6] = cur_row[7] = ""
+            yield cur_row
+
+        for key, value in self.table[0].symbols.items():
+            if "scopes" in value:
+                yield from self.symbol_rows(key, value.scopes[0], "")
+
+    def write_csv(self, f):
+        writer = csv.writer(f)
+        writer.writerow([header for header, _ in COLUMNS])
+        writer.writerows(self.rows())
+
+    def write_jsonl(self, f):
+        keys = [key for _, key in COLUMNS]
+        for row in self.rows():
+            record = {key: value for key, value in zip(keys, row) if value != ""}
+            f.write(json.dumps(record) + "\n")
 
     def modify_symbol(self, id, field, val, sline=None):
         if self.flag == ST:
@@ -638,17 +523,16 @@ class SymbolTable:
                     if field == "vars":
                         if 0 < len(self.table):
                             curOffset = 0
-                            for term in self.top_scope[id][field]:
-                                self.top_scope[id][field][term]["offset"] = curOffset
-                                curOffset = (
-                                    curOffset
-                                    + self.top_scope[id][field][term]["allocated_size"]
-                                )
+                            for term in self.top_scope.symbols[id][field]:
+                                entry = self.top_scope.symbols[id][field][term]
+                                entry["offset"] = curOffset
+                                curOffset = curOffset + entry["allocated_size"]
 
                     elif field == "allocated_size":
                         if 0 < len(self.table):
-                            self.top_scope[id]["offset"] = self.offset
-                            self.offset = val + self.offset
+                            self.allocate_slot(self.top_scope.symbols[id], val)
+                    elif field == "temp":
+                        self.extend_frame(val)
 
                     return True
 
@@ -678,25 +562,37 @@ class SymbolTable:
 
             else:
 
-                self.top_scope[id][field] = val
+                present[field] = val
                 if field == "vars":
                     if 0 < len(self.table):
                         curOffset = 0
-                        for term in self.top_scope[id][field]:
-                            self.top_scope[id][field][term]["offset"] = curOffset
+                        for term in present[field]:
+                            present[field][term]["offset"] = curOffset
                             curOffset = (
-                                self.top_scope[id][field][term]["allocated_size"]
-                                + curOffset
+                                present[field][term]["allocated_size"] + curOffset
                             )
                 elif field == "allocated_size":
                     if 0 < len(self.table):
-                        self.top_scope[id]["offset"] = self.offset
-                        self.offset = self.offset + val
+                        self.allocate_slot(present, val)
+                elif field == "temp":
+                    self.extend_frame(val)
 
                 return True
         else:
             self.modify_symbol_su(id, field, val, sline, self.flag)
 
+    def allocate_slot(self, entry, size):
+        # every local starts on a word boundary since the code generator
+        # moves values smaller than an int as whole words
+        self.offset = (self.offset + size + 3) // 4 * 4
+        entry["offset"] = self.offset - size
+
+    def extend_frame(self, temp):
+        # the lowest frame slot of the scope follows its locals as they get
+        # their slots
+        if type(temp) is FrameSlot and temp.offset < self.top_scope.bottom:
+            self.top_scope.bottom = temp.offset
+
     def return_sym_tab_entry(self, id, sline=None):
         present, entry = self.find_symbol_in_current_scope(id)
         if present:
@@ -718,6 +614,17 @@ class SymbolTable:
                 self.error = True
                 return None, None
 
+    def declare_builtins(self, builtins):
+        # the library functions of a prelude, see prelude.py, go straight into
+        # the global scope before the program is parsed
+        for name, (data_type, num_parameters) in builtins.items():
+            entry = SymbolEntry(-1)
+            entry.identifier_type = "function"
+            entry.data_type = list(data_type)
+            entry.num_parameters = num_parameters
+            self.top_scope.symbols[name] = entry
+            bind(self.bindings, name, 0, self.top_scope)
+
     def is_global(self, id=None):
         if len(self.table) == 0:
             return True
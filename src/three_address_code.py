@@ -1,4 +1,424 @@
-import copy
+import bisect
+import functools
+import re
+from enum import IntEnum
+
+
+class Opcode(IntEnum):
+    RAW = 0  # data section directives and anything codegen copies verbatim
+    LABEL = 1  # function label
+    MUL_ASSIGN = 2
+    DIV_ASSIGN = 3
+    MOD_ASSIGN = 4
+    ADD_ASSIGN = 5
+    SUB_ASSIGN = 6
+    AND_ASSIGN = 7
+    XOR_ASSIGN = 8
+    OR_ASSIGN = 9
+    LEFT_ASSIGN = 10
+    RIGHT_ASSIGN = 11
+    ADD = 12
+    SUB = 13
+    LEFT = 14
+    RIGHT = 15
+    LE = 16
+    GE = 17
+    EQ = 18
+    NE = 19
+    LT = 20
+    GT = 21
+    ASSIGN = 22
+    UNARY_PLUS = 23
+    UNARY_STAR = 24
+    MUL = 25
+    OR = 26
+    XOR = 27
+    AND = 28
+    DIV = 29
+    MOD = 30
+    UNARY_MINUS = 31
+    UNARY_TILDE = 32
+    UNARY_NOT = 33
+    UNARY_AMPERSAND = 34
+    PARAM = 35
+    CALL = 36
+    CALL_CHAR = 37
+    CALL_STRUCT = 38
+    RETURN = 39
+    RETURN_STRUCT = 40
+    IFNZ_GOTO = 41
+    GOTO = 42
+    LOAD_FLOAT = 43
+    PRINTF_PUSH_FLOAT = 44
+    PUSH_CHAR = 45
+    MATH_FUNC_PUSH_FLOAT = 46
+    MATH_FUNC_PUSH_INT = 47
+    POW_FUNC_PUSH_INT = 48
+    POW_FUNC_PUSH_FLOAT = 49
+    PRINTF_PUSH_CHAR = 50
+    CAST = 51
+
+
+# operators are matched on their prefix, longest first, the rest of the
+# operator is the type tag, e.g. "+_int" or "=_int_unsigned"
+operator_prefixes = [
+    ("UNARY+", Opcode.UNARY_PLUS),
+    ("UNARY*", Opcode.UNARY_STAR),
+    ("UNARY-", Opcode.UNARY_MINUS),
+    ("UNARY~", Opcode.UNARY_TILDE),
+    ("UNARY!", Opcode.UNARY_NOT),
+    ("UNARY&", Opcode.UNARY_AMPERSAND),
+    ("<<=", Opcode.LEFT_ASSIGN),
+    (">>=", Opcode.RIGHT_ASSIGN),
+    ("*=", Opcode.MUL_ASSIGN),
+    ("/=", Opcode.DIV_ASSIGN),
+    ("%=", Opcode.MOD_ASSIGN),
+    ("+=", Opcode.ADD_ASSIGN),
+    ("-=", Opcode.SUB_ASSIGN),
+    ("&=", Opcode.AND_ASSIGN),
+    ("^=", Opcode.XOR_ASSIGN),
+    ("|=", Opcode.OR_ASSIGN),
+    ("<<", Opcode.LEFT),
+    (">>", Opcode.RIGHT),
+    ("<=", Opcode.LE),
+    (">=", Opcode.GE),
+    ("==", Opcode.EQ),
+    ("!=", Opcode.NE),
+    ("+", Opcode.ADD),
+    ("-", Opcode.SUB),
+    ("<", Opcode.LT),
+    (">", Opcode.GT),
+    ("=", Opcode.ASSIGN),
+    ("*", Opcode.MUL),
+    ("|", Opcode.OR),
+    ("^", Opcode.XOR),
+    ("&", Opcode.AND),
+    ("/", Opcode.DIV),
+    ("%", Opcode.MOD),
+]
+
+operator_names = {
+    "param": Opcode.PARAM,
+    "callq": Opcode.CALL,
+    "callq_char": Opcode.CALL_CHAR,
+    "callq_struct": Opcode.CALL_STRUCT,
+    "retq": Opcode.RETURN,
+    "retq_struct": Opcode.RETURN_STRUCT,
+    "ifnz goto": Opcode.IFNZ_GOTO,
+    "goto": Opcode.GOTO,
+    "load_float": Opcode.LOAD_FLOAT,
+    "printf_push_float": Opcode.PRINTF_PUSH_FLOAT,
+    "push_char": Opcode.PUSH_CHAR,
+    "math_func_push_float": Opcode.MATH_FUNC_PUSH_FLOAT,
+    "math_func_push_int": Opcode.MATH_FUNC_PUSH_INT,
+    "pow_func_push_int": Opcode.POW_FUNC_PUSH_INT,
+    "pow_func_push_float": Opcode.POW_FUNC_PUSH_FLOAT,
+    "printf_push_char": Opcode.PRINTF_PUSH_CHAR,
+    "cast": Opcode.CAST,
+}
+
+JUMPS = (Opcode.GOTO, Opcode.IFNZ_GOTO)
+RETURNS = (Opcode.RETURN, Opcode.RETURN_STRUCT)
+
+@functools.lru_cache(maxsize=1024)
+def classify(operator):
+    """
+    Returns the opcode and the type tag of a TAC operator string. Recent
+    results are cached, so a repeated operator is only parsed once.
+    """
+    result = (Opcode.RAW, "")
+    if operator in operator_names:
+        result = (operator_names[operator], "")
+    elif operator[-1:] == ":" and "." not in operator:
+        result = (Opcode.LABEL, "")
+    else:
+        for prefix, opcode in operator_prefixes:
+            if operator.startswith(prefix):
+                result = (opcode, operator[len(prefix) :].lstrip("_"))
+                break
+    return result
+
+
+class Quad:
+    """
+    A single TAC instruction. Absent operands are None, the number of fields
+    printed follows the rules of three_address_code.emit.
+    """
+
+    __slots__ = ("opcode", "type", "op", "dest", "src1", "src2")
+
+    def __init__(self, op, dest, src1=None, src2=None):
+        self.opcode, self.type = classify(op)
+        self.op = op
+        self.dest = dest
+        self.src1 = src1
+        self.src2 = src2
+
+    def fields(self):
+        if self.src1 is None and self.src2 is None:
+            return [self.op, self.dest]
+        elif self.src2 is None:
+            return [self.op, self.dest, self.src1]
+        return [self.op, self.dest, self.src1, self.src2]
+
+
+# Operands of the TAC. They keep the parts of an operand apart, the offset of
+# a frame slot or the pointer of an indirect operand, and are only rendered as
+# assembly text by str(), when the TAC text or the assembly is written. Names
+# of globals, functions and labels, and registers stay plain strings.
+
+
+class Operand:
+    __slots__ = ()
+
+    def parts(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other.parts() == self.parts()
+
+    def __hash__(self):
+        return hash((type(self),) + self.parts())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(map(repr, self.parts()))})"
+
+
+class FrameSlot(Operand):
+    # N(%ebp), a local, parameter or temporary in the frame
+    __slots__ = ("offset",)
+
+    def __init__(self, offset):
+        self.offset = offset
+
+    def __str__(self):
+        return f"{self.offset}(%ebp)"
+
+
+class FrameAddress(Operand):
+    # %ebp+N or %ebp-N, the address of the frame slot N(%ebp)
+    __slots__ = ("offset",)
+
+    def __init__(self, offset):
+        self.offset = offset
+
+    def __str__(self):
+        return f"%ebp{self.offset:+d}"
+
+
+class Indirect(Operand):
+    # (x), the memory that the pointer held by x points to
+    __slots__ = ("pointer",)
+
+    def __init__(self, pointer):
+        self.pointer = pointer
+
+    def __str__(self):
+        return f"({self.pointer})"
+
+
+class Immediate(Operand):
+    # $N or $label
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return f"${self.value}"
+
+
+frame_slot_pattern = re.compile(r"(-?\d+)\(%ebp\)")
+frame_address_pattern = re.compile(r"%ebp([+-]\d+)")
+number_pattern = re.compile(r"-?\d+")
+
+
+def operand(text):
+    """
+    Returns the typed operand of a field of a TAC text file, or text itself
+    for names and registers.
+    """
+    result = text
+    if text[:1] == "(" and text[-1:] == ")":
+        result = Indirect(operand(text[1:-1]))
+    elif text[:1] == "$":
+        value = text[1:]
+        result = Immediate(int(value) if number_pattern.fullmatch(value) else value)
+    elif frame_slot_pattern.fullmatch(text):
+        result = FrameSlot(int(text[:-6]))
+    elif frame_address_pattern.fullmatch(text):
+        result = FrameAddress(int(text[4:]))
+    # e.g. "-0(%ebp)" would not read back the same
+    if str(result) != text:
+        return text
+    return result
+
+
+def parse_tac_line(line):
+    # opcode and codegen fields of a line of a TAC text file
+    fields = line.split()[1:]
+    fields[1:] = [operand(field) for field in fields[1:]]
+    if fields[:2] == ["ifnz", "goto"]:
+        return Opcode.IFNZ_GOTO, fields
+    return classify(fields[0] if fields else "")[0], fields
+
+
+def frame_slots(value):
+    # the frame slots and frame addresses an operand refers to
+    if type(value) is Indirect:
+        return frame_slots(value.pointer)
+    if type(value) is FrameSlot or type(value) is FrameAddress:
+        return [value]
+    return []
+
+
+# temporaries live in a separate range of placeholder slots until
+# share_slots gives them their place in the frame
+TEMP_BASE = 1 << 24
+
+
+class TempAllocator:
+    """
+    Frame slots of the temporaries. While parsing every temporary gets a
+    placeholder slot of its own, below TEMP_BASE, so that the offsets of the
+    locals are not spread out by the temporaries. Once the code is complete
+    share_slots lays the temporaries of each function out below its locals,
+    temporaries whose live ranges do not overlap share a slot.
+    """
+
+    def __init__(self):
+        self.starts = []
+        self.sizes = []
+        self.size = 0
+        # (function, frame size with a slot per temporary, shared frame size)
+        self.frames = []
+
+    def new_temp(self, size):
+        size = (size + 3) // 4 * 4
+        self.starts.append(self.size)
+        self.sizes.append(size)
+        self.size += size
+        return FrameSlot(-TEMP_BASE - self.size)
+
+    def find(self, slot):
+        # temporary and offset into it of a placeholder slot
+        depth = -TEMP_BASE - slot
+        if depth <= 0:
+            return None
+        temp = bisect.bisect_left(self.starts, depth) - 1
+        return temp, self.starts[temp] + self.sizes[temp] - depth
+
+    def references(self, code):
+        # the temporaries used by every instruction, temporaries whose
+        # address is taken are live up to the end of the function
+        uses = []
+        escapes = set()
+        for quad in code:
+            temps = set()
+            for n, field in enumerate(quad.fields()[1:]):
+                for value in frame_slots(field):
+                    found = self.find(value.offset)
+                    if found is None:
+                        continue
+                    temps.add(found[0])
+                    if type(value) is FrameAddress or (
+                        quad.opcode == Opcode.UNARY_AMPERSAND and n == 1
+                    ):
+                        escapes.add(found[0])
+            uses.append(temps)
+        return uses, escapes
+
+    def live_ranges(self, code, base, uses, escapes):
+        ranges = {}
+        for i, temps in enumerate(uses):
+            for temp in temps:
+                first, last = ranges.get(temp, (i, i))
+                ranges[temp] = (min(first, i), max(last, i))
+        for temp in escapes:
+            ranges[temp] = (ranges[temp][0], len(code) - 1)
+
+        # a temporary that is live across a loop but not only inside of it
+        # stays live over the whole loop
+        loops = []
+        for i, quad in enumerate(code):
+            if quad.opcode in JUMPS and quad.dest - 1 - base <= i:
+                loops.append((quad.dest - 1 - base, i))
+        changed = True
+        while changed:
+            changed = False
+            for temp, (first, last) in ranges.items():
+                for start, end in loops:
+                    if first <= end and start <= last:
+                        if start < first or end > last:
+                            first, last = min(first, start), max(last, end)
+                            ranges[temp] = (first, last)
+                            changed = True
+        return ranges
+
+    def color(self, ranges):
+        # first fit over the slots freed by the ranges that ended before
+        offsets = {}
+        active = []
+        area = 0
+        for temp in sorted(ranges, key=lambda temp: ranges[temp]):
+            first = ranges[temp][0]
+            active = [other for other in active if ranges[other][1] >= first]
+            taken = sorted((offsets[other], self.sizes[other]) for other in active)
+            offset = 0
+            for other, size in taken:
+                if offset + self.sizes[temp] <= other:
+                    break
+                offset = max(offset, other + size)
+            offsets[temp] = offset
+            active.append(temp)
+            area = max(area, offset + self.sizes[temp])
+        return offsets, area
+
+    def share_slots(self, code):
+        self.frames = []
+        start = 0
+        for i in range(1, len(code) + 1):
+            if i == len(code) or code[i].opcode == Opcode.LABEL:
+                if code[start].opcode == Opcode.LABEL:
+                    self.share_function(code[start:i], start)
+                start = i
+
+    def share_function(self, code, base):
+        uses, escapes = self.references(code)
+        ranges = self.live_ranges(code, base, uses, escapes)
+        offsets, area = self.color(ranges)
+
+        stack_resets = [
+            quad
+            for quad in code
+            if quad.opcode == Opcode.UNARY_AMPERSAND and quad.dest == "%esp"
+        ]
+        locals_size = -min([quad.src1.offset for quad in stack_resets] + [0])
+        locals_size = (locals_size + 3) // 4 * 4
+        before = locals_size + sum(self.sizes[temp] for temp in ranges)
+        after = locals_size + area
+        self.frames.append((code[0].op[:-1], before, after))
+
+        def relocate(value):
+            if type(value) is Indirect:
+                return Indirect(relocate(value.pointer))
+            if type(value) is not FrameSlot and type(value) is not FrameAddress:
+                return value
+            found = self.find(value.offset)
+            if found is None:
+                return value
+            temp, delta = found
+            offset = -locals_size - offsets[temp] - self.sizes[temp] + delta
+            return type(value)(offset)
+
+        for quad in code:
+            if quad.opcode == Opcode.RAW:
+                continue
+            quad.dest = relocate(quad.dest)
+            quad.src1 = relocate(quad.src1)
+            quad.src2 = relocate(quad.src2)
+        for quad in stack_resets:
+            quad.src1 = FrameSlot(-after)
 
 
 class three_address_code:
@@ -8,12 +428,13 @@ class three_address_code:
         self.string_list = []
         self.global_variables = []
         self.static_variables = []
-        self.scope_list = {}
         self.counter_temp = 0
         self.counter_label = 0
         self.counter_static = 1
         self.next_statement = 0
-        self.counter_scope = 0
+        self.temps = TempAllocator()
+        # stack pointer resets of the function being parsed
+        self.stack_resets = []
 
     def create_label(self):
         self.counter_label = self.counter_label + 1
@@ -27,20 +448,24 @@ class three_address_code:
     def backpatch(self, p_list, lno):
         updated_lno = lno + 1
         for i in p_list:
-            compare_str = "goto"
-            to_check_list = self.code[i][0].split()
-            if compare_str in to_check_list:
-                self.code[i][1] = updated_lno
+            if self.code[i].opcode in JUMPS:
+                self.code[i].dest = updated_lno
 
     def emit(self, operator, destination, operand_1=None, operand_2=None):
-        if (operand_1 is None) and (operand_2 is None):
-            self.code.append([operator, destination])
-        elif operand_2 is None:
-            self.code.append([operator, destination, operand_1])
-        else:
-            self.code.append([operator, destination, operand_1, operand_2])
+        self.code.append(Quad(operator, destination, operand_1, operand_2))
         self.next_statement = self.next_statement + 1
 
+    def emit_stack_reset(self):
+        # sets %esp below the frame, the size of the frame is filled in by
+        # fix_stack_resets once the function is complete
+        self.emit("UNARY&", "%esp", FrameSlot(0), "")
+        self.stack_resets.append(self.code[-1])
+
+    def fix_stack_resets(self, bottom):
+        for quad in self.stack_resets:
+            quad.src1 = FrameSlot(bottom)
+        self.stack_resets = []
+
     def find_symbol_in_symtab(self, symtab, identifier):
         if identifier is not None:
             found, entry = symtab.return_sym_tab_entry(identifier)
@@ -54,7 +479,7 @@ class three_address_code:
                 return new_temp
         return None 
 
-    def print_code(self):
+    def finalize_code(self):
 
         for i in range(0, len(self.string_list)):
             self.emit(f".LC{i}:", "", "", "")
@@ -66,68 +491,76 @@ class three_address_code:
             self.emit(f".comm", "", str(val[0]) + "," + str(val[1]), "")
         self.emit(".data", "", "", "")
 
-        deleted = 0 
-        lines_dict = dict()
-        temp_code = copy.deepcopy(self.code)
-        check_ran = range(0, len(temp_code)) 
+        # drop empty jumps and returns that directly follow a return, and
+        # remember where every original line ends up
+        new_lineno = [0] * (len(self.code) + 1)
+        seen = set()
+        code = []
+        for i, quad in enumerate(self.code):
+            new_lineno[i + 1] = len(code) + 1
+            if quad.opcode in JUMPS and (quad.dest == "" or quad.dest == None):
+                continue
+            if quad.opcode == Opcode.RETURN and self.code[i - 1].opcode in RETURNS:
+                continue
+            # instructions repeated by a switch statement share one Quad
+            if id(quad) in seen:
+                quad = Quad(quad.op, quad.dest, quad.src1, quad.src2)
+            seen.add(id(quad))
+            code.append(quad)
+
+        for quad in code:
+            if quad.opcode in JUMPS:
+                quad.dest = new_lineno[quad.dest]
+
+        # every function label moves up to just after the closest preceding
+        # empty instruction, or just before the closest preceding UNARY&,
+        # whichever comes first. Labels sharing an empty instruction end up
+        # in reverse order, labels sharing an UNARY& keep their order.
         self.code = []
-        for i in check_ran:
-            code = temp_code[i]
-            lines_dict[i + 1] = i - deleted + 1
-            compare_str = "goto" 
-            compare_str_2 = "retq"
-            to_check_list = code[0].split()
-            to_check_list_2 = temp_code[i - 1][0].split()
-            if compare_str in to_check_list:
-                if code[1] == "" or code[1] == None:
-                    deleted = deleted + 1
-                else:
-                    self.code.append(code)
-            elif compare_str_2 in to_check_list and (
-                compare_str_2 in to_check_list_2 or "retq_struct" in to_check_list_2
-            ):
-                deleted = deleted + 1
-            else:
-                self.code.append(code)
-        check_ran = range(0, len(self.code))
-        for i in check_ran:
-            code = self.code[i]
-            compare_str = "goto"
-            if compare_str in code[0].split(): 
-                spec_elem = self.code[i][1]
-                self.code[i][1] = lines_dict[spec_elem]
-        check_ran = range(0, len(self.code))
-        for i in check_ran:
-            code = self.code[i]
-            code_lvl = code[0]
-            if len(code_lvl) > 0:
-                el0 = code_lvl[0]
-                el1 = code_lvl[-1]
+        labels = []
+        body = []
+        stop = None
+        for quad in code + [None]:
+            if quad is not None and quad.opcode == Opcode.LABEL:
+                labels.append(quad)
+                continue
             if (
-                i != 0
-                and len(code_lvl) > 0
-                and el0 != "."
-                and el1 == ":"
-                and "." not in code_lvl
+                quad is None
+                or quad.op == ""
+                or (quad.opcode == Opcode.UNARY_AMPERSAND and not quad.type)
             ):
-                check_ran = reversed(range(i))
-                for j in check_ran:
-                    prev_code = self.code[j]
-                    check_code = "UNARY&"
-                    if len(prev_code[0]) <= 0:
-                        break
-                    elif prev_code[0] == check_code:
-                        self.code[j + 1] = prev_code 
-                        self.code[j] = code
-                        break
-                    else:
-                        self.code[j + 1] = prev_code
-                        self.code[j] = code
-        check_ran = range(0, len(self.code))
-        for i in check_ran:
-            print(i + 1, end=" ")
-            code = self.code[i]
-            check_ran2 = range(0, len(code))
-            for j in check_ran2:
-                print(code[j], end=" ")
-            print("")
+                if stop is not None and stop.op != "":
+                    self.code += labels + [stop]
+                else:
+                    self.code += ([stop] if stop is not None else []) + labels[::-1]
+                self.code += body
+                labels = []
+                body = []
+                stop = quad
+            else:
+                body.append(quad)
+
+        self.temps.share_slots(self.code)
+
+    def code_lines(self):
+        for i in range(0, len(self.code)):
+            fields = self.code[i].fields()
+            yield f"{i + 1} " + "".join(f"{field} " for field in fields)
+
+    def code_fields(self):
+        # the instructions as parse_tac_line reads them from the TAC text,
+        # except that string literals are kept whole and the operands are
+        # passed as they are
+        for code in self.code:
+            fields = []
+            for i, field in enumerate(code.fields()):
+                if isinstance(field, Operand) or (i == 1 and code.op == ".string"):
+                    fields.append(field)
+                else:
+                    fields += str(field).split()
+            yield code.opcode, fields
+
+    def print_code(self):
+        self.finalize_code()
+        for line in self.code_lines():
+            print(line)